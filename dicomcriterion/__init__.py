@@ -6,6 +6,7 @@ for DICOM attribute validation using the boolean.py library and pydicom.
 
 __version__ = "0.1.0"
 
+from .batch import CriterionSet
 from .criterion import Criterion
 from .exceptions import (
     CriterionError,
@@ -14,6 +15,7 @@ from .exceptions import (
     FunctionNotFoundError,
     SymbolParseError,
 )
+from .frozen import FrozenDataset, freeze
 from .functions import (
     DicomFunction,
     EqualsFunction,
@@ -28,14 +30,17 @@ __all__ = [
     "Criterion",
     "ContainsFunction",
     "CriterionError",
+    "CriterionSet",
     "DicomFunction",
     "DicomSymbol",
     "EqualsFunction",
     "ExistsFunction",
     "EvaluationError",
     "ExpressionParseError",
+    "FrozenDataset",
     "FunctionNotFoundError",
     "FunctionRegistry",
     "SymbolParseError",
     "default_registry",
+    "freeze",
 ]
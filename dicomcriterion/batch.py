@@ -0,0 +1,106 @@
+"""Evaluation of many criteria against the same DICOM datasets."""
+
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Union
+
+import pydicom
+
+from .criterion import Criterion, _compile_fused
+from .exceptions import EvaluationError
+from .functions import FunctionRegistry
+
+
+class CriterionSet:
+    """Named criteria evaluated together, sharing common DICOM symbols.
+
+    The criteria are compiled together into a single function, on first
+    evaluation. Each distinct DICOM symbol of the criteria, such as
+    PatientName.exists(), is evaluated at most once per dataset, however many
+    of the criteria reference it; the other criteria reuse its result.
+    Attribute values are likewise read and case-folded once per dataset.
+    Nothing is kept between datasets.
+
+    Parameters
+    ----------
+    criteria : Mapping[str, Union[str, Criterion]]
+        Criteria to evaluate, by name, as expressions or Criterion objects
+    registry : FunctionRegistry, optional
+        Function registry used to compile criteria given as expressions.
+        If None, uses the default registry.
+
+    Raises
+    ------
+    ExpressionParseError
+        If any of the expressions cannot be parsed
+
+    Examples
+    --------
+    >>> rules = CriterionSet({
+    ...     "has_patient_info": "PatientName.exists() and PatientID.exists()",
+    ...     "is_named_john": "PatientName.exists() and PatientName.contains('John')",
+    ... })
+    >>> results = [rules.evaluate_all(dataset) for dataset in datasets]
+    >>> results[0]  # {'has_patient_info': True, 'is_named_john': False}
+
+    See Also
+    --------
+    Criterion.evaluate_many : Evaluate one criterion against many datasets
+    """
+
+    def __init__(
+        self,
+        criteria: Mapping[str, Union[str, Criterion]],
+        registry: Optional[FunctionRegistry] = None,
+    ) -> None:
+        """Initialize a set of named criteria."""
+        self._criteria: Dict[str, Criterion] = {
+            name: (
+                criterion
+                if isinstance(criterion, Criterion)
+                else Criterion(criterion, registry=registry)
+            )
+            for name, criterion in criteria.items()
+        }
+        # All criteria compiled into one function, on first evaluation
+        self._evaluator: Optional[
+            Callable[[pydicom.Dataset, Dict[Any, Any]], Dict[str, bool]]
+        ] = None
+
+    def __len__(self) -> int:
+        """Return the number of criteria in the set."""
+        return len(self._criteria)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the criteria."""
+        return iter(self._criteria)
+
+    def __getitem__(self, name: str) -> Criterion:
+        """Return the criterion with the given name."""
+        return self._criteria[name]
+
+    def evaluate_all(self, dataset: pydicom.Dataset) -> Dict[str, bool]:
+        """Evaluate all criteria against a dataset.
+
+        Parameters
+        ----------
+        dataset : pydicom.Dataset
+            DICOM dataset to evaluate against
+
+        Returns
+        -------
+        Dict[str, bool]
+            Result of each criterion for the dataset, by name
+
+        Raises
+        ------
+        EvaluationError
+            If evaluation of any of the criteria fails
+        """
+        evaluator = self._evaluator
+        if evaluator is None:
+            evaluator = self._evaluator = _compile_fused(self._criteria)
+        try:
+            return evaluator(dataset, {})
+        except Exception as e:
+            raise EvaluationError(
+                details=f"Failed to evaluate criteria against dataset: {str(e)}"
+            ) from e
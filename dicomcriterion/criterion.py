@@ -1,14 +1,150 @@
 """Core Criterion class for DICOM boolean expression evaluation."""
 
+import ast
 import re
-from typing import Dict, Optional, Set
+import weakref
+from collections import Counter, OrderedDict
+from types import CodeType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import pydicom
-from boolean import BooleanAlgebra, Symbol
+from boolean import AND, NOT, OR, BooleanAlgebra, Expression, Symbol
+from pydicom.tag import Tag
 
-from .exceptions import ExpressionParseError, SymbolParseError
-from .functions import FunctionRegistry, default_registry
+from .exceptions import (
+    CriterionError,
+    EvaluationError,
+    ExpressionParseError,
+    FunctionNotFoundError,
+    SymbolParseError,
+)
+from .functions import (
+    ContainsFunction,
+    EqualsFunction,
+    ExistsFunction,
+    FunctionRegistry,
+    default_registry,
+)
 from .symbol import DicomSymbol
+from .table import MISSING
+
+# Pattern to match DICOM symbols: attribute.function(args)
+# This pattern captures the full symbol including parentheses and arguments
+_DICOM_SYMBOL_PATTERN = re.compile(
+    r"([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*\([^)]*\))"
+)
+
+# Expression consisting of a single DICOM symbol with a single-quoted argument
+# or no argument, e.g. "PatientName.equals('John')" or "PatientID.exists()"
+_SINGLE_SYMBOL_PATTERN = re.compile(
+    r"^([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\((?:'([^']*)')?\)$"
+)
+
+# Per-dataset evaluation cache, shared between DICOM symbols: case-folded
+# attribute values keyed by tag and results of repeated symbols keyed by string
+_Cache = Dict[Any, Any]
+
+# Compiled DICOM symbol: called with the dataset and its evaluation cache
+_Leaf = Callable[[pydicom.Dataset, _Cache], bool]
+
+# Parsed sub-expressions shared between all criteria, keyed by their string
+# form, so that repeated sub-expressions are stored once while in use
+_AST_POOL: "weakref.WeakValueDictionary[str, Expression]" = (
+    weakref.WeakValueDictionary()
+)
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class _LRUCache(Generic[_K, _V]):
+    """Mapping of at most maxsize entries, evicting the least recently used.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries
+    """
+
+    __slots__ = ("_entries", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize an empty cache."""
+        self._entries: "OrderedDict[_K, _V]" = OrderedDict()
+        self._maxsize = maxsize
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return len(self._entries)
+
+    def get(self, key: _K) -> Optional[_V]:
+        """Return the value for key, or None, marking the entry as used."""
+        try:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+        except KeyError:
+            # Missing, or evicted by another thread in between
+            return None
+        return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Store the value for key, evicting the least recently used entry."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+# Bytecode of compiled criteria, keyed by the dump of their syntax tree, see
+# _compile_expression. Criteria of the same shape share bytecode, so this
+# holds one entry per shape in use rather than one per criterion
+_CODE_CACHE: _LRUCache[str, CodeType] = _LRUCache(1024)
+
+# Details of ExpressionParseError for expressions with valid DICOM symbols that
+# boolean.py failed to parse, so that repeated invalid input is rejected
+# without parsing it again
+_INVALID_EXPRESSIONS: _LRUCache[str, str] = _LRUCache(1024)
+
+# Parsed and folded expressions of criteria, keyed by the expression string,
+# so that criteria created again for the same expression do not run the
+# boolean.py parser. Entries keep their trees in _AST_POOL alive, so the cache
+# is kept small enough that the pool still releases unused expressions
+_PARSED_EXPRESSIONS: _LRUCache[str, Expression] = _LRUCache(256)
+
+_NO_SYMBOLS_DETAILS = (
+    "No valid DICOM symbols found. Expected format: 'attribute.function(args)'"
+)
+
+# Version of the pickled state of Criterion. Increment when parsing or the
+# state changes, so that criteria pickled before are parsed again on loading
+_PICKLE_VERSION = 2
+
+# Relative evaluation cost of the built-in functions, used to order the
+# operands of AND and OR so that cheap checks run (and short-circuit) first
+_FUNCTION_COSTS = {"exists": 0, "equals": 1, "contains": 2}
+
+# Cost assumed for functions not listed in _FUNCTION_COSTS
+_DEFAULT_FUNCTION_COST = 3
+
+# Estimated probability that a DICOM symbol of a function is true, used to
+# order operands of equal cost: most likely false first in AND chains, most
+# likely true first in OR chains. Criterion.optimize() can refine these.
+_FUNCTION_PROBABILITIES = {"exists": 0.9}
+
+# Probability assumed for functions not listed in _FUNCTION_PROBABILITIES
+_DEFAULT_PROBABILITY = 0.5
 
 
 class Criterion:
@@ -76,6 +212,18 @@ class Criterion:
     DicomFunction : Base class for creating custom validation functions
     """
 
+    __slots__ = (
+        "_expression",
+        "_registry",
+        "_algebra",
+        "_dicom_symbols",
+        "_symbol_mapping",
+        "_parsed_expression",
+        "_probabilities",
+        "_evaluator",
+        "__weakref__",
+    )
+
     def __init__(
         self, expression: str, registry: Optional[FunctionRegistry] = None
     ) -> None:
@@ -96,11 +244,21 @@ class Criterion:
             If DICOM symbols in the expression are invalid
         """
         self._expression = expression.strip()
+        if not self._expression:
+            raise ExpressionParseError(self._expression, _NO_SYMBOLS_DETAILS)
+
         self._registry = registry or default_registry
         self._algebra = BooleanAlgebra()
 
+        # Expressions consisting of a single DICOM symbol are common and do not
+        # need the boolean expression parser
+        single_symbol = _SINGLE_SYMBOL_PATTERN.match(self._expression)
+
         # Extract and validate DICOM symbols from the expression
-        self._dicom_symbols = self._extract_dicom_symbols(self._expression)
+        if single_symbol:
+            self._dicom_symbols = {DicomSymbol(*single_symbol.groups())}
+        else:
+            self._dicom_symbols = self._extract_dicom_symbols(self._expression)
 
         # Create mapping from DICOM symbols to boolean.py symbols
         self._symbol_mapping: Dict[str, DicomSymbol] = {}
@@ -114,20 +272,54 @@ class Criterion:
             self._symbol_mapping[symbol_key] = dicom_symbol
             boolean_symbols[symbol_key] = boolean_symbol
 
-        # Replace DICOM symbols in expression with boolean.py symbol names
-        boolean_expression = self._convert_to_boolean_expression(
-            self._expression, self._dicom_symbols, boolean_symbols
-        )
+        if single_symbol:
+            (boolean_symbol,) = boolean_symbols.values()
+            self._parsed_expression = _intern_expression(boolean_symbol)
+        else:
+            self._parsed_expression = self._parse_boolean_expression(boolean_symbols)
+
+        # Estimated probabilities of DICOM symbols being true, see optimize()
+        self._probabilities: Dict[DicomSymbol, float] = {}
 
-        # Parse the boolean expression using boolean.py
+        # The parsed expression is compiled once, on first evaluation, so that
+        # evaluation does not need to substitute and simplify the boolean.py
+        # expression for every dataset, and criteria that are only validated
+        # or never evaluated do not pay for compilation
+        self._evaluator: Optional[_Leaf] = None
+
+    @classmethod
+    def try_parse(
+        cls, expression: str, registry: Optional[FunctionRegistry] = None
+    ) -> Tuple[Optional["Criterion"], Optional[CriterionError]]:
+        """Create a criterion, returning parse errors instead of raising them.
+
+        Useful when validating many user-supplied expressions, where invalid
+        ones are expected and are not exceptional.
+
+        Parameters
+        ----------
+        expression : str
+            Boolean expression string containing DICOM attribute functions
+        registry : FunctionRegistry, optional
+            Function registry to use for validation. If None, uses default registry.
+
+        Returns
+        -------
+        Tuple[Optional[Criterion], Optional[CriterionError]]
+            The criterion and None if the expression is valid, otherwise None
+            and the ExpressionParseError, SymbolParseError or
+            FunctionNotFoundError that Criterion(expression) would raise
+
+        Examples
+        --------
+        >>> criterion, error = Criterion.try_parse("PatientName.exists() and")
+        >>> criterion is None  # True
+        >>> str(error)  # "Failed to parse expression: 'PatientName.exists() and' ..."
+        """
         try:
-            self._parsed_expression = self._algebra.parse(
-                boolean_expression, simplify=False
-            )
-        except Exception as e:
-            raise ExpressionParseError(
-                self._expression, f"Failed to parse boolean expression: {str(e)}"
-            ) from e
+            return cls(expression, registry), None
+        except (ExpressionParseError, SymbolParseError, FunctionNotFoundError) as e:
+            return None, e
 
     def evaluate(self, dataset: pydicom.Dataset) -> bool:
         """Evaluate the boolean expression against a DICOM dataset.
@@ -167,53 +359,103 @@ class Criterion:
         >>> criterion = Criterion("StudyDescription.contains('CT')")
         >>> result = criterion.evaluate(dataset)  # Returns False
         """
+        evaluator = self._evaluator
+        if evaluator is None:
+            evaluator = self._evaluator = self._compile_to_callable()
         try:
-            # Get all symbols from the parsed expression
-            expression_symbols = self._parsed_expression.get_symbols()
-
-            # Create a mapping of Symbol objects to their evaluated values
-            symbol_values = {}
-
-            for symbol in expression_symbols:
-                symbol_key = str(symbol)
-
-                # Find the corresponding DICOM symbol
-                if symbol_key in self._symbol_mapping:
-                    dicom_symbol = self._symbol_mapping[symbol_key]
-
-                    # Evaluate the DICOM symbol against the dataset
-                    dicom_result = dicom_symbol.evaluate(dataset, self._registry)
-
-                    # Convert Python boolean to boolean.py TRUE/FALSE
-                    if dicom_result:
-                        symbol_values[symbol] = self._algebra.TRUE
-                    else:
-                        symbol_values[symbol] = self._algebra.FALSE
-                else:
-                    # This shouldn't happen if our implementation is correct
-                    raise ValueError(
-                        f"Symbol {symbol_key} not found "
-                        f"in "
-                        f"symbol mapping"  # noqa E713
-                    )
+            return evaluator(dataset, {})
+        except Exception as e:
+            raise EvaluationError(
+                expression=self._expression,
+                details=f"Failed to evaluate expression against dataset: {str(e)}",
+            ) from e
 
-            # Evaluate the boolean expression using the symbol values
-            result = self._parsed_expression.subs(symbol_values)
+    def evaluate_many(self, datasets: Iterable[pydicom.Dataset]) -> List[bool]:
+        """Evaluate the boolean expression against multiple DICOM datasets.
 
-            # Simplify the result to get TRUE or FALSE
-            simplified_result = result.simplify()
+        Equivalent to calling evaluate() for each dataset, but without the
+        per-call overhead. Use this when filtering collections of datasets.
 
-            # Check if the result is TRUE
-            return bool(simplified_result == self._algebra.TRUE)
+        Parameters
+        ----------
+        datasets : Iterable[pydicom.Dataset]
+            DICOM datasets to evaluate against
 
-        except Exception as e:
-            from .exceptions import EvaluationError
+        Returns
+        -------
+        List[bool]
+            Evaluation result for each dataset, in the order given
 
+        Raises
+        ------
+        EvaluationError
+            If evaluation fails for any of the datasets
+
+        Examples
+        --------
+        >>> criterion = Criterion("Modality.equals('MR')")
+        >>> mr_flags = criterion.evaluate_many([dataset1, dataset2])
+        """
+        evaluator = self._evaluator
+        if evaluator is None:
+            evaluator = self._evaluator = self._compile_to_callable()
+        try:
+            # map() calls the evaluator without per-item bytecode; iter(dict,
+            # None) supplies a new, empty evaluation cache for each dataset
+            return list(map(evaluator, datasets, iter(dict, None)))
+        except Exception as e:
             raise EvaluationError(
                 expression=self._expression,
                 details=f"Failed to evaluate expression against dataset: {str(e)}",
             ) from e
 
+    def optimize(self, probabilities: Mapping[str, float]) -> "Criterion":
+        """Reorder the expression using known probabilities of DICOM symbols.
+
+        Operands of AND and OR are evaluated cheapest first. Among operands of
+        equal cost, AND evaluates the operand most likely to be false first
+        and OR the operand most likely to be true, so that the expression
+        short-circuits as early as possible. By default every symbol is
+        assumed to be true half of the time, except exists(), which is assumed
+        to be usually true. This method replaces those estimates for the
+        given symbols and recompiles the criterion. Results do not change.
+
+        Parameters
+        ----------
+        probabilities : Mapping[str, float]
+            Probability between 0 and 1 of each DICOM symbol being true for
+            the datasets the criterion is evaluated against, keyed by symbol,
+            e.g. {"Modality.equals('MR')": 0.2}
+
+        Returns
+        -------
+        Criterion
+            This criterion, to allow chaining
+
+        Raises
+        ------
+        SymbolParseError
+            If a key is not a valid DICOM symbol
+        ValueError
+            If a probability is not between 0 and 1
+
+        Examples
+        --------
+        >>> criterion = Criterion(
+        ...     "Modality.equals('CT') or Modality.equals('MR')"
+        ... ).optimize({"Modality.equals('MR')": 0.8})
+        """
+        for symbol_str, probability in probabilities.items():
+            if not 0 <= probability <= 1:
+                raise ValueError(
+                    f"Probability for '{symbol_str}' must be between 0 and 1, "
+                    f"got {probability}"
+                )
+            self._probabilities[DicomSymbol.parse(symbol_str)] = probability
+
+        self._evaluator = None
+        return self
+
     def __str__(self) -> str:
         """Return string representation of the criterion."""
         return f"Criterion('{self._expression}')"
@@ -222,6 +464,151 @@ class Criterion:
         """Return detailed string representation of the criterion."""
         return f"Criterion(expression='{self._expression}')"
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the parsed state of the criterion for pickling.
+
+        Pickled criteria keep their parsed expression, so that criteria
+        persisted with pickle or shelve are not parsed again when loaded.
+        The compiled evaluators are not pickled; they are compiled again on
+        first evaluation.
+        """
+        return {
+            "version": _PICKLE_VERSION,
+            "expression": self._expression,
+            # The default registry is restored by identity, not copied
+            "registry": None if self._registry is default_registry else self._registry,
+            "algebra": self._algebra,
+            "dicom_symbols": self._dicom_symbols,
+            "symbol_mapping": self._symbol_mapping,
+            "parsed_expression": self._parsed_expression,
+            "probabilities": self._probabilities,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled criterion, parsing it again if the format changed."""
+        if state["version"] != _PICKLE_VERSION:
+            self.__init__(state["expression"], state["registry"])  # type: ignore
+            return
+
+        self._expression = state["expression"]
+        self._registry = state["registry"] or default_registry
+        self._algebra = state["algebra"]
+        self._dicom_symbols = state["dicom_symbols"]
+        self._symbol_mapping = state["symbol_mapping"]
+        self._parsed_expression = _intern_expression(state["parsed_expression"])
+        self._probabilities = state["probabilities"]
+        self._evaluator = None
+
+    def _parse_boolean_expression(
+        self, boolean_symbols: Dict[str, Symbol]
+    ) -> Expression:
+        """Parse the expression with boolean.py.
+
+        Parameters
+        ----------
+        boolean_symbols : Dict[str, Symbol]
+            Mapping of symbol keys to boolean.py Symbol objects
+
+        Returns
+        -------
+        Expression
+            The parsed boolean.py expression
+
+        Raises
+        ------
+        ExpressionParseError
+            If the boolean expression cannot be parsed
+        """
+        details = _INVALID_EXPRESSIONS.get(self._expression)
+        if details is not None:
+            raise ExpressionParseError(self._expression, details)
+
+        parsed_expression = _PARSED_EXPRESSIONS.get(self._expression)
+        if parsed_expression is not None:
+            return parsed_expression
+
+        # Replace DICOM symbols in expression with boolean.py symbol names
+        boolean_expression = self._convert_to_boolean_expression(
+            self._expression, self._dicom_symbols, boolean_symbols
+        )
+
+        try:
+            parsed_expression = self._algebra.parse(boolean_expression, simplify=False)
+        except Exception as e:
+            details = f"Failed to parse boolean expression: {str(e)}"
+            _INVALID_EXPRESSIONS.put(self._expression, details)
+            raise ExpressionParseError(self._expression, details) from e
+
+        parsed_expression = _intern_expression(self._fold(parsed_expression))
+        _PARSED_EXPRESSIONS.put(self._expression, parsed_expression)
+        return parsed_expression
+
+    def _fold(self, node: Expression) -> Expression:
+        """Remove constants, double negations and duplicates from an expression.
+
+        Rewrites ``x and true`` to ``x``, ``x or true`` to ``true``,
+        ``not not x`` to ``x`` and ``x and x`` to ``x``, recursively, so that
+        the compiled expression does not evaluate operands that cannot affect
+        the result.
+
+        Parameters
+        ----------
+        node : Expression
+            Node of the parsed boolean.py expression
+
+        Returns
+        -------
+        Expression
+            Equivalent, simplified node
+        """
+        algebra = self._algebra
+        if isinstance(node, algebra.NOT):
+            operand = self._fold(node.args[0])
+            if isinstance(operand, algebra.NOT):
+                return operand.args[0]
+            if operand == algebra.TRUE:
+                return algebra.FALSE
+            if operand == algebra.FALSE:
+                return algebra.TRUE
+            return algebra.NOT(operand)
+        if isinstance(node, algebra.AND):
+            return self._fold_chain(node, algebra.TRUE, algebra.FALSE)
+        if isinstance(node, algebra.OR):
+            return self._fold_chain(node, algebra.FALSE, algebra.TRUE)
+        return node
+
+    def _fold_chain(
+        self, node: Expression, identity: Expression, annihilator: Expression
+    ) -> Expression:
+        """Fold the operands of an AND or OR node, see _fold.
+
+        Parameters
+        ----------
+        node : Expression
+            AND or OR node of the parsed boolean.py expression
+        identity : Expression
+            Constant that does not affect the result of the operator
+        annihilator : Expression
+            Constant that determines the result of the operator
+
+        Returns
+        -------
+        Expression
+            Equivalent, simplified node
+        """
+        args: List[Expression] = []
+        for arg in node.args:
+            arg = self._fold(arg)
+            if arg == annihilator:
+                return annihilator
+            if arg != identity and arg not in args:
+                args.append(arg)
+        if not args:
+            return identity
+        if len(args) == 1:
+            return args[0]
+        return type(node)(*args)
+
     def _extract_dicom_symbols(self, expression: str) -> Set[DicomSymbol]:
         """Extract DICOM symbols from a boolean expression string.
 
@@ -240,11 +627,7 @@ class Criterion:
         SymbolParseError
             If any DICOM symbol has invalid format
         """
-        # Pattern to match DICOM symbols: attribute.function(args)
-        # This pattern captures the full symbol including parentheses and arguments
-        pattern = r"([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*\([^)]*\))"
-
-        matches = re.findall(pattern, expression)
+        matches = _DICOM_SYMBOL_PATTERN.findall(expression)
         dicom_symbols = set()
 
         for match in matches:
@@ -258,11 +641,7 @@ class Criterion:
                 ) from e
 
         if not dicom_symbols:
-            raise ExpressionParseError(
-                expression,
-                "No valid DICOM symbols found. "
-                "Expected format: 'attribute.function(args)'",
-            )
+            raise ExpressionParseError(expression, _NO_SYMBOLS_DETAILS)
 
         return dicom_symbols
 
@@ -292,8 +671,6 @@ class Criterion:
 
         # We need to find the original symbol strings in the expression
         # Use regex to find all DICOM symbols and replace them
-        pattern = r"([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*\([^)]*\))"
-
         def replace_symbol(match):
             original_symbol_str = match.group(1)
 
@@ -313,5 +690,631 @@ class Criterion:
                 # If parsing fails, return original
                 return original_symbol_str
 
-        boolean_expression = re.sub(pattern, replace_symbol, boolean_expression)
+        boolean_expression = _DICOM_SYMBOL_PATTERN.sub(
+            replace_symbol, boolean_expression
+        )
         return boolean_expression
+
+    def _compile_to_callable(self) -> _Leaf:
+        """Compile the parsed boolean expression into a single callable.
+
+        The expression is translated to the Python syntax tree of a function
+        ``lambda ds, cache: _F[0](ds, cache) and not _F[1](ds, cache)``, where
+        each ``_F[i]`` evaluates one DICOM symbol, and compiled once.
+        Evaluation then runs as plain bytecode with Python's own
+        short-circuiting AND and OR. Symbol arguments never appear in the
+        generated code, so criteria of the same shape share their bytecode.
+        DICOM symbols occurring more than once in the expression are memoized
+        in the evaluation cache, so they are evaluated once per dataset.
+
+        Returns
+        -------
+        _Leaf
+            Function evaluating the full expression for a dataset, given an
+            (initially empty) evaluation cache for that dataset
+        """
+        leaves: List[Tuple[str, _Leaf]] = []
+        function = ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg="ds"), ast.arg(arg="cache")],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=self._codegen(self._parsed_expression, leaves),
+        )
+        code = _compile_expression(ast.Expression(body=function))
+        # Symbol names only identify functions within a registry
+        prefix = f"{id(self._registry)}:"
+        functions = _memoize_repeated([(prefix + key, leaf) for key, leaf in leaves])
+        namespace = {"__builtins__": {}, "_F": functions}
+        return eval(code, namespace)
+
+    def _codegen(self, node: Expression, leaves: List[Tuple[str, _Leaf]]) -> ast.expr:
+        """Recursively generate a Python syntax tree for a boolean.py node.
+
+        Parameters
+        ----------
+        node : Expression
+            Node of the parsed boolean.py expression
+        leaves : List[Tuple[str, _Leaf]]
+            Keys and compiled DICOM symbols referenced by the generated code
+            as ``_F[index]``; symbols of this node are appended to it
+
+        Returns
+        -------
+        ast.expr
+            Python expression evaluating this node for the dataset ``ds``
+        """
+        algebra = self._algebra
+        if isinstance(node, algebra.Symbol):
+            dicom_symbol = self._symbol_mapping[str(node)]
+            leaves.append((str(node), self._compile_symbol(dicom_symbol)))
+            return _leaf_call(len(leaves) - 1)
+        if isinstance(node, algebra.NOT):
+            return ast.UnaryOp(
+                op=ast.Not(), operand=self._codegen(node.args[0], leaves)
+            )
+        if isinstance(node, algebra.AND):
+            operands = [self._codegen(arg, leaves) for arg in self._ordered_args(node)]
+            return ast.BoolOp(op=ast.And(), values=operands)
+        if isinstance(node, algebra.OR):
+            operands = self._codegen_or_operands(node, leaves)
+            if len(operands) == 1:
+                return operands[0]
+            return ast.BoolOp(op=ast.Or(), values=operands)
+        if node == algebra.TRUE:
+            return ast.Constant(value=True)
+        if node == algebra.FALSE:
+            return ast.Constant(value=False)
+
+        raise ExpressionParseError(
+            self._expression, f"Unsupported boolean expression element: {node!r}"
+        )
+
+    def _codegen_or_operands(
+        self, node: Expression, leaves: List[Tuple[str, _Leaf]]
+    ) -> List[ast.expr]:
+        """Generate Python syntax trees for the operands of an OR node.
+
+        contains() checks on the same attribute are merged into a single
+        leaf, so the attribute value is looked up once and scanned for each
+        substring in turn, in place of the first of those checks.
+
+        Parameters
+        ----------
+        node : Expression
+            OR node of the parsed boolean.py expression
+        leaves : List[Tuple[str, _Leaf]]
+            Keys and compiled DICOM symbols referenced by the generated code
+
+        Returns
+        -------
+        List[ast.expr]
+            Python expressions for the operands, in evaluation order
+        """
+        args = self._ordered_args(node)
+        contains_symbols: Dict[int, List[DicomSymbol]] = {}
+        for arg in args:
+            tag = self._contains_tag(arg)
+            if tag is not None:
+                contains_symbols.setdefault(tag, []).append(
+                    self._symbol_mapping[str(arg)]
+                )
+
+        operands = []
+        merged: Set[int] = set()
+        for arg in args:
+            tag = self._contains_tag(arg)
+            if tag is None or len(contains_symbols[tag]) < 2:
+                operands.append(self._codegen(arg, leaves))
+            elif tag not in merged:
+                merged.add(tag)
+                symbols = contains_symbols[tag]
+                key = " or ".join(str(dicom_symbol) for dicom_symbol in symbols)
+                leaves.append((key, self._compile_contains(tag, symbols)))
+                operands.append(_leaf_call(len(leaves) - 1))
+        return operands
+
+    def _contains_tag(self, node: Expression) -> Optional[Tag]:
+        """Return the tag checked by a node if it is an inlined contains().
+
+        Parameters
+        ----------
+        node : Expression
+            Node of the parsed boolean.py expression
+
+        Returns
+        -------
+        Tag or None
+            Tag of the attribute if the node is a built-in contains() with an
+            argument on a DICOM keyword, None otherwise
+        """
+        if not isinstance(node, self._algebra.Symbol):
+            return None
+        dicom_symbol = self._symbol_mapping[str(node)]
+        function = self._registry.get_function(dicom_symbol.function)
+        if dicom_symbol.argument is None or type(function) is not ContainsFunction:
+            return None
+        return dicom_symbol._tag
+
+    def _ordered_args(self, node: Expression) -> List[Expression]:
+        """Return the operands of an AND or OR node, cheapest first.
+
+        Functions are side-effect free, so reordering operands does not change
+        the result, only how many DICOM symbols are evaluated before the
+        expression short-circuits. Operands of equal cost are ordered by
+        their probability of being true: least likely first for AND, most
+        likely first for OR. The sort is stable, so operands that are equal
+        in both keep their original order.
+
+        Nested nodes of the same operator, as in ``a and (b and c)``, are
+        flattened into a single chain first, so that all of their operands
+        are ordered together.
+
+        Parameters
+        ----------
+        node : Expression
+            AND or OR node of the parsed boolean.py expression
+
+        Returns
+        -------
+        List[Expression]
+            The node's operands sorted by estimated evaluation cost
+        """
+        sign = 1 if isinstance(node, self._algebra.AND) else -1
+        return sorted(
+            self._flattened_args(node),
+            key=lambda arg: (self._cost(arg), sign * self._probability(arg)),
+        )
+
+    def _flattened_args(self, node: Expression) -> List[Expression]:
+        """Return the operands of a node, with nested nodes of its type expanded.
+
+        Parameters
+        ----------
+        node : Expression
+            AND or OR node of the parsed boolean.py expression
+
+        Returns
+        -------
+        List[Expression]
+            Operands of the node and of nested nodes of the same operator
+        """
+        args = []
+        for arg in node.args:
+            if type(arg) is type(node):
+                args.extend(self._flattened_args(arg))
+            else:
+                args.append(arg)
+        return args
+
+    def _cost(self, node: Expression) -> int:
+        """Estimate the cost of evaluating a boolean.py expression node.
+
+        Parameters
+        ----------
+        node : Expression
+            Node of the parsed boolean.py expression
+
+        Returns
+        -------
+        int
+            Estimated cost; the sum of the costs of the node's DICOM symbols
+        """
+        if isinstance(node, self._algebra.Symbol):
+            function_name = self._symbol_mapping[str(node)].function
+            return _FUNCTION_COSTS.get(function_name, _DEFAULT_FUNCTION_COST)
+        return sum(self._cost(arg) for arg in node.args)
+
+    def _probability(self, node: Expression) -> float:
+        """Estimate the probability of a boolean.py expression node being true.
+
+        Symbols are assumed to be independent.
+
+        Parameters
+        ----------
+        node : Expression
+            Node of the parsed boolean.py expression
+
+        Returns
+        -------
+        float
+            Estimated probability between 0 and 1
+        """
+        algebra = self._algebra
+        if isinstance(node, algebra.Symbol):
+            dicom_symbol = self._symbol_mapping[str(node)]
+            if dicom_symbol in self._probabilities:
+                return self._probabilities[dicom_symbol]
+            return _FUNCTION_PROBABILITIES.get(
+                dicom_symbol.function, _DEFAULT_PROBABILITY
+            )
+        if isinstance(node, algebra.NOT):
+            return 1 - self._probability(node.args[0])
+        if isinstance(node, (algebra.AND, algebra.OR)):
+            # P(all true) for AND; 1 - P(all false) for OR
+            is_and = isinstance(node, algebra.AND)
+            product = 1.0
+            for arg in node.args:
+                probability = self._probability(arg)
+                product *= probability if is_and else 1 - probability
+            return product if is_and else 1 - product
+        return 1.0 if node == algebra.TRUE else 0.0
+
+    def _compile_symbol(self, dicom_symbol: DicomSymbol) -> _Leaf:
+        """Compile a single DICOM symbol into a callable.
+
+        equals(), contains() and exists() on DICOM keywords are evaluated
+        inline, looking elements of pydicom Datasets up by the tag of the
+        symbol, see _compile_equals, _compile_contains and _compile_exists.
+        Other functions, including subclasses of the built-in ones, and
+        non-standard keywords are evaluated through DicomSymbol.evaluate.
+
+        Parameters
+        ----------
+        dicom_symbol : DicomSymbol
+            The DICOM symbol to compile
+
+        Returns
+        -------
+        _Leaf
+            Function evaluating the symbol for a dataset
+        """
+        registry = self._registry
+        tag = dicom_symbol._tag
+        function_type = type(registry.get_function(dicom_symbol.function))
+        argument = dicom_symbol.argument
+
+        if tag is not None:
+            if function_type is ContainsFunction and argument is not None:
+                return self._compile_contains(tag, [dicom_symbol])
+            if function_type is EqualsFunction and argument is not None:
+                return self._compile_equals(tag, dicom_symbol)
+            if function_type is ExistsFunction:
+                return self._compile_exists(tag, dicom_symbol)
+
+        return lambda dataset, cache: bool(dicom_symbol.evaluate(dataset, registry))
+
+    def _compile_equals(self, tag: Tag, dicom_symbol: DicomSymbol) -> _Leaf:
+        """Compile a built-in equals() check into a callable.
+
+        Behaves like EqualsFunction.evaluate, but the argument is normalised
+        once, here, instead of on every evaluation.
+
+        Parameters
+        ----------
+        tag : Tag
+            Tag of the attribute checked by the symbol
+        dicom_symbol : DicomSymbol
+            equals() symbol on the attribute, with an argument
+
+        Returns
+        -------
+        _Leaf
+            Function returning True if the attribute equals the argument
+        """
+        registry = self._registry
+        expected = EqualsFunction.normalize(dicom_symbol.argument)
+        matches_none = EqualsFunction.matches_none(dicom_symbol.argument)
+
+        def evaluate_equals(dataset: pydicom.Dataset, cache: _Cache) -> bool:
+            if not isinstance(dataset, pydicom.Dataset):
+                return bool(dicom_symbol.evaluate(dataset, registry))
+            if tag not in dataset:
+                return False
+            value = dataset[tag].value
+            if value is None:
+                return matches_none
+            return EqualsFunction.normalize(value) == expected
+
+        return evaluate_equals
+
+    def _compile_exists(self, tag: Tag, dicom_symbol: DicomSymbol) -> _Leaf:
+        """Compile a built-in exists() check into a callable.
+
+        Behaves like ExistsFunction.evaluate, checking pydicom Datasets for the
+        tag directly.
+
+        Parameters
+        ----------
+        tag : Tag
+            Tag of the attribute checked by the symbol
+        dicom_symbol : DicomSymbol
+            exists() symbol on the attribute
+
+        Returns
+        -------
+        _Leaf
+            Function returning True if the attribute exists
+        """
+        registry = self._registry
+
+        def evaluate_exists(dataset: pydicom.Dataset, cache: _Cache) -> bool:
+            if isinstance(dataset, pydicom.Dataset):
+                return tag in dataset
+            return bool(dicom_symbol.evaluate(dataset, registry))
+
+        return evaluate_exists
+
+    def _compile_contains(self, tag: Tag, dicom_symbols: List[DicomSymbol]) -> _Leaf:
+        """Compile built-in contains() checks on one attribute into a callable.
+
+        The substrings are lower-cased once, here, and the lower-cased
+        attribute value is shared through the evaluation cache with every
+        other contains() on the same attribute. Substrings that contain one
+        of the other substrings are redundant and are not scanned for.
+
+        Parameters
+        ----------
+        tag : Tag
+            Tag of the attribute checked by all of the symbols
+        dicom_symbols : List[DicomSymbol]
+            contains() symbols on the attribute, each with an argument
+
+        Returns
+        -------
+        _Leaf
+            Function returning True if the attribute contains any of the
+            substrings
+        """
+        registry = self._registry
+        keyword = dicom_symbols[0].attribute
+        substrings = _minimal_substrings(
+            ContainsFunction.normalize(dicom_symbol.argument)
+            for dicom_symbol in dicom_symbols
+        )
+
+        def evaluate_contains(dataset: pydicom.Dataset, cache: _Cache) -> bool:
+            try:
+                text = cache[tag]
+            except KeyError:
+                text = _casefolded_value(dataset, tag, keyword)
+                if text is MISSING:
+                    return any(
+                        dicom_symbol.evaluate(dataset, registry)
+                        for dicom_symbol in dicom_symbols
+                    )
+                cache[tag] = text
+            if text is None:
+                return False
+            for substring in substrings:
+                if substring in text:
+                    return True
+            return False
+
+        return evaluate_contains
+
+
+def _compile_fused(
+    criteria: Mapping[str, Criterion],
+) -> Callable[[pydicom.Dataset, _Cache], Dict[str, bool]]:
+    """Compile named criteria into a single callable evaluating all of them.
+
+    The criteria are translated to the Python syntax tree of one function
+    ``lambda ds, cache: {'name': _F[0](ds, cache) and ..., ...}``. DICOM
+    symbols that occur more than once across the criteria are memoized in
+    the evaluation cache, so they are evaluated at most once per dataset,
+    while AND and OR keep short-circuiting within each criterion.
+
+    Parameters
+    ----------
+    criteria : Mapping[str, Criterion]
+        Criteria to compile, by name
+
+    Returns
+    -------
+    Callable[[pydicom.Dataset, _Cache], Dict[str, bool]]
+        Function returning the result of each criterion for a dataset, by
+        name, given an (initially empty) evaluation cache for that dataset
+    """
+    leaves: List[Tuple[str, _Leaf]] = []
+    names: List[ast.expr] = []
+    bodies: List[ast.expr] = []
+    for name, criterion in criteria.items():
+        first_leaf = len(leaves)
+        names.append(ast.Constant(value=name))
+        bodies.append(criterion._codegen(criterion._parsed_expression, leaves))
+        # Symbol names only identify functions within a registry
+        prefix = f"{id(criterion._registry)}:"
+        for i in range(first_leaf, len(leaves)):
+            key, leaf = leaves[i]
+            leaves[i] = (prefix + key, leaf)
+
+    functions = _memoize_repeated(leaves)
+
+    function = ast.Lambda(
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg="ds"), ast.arg(arg="cache")],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        ),
+        body=ast.Dict(keys=names, values=bodies),
+    )
+    code = _compile_expression(ast.Expression(body=function))
+    namespace = {"__builtins__": {}, "_F": functions}
+    return eval(code, namespace)
+
+
+def _compile_expression(tree: ast.Expression) -> CodeType:
+    """Compile the syntax tree of a criterion, reusing earlier compilations.
+
+    The bytecode only depends on the shape of the expression, not on the
+    DICOM symbols, so it is cached by the dump of the syntax tree.
+
+    Parameters
+    ----------
+    tree : ast.Expression
+        Syntax tree generated by Criterion._compile_to_callable
+
+    Returns
+    -------
+    CodeType
+        The compiled expression
+    """
+    key = ast.dump(tree)
+    code = _CODE_CACHE.get(key)
+    if code is None:
+        code = compile(ast.fix_missing_locations(tree), "<criterion>", "eval")
+        _CODE_CACHE.put(key, code)
+    return code
+
+
+def _leaf_call(index: int) -> ast.Call:
+    """Return the Python syntax tree of the call ``_F[index](ds, cache)``."""
+    return ast.Call(
+        func=ast.Subscript(
+            value=ast.Name(id="_F", ctx=ast.Load()),
+            slice=ast.Constant(value=index),
+            ctx=ast.Load(),
+        ),
+        args=[ast.Name(id="ds", ctx=ast.Load()), ast.Name(id="cache", ctx=ast.Load())],
+        keywords=[],
+    )
+
+
+def _memoize(key: str, leaf: _Leaf) -> _Leaf:
+    """Wrap a compiled DICOM symbol to memoize its result in the cache.
+
+    Parameters
+    ----------
+    key : str
+        Cache key identifying the symbol
+    leaf : _Leaf
+        The compiled DICOM symbol
+
+    Returns
+    -------
+    _Leaf
+        Function returning the cached result, evaluating the symbol only if
+        there is none
+    """
+
+    def memoized(dataset: pydicom.Dataset, cache: _Cache) -> bool:
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = leaf(dataset, cache)
+            return result
+
+    return memoized
+
+
+def _memoize_repeated(leaves: List[Tuple[str, _Leaf]]) -> List[_Leaf]:
+    """Memoize the compiled DICOM symbols that occur more than once.
+
+    Parameters
+    ----------
+    leaves : List[Tuple[str, _Leaf]]
+        Keys and compiled DICOM symbols, in the order referenced by the
+        generated code
+
+    Returns
+    -------
+    List[_Leaf]
+        The compiled DICOM symbols, where symbols with a key occurring more
+        than once share a function memoizing their result in the evaluation
+        cache, so they are evaluated at most once per dataset
+    """
+    counts = Counter(key for key, _ in leaves)
+    shared: Dict[str, _Leaf] = {}
+    functions = []
+    for key, leaf in leaves:
+        if counts[key] > 1:
+            if key not in shared:
+                shared[key] = _memoize(key, leaf)
+            leaf = shared[key]
+        functions.append(leaf)
+    return functions
+
+
+def _minimal_substrings(substrings: Iterable[str]) -> Tuple[str, ...]:
+    """Reduce substrings to those a text must contain one of to contain any.
+
+    A text containing a substring also contains every substring of it, so
+    for "contains any" checks, substrings containing another one can be
+    dropped. Duplicates are dropped as well.
+
+    Parameters
+    ----------
+    substrings : Iterable[str]
+        Substrings to reduce
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The remaining substrings, shortest first
+    """
+    minimal: List[str] = []
+    for substring in sorted(dict.fromkeys(substrings), key=len):
+        if not any(other in substring for other in minimal):
+            minimal.append(substring)
+    return tuple(minimal)
+
+
+def _intern_expression(node: Expression) -> Expression:
+    """Return the pooled instance of a parsed boolean.py expression.
+
+    Sub-expressions are interned bottom-up, so identical symbols and
+    sub-expressions of different criteria are the same objects.
+
+    Parameters
+    ----------
+    node : Expression
+        Node of a parsed boolean.py expression
+
+    Returns
+    -------
+    Expression
+        Equal node from _AST_POOL, or the node itself if it cannot be pooled
+    """
+    if isinstance(node, (AND, OR, NOT)):
+        args = tuple(_intern_expression(arg) for arg in node.args)
+        if any(_AST_POOL.get(str(arg)) is not arg for arg in args):
+            return node
+        if any(arg is not original for arg, original in zip(args, node.args)):
+            node = type(node)(*args)
+    elif not isinstance(node, Symbol):
+        # TRUE and FALSE belong to the algebra that parsed them
+        return node
+
+    return _AST_POOL.setdefault(str(node), node)
+
+
+def _casefolded_value(dataset: pydicom.Dataset, tag: Tag, keyword: str) -> Any:
+    """Return the lower-cased string value of a data element.
+
+    pydicom Datasets are read by tag. Other objects, such as FrozenDataset
+    snapshots, are read by keyword the way ContainsFunction reads them.
+
+    Parameters
+    ----------
+    dataset : pydicom.Dataset
+        The DICOM dataset to read from
+    tag : Tag
+        Tag of the data element
+    keyword : str
+        Keyword of the data element
+
+    Returns
+    -------
+    str, None or MISSING
+        The element value as a lower-case string, None if the element is
+        missing from a Dataset or has no value, or MISSING if an object
+        other than a Dataset does not have the attribute
+    """
+    if isinstance(dataset, pydicom.Dataset):
+        if tag not in dataset:
+            return None
+        value = dataset[tag].value
+    else:
+        value = getattr(dataset, keyword, MISSING)
+        if value is MISSING:
+            return MISSING
+        value = getattr(value, "value", value)
+    if value is None:
+        return None
+    return ContainsFunction.normalize(value)
@@ -0,0 +1,124 @@
+"""Read-only snapshots of frequently used DICOM attributes."""
+
+from typing import Any
+
+import pydicom
+
+from .functions import keyword_tag
+
+
+class FrozenDataset:
+    """Immutable snapshot of the commonly used attributes of a DICOM dataset.
+
+    Attribute values are resolved from the source dataset once, when the
+    snapshot is created with freeze(), and stored in slots. Reading them back
+    is plain attribute access, without the keyword and tag lookups that
+    pydicom.Dataset performs on every access. This makes a FrozenDataset
+    cheaper to evaluate many criteria against than the dataset itself.
+
+    Only the keywords listed in KEYWORDS are captured. Reading any other DICOM
+    keyword raises LookupError, as the snapshot cannot tell whether the source
+    dataset had it, so criteria on such keywords fail instead of evaluating
+    as if the attribute were missing.
+
+    Examples
+    --------
+    >>> frozen = freeze(dataset)
+    >>> criterion = Criterion("PatientName.equals('John Doe')")
+    >>> result = criterion.evaluate(frozen)
+
+    See Also
+    --------
+    freeze : Create a FrozenDataset from a pydicom Dataset
+    """
+
+    KEYWORDS = (
+        "PatientName",
+        "PatientID",
+        "StudyDescription",
+        "StudyDate",
+        "PatientBirthDate",
+        "Modality",
+        "InstitutionName",
+        "SeriesDescription",
+    )
+
+    __slots__ = KEYWORDS
+
+    def __getattr__(self, name: str) -> Any:
+        """Reject DICOM keywords that are not captured by the snapshot.
+
+        Only called for names without a value, which are captured keywords
+        missing from the source dataset, and names not in KEYWORDS.
+
+        Raises
+        ------
+        LookupError
+            If name is a DICOM keyword not listed in KEYWORDS
+        AttributeError
+            For any other name
+        """
+        if name not in FrozenDataset.KEYWORDS and keyword_tag(name) is not None:
+            raise LookupError(
+                f"{name} is not captured by FrozenDataset, which only holds "
+                f"{', '.join(FrozenDataset.KEYWORDS)}"
+            )
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent modification of the snapshot."""
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        """Prevent modification of the snapshot."""
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __contains__(self, keyword: object) -> bool:
+        """Return True if the snapshot holds a value for the keyword.
+
+        Raises
+        ------
+        LookupError
+            If keyword is a DICOM keyword not listed in KEYWORDS
+        """
+        return isinstance(keyword, str) and hasattr(self, keyword)
+
+    def __repr__(self) -> str:
+        """Return detailed string representation of the snapshot."""
+        values = ", ".join(
+            f"{keyword}={getattr(self, keyword)!r}"
+            for keyword in self.KEYWORDS
+            if keyword in self
+        )
+        return f"FrozenDataset({values})"
+
+
+def freeze(dataset: pydicom.Dataset) -> FrozenDataset:
+    """Create an immutable snapshot of the commonly used attributes of a dataset.
+
+    Parameters
+    ----------
+    dataset : pydicom.Dataset
+        The DICOM dataset to take the snapshot of
+
+    Returns
+    -------
+    FrozenDataset
+        Snapshot holding the values of the FrozenDataset.KEYWORDS attributes
+        present in the dataset
+
+    Examples
+    --------
+    >>> from pydicom import Dataset
+    >>> dataset = Dataset()
+    >>> dataset.PatientName = "John Doe"
+    >>> frozen = freeze(dataset)
+    >>> frozen.PatientName  # 'John Doe'
+    """
+    frozen = object.__new__(FrozenDataset)
+    for keyword in FrozenDataset.KEYWORDS:
+        if keyword in dataset:
+            object.__setattr__(frozen, keyword, dataset[keyword].value)
+    return frozen
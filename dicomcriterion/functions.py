@@ -1,12 +1,19 @@
 """DICOM validation functions for boolean expression evaluation."""
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Type
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Type, Union
 
 import pydicom
+from pydicom.datadict import keyword_for_tag, tag_for_keyword
+from pydicom.tag import BaseTag, Tag
 
 from .exceptions import EvaluationError, FunctionNotFoundError
 
+# DICOM value representations that hold numbers rather than text
+NUMERIC_VRS = frozenset({"DS", "FD", "FL", "IS", "SL", "SS", "SV", "UL", "US", "UV"})
+
 
 class DicomFunction(ABC):
     """Abstract base class for DICOM validation functions.
@@ -16,6 +23,10 @@ class DicomFunction(ABC):
     validate DICOM attribute values.
     """
 
+    # Functions are stateless; subclasses that need instance attributes can
+    # leave out __slots__ to get a __dict__
+    __slots__ = ()
+
     @abstractmethod
     def evaluate(
         self, dataset: pydicom.Dataset, attribute: str, argument: Optional[str] = None
@@ -50,34 +61,76 @@ class FunctionRegistry:
     This class maintains a registry of available DICOM functions that
     can be used in boolean expressions. It provides methods to register
     new functions and retrieve them by name.
+
+    Each registered function is instantiated once, on registration, and the
+    instance is shared by all evaluations, so functions must not keep state
+    between calls to evaluate().
     """
 
+    __slots__ = ("_functions", "_instances", "_names", "_frozen")
+
     def __init__(self) -> None:
         """Initialize an empty function registry."""
         self._functions: Dict[str, Type[DicomFunction]] = {}
-
-    def register(self, name: str, func_class: Type[DicomFunction]) -> None:
+        # Shared instance of each registered function, see get_function
+        self._instances: Dict[str, DicomFunction] = {}
+        # Registered names, for is_registered, which is on hot paths such as
+        # DicomSymbol.to_boolean_symbol. Recomputed by register()
+        self._names: FrozenSet[str] = frozenset()
+        self._frozen = False
+
+    def register(
+        self, name: str, func_class: Union[Type[DicomFunction], DicomFunction]
+    ) -> None:
         """Register a DICOM function class.
 
         Parameters
         ----------
         name : str
             The name to register the function under
-        func_class : Type[DicomFunction]
-            The function class to register
+        func_class : Type[DicomFunction] or DicomFunction
+            The function class to register, which is instantiated once, or
+            the function instance to use
 
         Raises
         ------
         TypeError
             If func_class is not a subclass of DicomFunction
+        RuntimeError
+            If the registry is frozen, see freeze
         """
-        if not issubclass(func_class, DicomFunction):
+        if self.frozen:
+            raise RuntimeError(f"Cannot register {name!r} in a frozen registry")
+
+        if isinstance(func_class, DicomFunction):
+            instance = func_class
+            func_class = type(instance)
+        elif isinstance(func_class, type) and issubclass(func_class, DicomFunction):
+            instance = func_class()
+        else:
             raise TypeError(
                 f"Function class must be a subclass of DicomFunction, "
-                f"got {func_class.__name__}"
+                f"got {getattr(func_class, '__name__', type(func_class).__name__)}"
             )
 
+        name = sys.intern(name)
         self._functions[name] = func_class
+        self._instances[name] = instance
+        self._names = frozenset(self._functions)
+
+    def freeze(self) -> None:
+        """Make the registry read-only.
+
+        No functions can be registered after this, so a frozen registry can
+        be shared, e.g. between tests or threads, without any of them
+        changing it for the others.
+        """
+        self._frozen = True
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry is read-only, see freeze."""
+        return self._frozen
 
     def get_function(self, name: str) -> DicomFunction:
         """Get a function instance by name.
@@ -90,18 +143,18 @@ class FunctionRegistry:
         Returns
         -------
         DicomFunction
-            An instance of the requested function
+            The shared instance of the requested function
 
         Raises
         ------
         FunctionNotFoundError
             If the function name is not registered
         """
-        if name not in self._functions:
+        try:
+            return self._instances[name]
+        except KeyError:
             available = list(self._functions.keys())
-            raise FunctionNotFoundError(name, available)
-
-        return self._functions[name]()
+            raise FunctionNotFoundError(name, available) from None
 
     def is_registered(self, name: str) -> bool:
         """Check if a function name is registered.
@@ -116,7 +169,7 @@ class FunctionRegistry:
         bool
             True if the function is registered, False otherwise
         """
-        return name in self._functions
+        return name in self._names
 
     def get_registered_names(self) -> list[str]:
         """Get a list of all registered function names.
@@ -134,8 +187,16 @@ class EqualsFunction(DicomFunction):
 
     This function compares DICOM attribute values with a provided argument,
     handling type conversion and comparison logic appropriately.
+
+    By default values are compared as case-insensitive strings, so '5' does not
+    equal a stored value of 5.0. Subclasses can set `numeric` to True to compare
+    attributes with a numeric VR (IS, DS, FL, FD, US, SS, ...) by value instead.
     """
 
+    __slots__ = ()
+
+    numeric: bool = False
+
     def evaluate(
         self, dataset: pydicom.Dataset, attribute: str, argument: Optional[str] = None
     ) -> bool:
@@ -162,7 +223,8 @@ class EqualsFunction(DicomFunction):
         """
         if argument is None:
             raise EvaluationError(
-                attribute=attribute, details="equals() function requires an argument"
+                attribute=_attribute_name(attribute),
+                details="equals() function requires an argument",
             )
 
         try:
@@ -179,7 +241,14 @@ class EqualsFunction(DicomFunction):
 
             # Handle different DICOM value types
             if dicom_value is None:
-                return argument.lower() in ("none", "null", "")
+                return self.matches_none(argument)
+
+            if self.numeric:
+                numeric_result = self._compare_numeric(
+                    dataset, attribute, dicom_value, argument
+                )
+                if numeric_result is not None:
+                    return numeric_result
 
             # Convert DICOM value to string for comparison
             if hasattr(dicom_value, "value"):
@@ -190,14 +259,65 @@ class EqualsFunction(DicomFunction):
                 compare_value = str(dicom_value)
 
             # Perform case-insensitive comparison
-            return compare_value.strip().lower() == argument.strip().lower()
+            return self.normalize(compare_value) == self.normalize(argument)
 
         except Exception as e:
             raise EvaluationError(
-                attribute=attribute,
+                attribute=_attribute_name(attribute),
                 details=f"Failed to evaluate equals function: {str(e)}",
             ) from e
 
+    @staticmethod
+    def normalize(value: Any) -> str:
+        """Return the form in which values and arguments are compared.
+
+        Parameters
+        ----------
+        value : Any
+            Attribute value or argument
+
+        Returns
+        -------
+        str
+            The value as a lower-case string, without surrounding whitespace
+        """
+        return str(value).strip().lower()
+
+    @staticmethod
+    def matches_none(argument: str) -> bool:
+        """Return True if the argument equals attributes without a value."""
+        return argument.lower() in ("none", "null", "")
+
+    @staticmethod
+    def _compare_numeric(
+        dataset: pydicom.Dataset, attribute: str, dicom_value: Any, argument: str
+    ) -> Optional[bool]:
+        """Compare value and argument as numbers if the attribute is numeric.
+
+        Returns
+        -------
+        bool or None
+            Result of the numeric comparison, or None if the attribute does not
+            have a numeric VR, the VR is not known because the dataset is not a
+            pydicom Dataset, or either side is not a single number. Callers
+            should fall back to string comparison in that case.
+        """
+        if not isinstance(dicom_value, (int, float)):
+            return None  # multi-valued or non-numeric value
+        if not isinstance(dataset, pydicom.Dataset):
+            return None  # no VR to tell numeric attributes from others
+        try:
+            vr = dataset[attribute].VR
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+        if vr not in NUMERIC_VRS:
+            return None
+        try:
+            number = float(argument)
+        except ValueError:
+            return None
+        return float(dicom_value) == number
+
 
 class ContainsFunction(DicomFunction):
     """DICOM function that checks if an attribute contains a substring.
@@ -206,6 +326,8 @@ class ContainsFunction(DicomFunction):
     handling string conversion and case sensitivity appropriately.
     """
 
+    __slots__ = ()
+
     def evaluate(
         self, dataset: pydicom.Dataset, attribute: str, argument: Optional[str] = None
     ) -> bool:
@@ -232,7 +354,7 @@ class ContainsFunction(DicomFunction):
         """
         if argument is None:
             raise EvaluationError(
-                attribute=attribute,
+                attribute=_attribute_name(attribute),
                 details="contains() function requires an argument",
             )
 
@@ -262,14 +384,30 @@ class ContainsFunction(DicomFunction):
                 search_text = str(dicom_value)
 
             # Perform case-insensitive substring search
-            return argument.lower() in search_text.lower()
+            return self.normalize(argument) in self.normalize(search_text)
 
         except Exception as e:
             raise EvaluationError(
-                attribute=attribute,
+                attribute=_attribute_name(attribute),
                 details=f"Failed to evaluate contains function: {str(e)}",
             ) from e
 
+    @staticmethod
+    def normalize(value: Any) -> str:
+        """Return the form in which values are searched for arguments.
+
+        Parameters
+        ----------
+        value : Any
+            Attribute value or argument
+
+        Returns
+        -------
+        str
+            The value as a lower-case string
+        """
+        return str(value).lower()
+
 
 class ExistsFunction(DicomFunction):
     """DICOM function that checks if an attribute exists in the dataset.
@@ -278,6 +416,8 @@ class ExistsFunction(DicomFunction):
     handling missing attributes gracefully.
     """
 
+    __slots__ = ()
+
     def evaluate(
         self, dataset: pydicom.Dataset, attribute: str, argument: Optional[str] = None
     ) -> bool:
@@ -304,6 +444,12 @@ class ExistsFunction(DicomFunction):
         """
         try:
             # Check if attribute exists in the dataset
+            if isinstance(attribute, str) and isinstance(dataset, pydicom.Dataset):
+                # Check DICOM keywords by tag, avoiding the attribute lookup
+                # that raises and catches AttributeError for missing elements
+                tag = keyword_tag(attribute)
+                if tag is not None:
+                    return tag in dataset
             if isinstance(attribute, str) and hasattr(dataset, attribute):
                 # Check by attribute name (e.g., PatientName)
                 # hasattr returns True even if the value is None
@@ -317,11 +463,32 @@ class ExistsFunction(DicomFunction):
 
         except Exception as e:
             raise EvaluationError(
-                attribute=attribute,
+                attribute=_attribute_name(attribute),
                 details=f"Failed to evaluate exists function: {str(e)}",
             ) from e
 
 
+@lru_cache(maxsize=2048)
+def keyword_tag(keyword: str) -> Optional[BaseTag]:
+    """Return the tag of a DICOM keyword, or None if it is not a keyword.
+
+    The pydicom data dictionary is only searched once per keyword.
+    """
+    tag = tag_for_keyword(keyword)
+    return None if tag is None else Tag(tag)
+
+
+def _attribute_name(attribute: Union[str, BaseTag]) -> str:
+    """Return the keyword of an attribute given by tag, for error messages."""
+    if isinstance(attribute, BaseTag):
+        return keyword_for_tag(attribute) or str(attribute)
+    return attribute
+
+
+# The built-in functions, which read attributes given by tag the same way as
+# by keyword, only without resolving the keyword
+BUILTIN_FUNCTIONS = (EqualsFunction, ContainsFunction, ExistsFunction)
+
 # Default registry instance with core functions registered
 default_registry = FunctionRegistry()
 default_registry.register("equals", EqualsFunction)
@@ -1,17 +1,33 @@
 """DICOM symbol parsing and conversion for boolean expressions."""
 
 import re
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Iterable, List, Optional, Type
 
 import pydicom
 from boolean import Symbol
+from pydicom.tag import BaseTag
 
 from .exceptions import SymbolParseError, EvaluationError
-from .functions import FunctionRegistry, default_registry
-
-
-@dataclass(frozen=True)
+from .functions import (
+    BUILTIN_FUNCTIONS,
+    FunctionRegistry,
+    default_registry,
+    keyword_tag,
+)
+from .table import DatasetTable
+
+# Pattern to match: attribute.function(argument) or attribute.function()
+# This handles quoted strings, unquoted strings, and no arguments
+_SYMBOL_PATTERN = re.compile(
+    r"^([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\(([^)]*)\)$"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DicomSymbol:
     """Data class representing a parsed DICOM attribute expression.
 
@@ -56,6 +72,45 @@ class DicomSymbol:
     attribute: str
     function: str
     argument: Optional[str] = None
+    # Name of the boolean.py Symbol for this symbol, see to_boolean_symbol
+    _boolean_name: str = field(init=False, repr=False, compare=False)
+    # Tag of the attribute if it is a DICOM keyword, else None
+    _tag: Optional[BaseTag] = field(init=False, repr=False, compare=False)
+    # Whether the argument is numeric and written without quotes, see __str__
+    _is_numeric: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the derived fields once, on creation."""
+        # Intern the names, which are used as attribute names and registry
+        # keys, so that lookups with them can compare by identity
+        if type(self.attribute) is str:
+            object.__setattr__(self, "attribute", sys.intern(self.attribute))
+        if type(self.function) is str:
+            object.__setattr__(self, "function", sys.intern(self.function))
+        object.__setattr__(
+            self,
+            "_tag",
+            keyword_tag(self.attribute) if isinstance(self.attribute, str) else None,
+        )
+        object.__setattr__(
+            self,
+            "_is_numeric",
+            not isinstance(self.argument, str) or self.argument.isdigit(),
+        )
+
+        # Create a unique symbol name for boolean.py
+        # Format: attribute__function__argument_hash
+        if self.argument:
+            # Hash the argument for uniqueness. BLAKE2b rather than hash(), so
+            # that names are the same in every process, e.g. for criteria
+            # loaded with pickle
+            arg_hash = blake2b(
+                str(self.argument).encode("utf-8", "surrogatepass"), digest_size=8
+            ).hexdigest()
+            boolean_name = f"{self.attribute}__{self.function}__{arg_hash}"
+        else:
+            boolean_name = f"{self.attribute}__{self.function}"
+        object.__setattr__(self, "_boolean_name", boolean_name)
 
     @classmethod
     def parse(cls, symbol_str: str) -> "DicomSymbol":
@@ -90,38 +145,7 @@ class DicomSymbol:
         >>> symbol = DicomSymbol.parse("PatientID.exists()")
         >>> symbol.argument   # None
         """
-        # Remove whitespace
-        symbol_str = symbol_str.strip()
-
-        # Pattern to match: attribute.function(argument) or attribute.function()
-        # This handles quoted strings, unquoted strings, and no arguments
-        pattern = r"^([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\(([^)]*)\)$"
-
-        match = re.match(pattern, symbol_str)
-        if not match:
-            raise SymbolParseError(
-                symbol_str,
-                "Expected format: 'attribute.function(args)' where attribute "
-                "and function are valid identifiers",
-            )
-
-        attribute, function, arg_str = match.groups()
-
-        # Parse the argument
-        argument = None
-        if arg_str.strip():
-            arg_str = arg_str.strip()
-
-            # Handle quoted strings (single or double quotes)
-            if (arg_str.startswith("'") and arg_str.endswith("'")) or (
-                arg_str.startswith('"') and arg_str.endswith('"')
-            ):
-                argument = arg_str[1:-1]  # Remove quotes
-            else:
-                # Handle unquoted arguments
-                argument = arg_str
-
-        return cls(attribute=attribute, function=function, argument=argument)
+        return _parse_symbol(cls, symbol_str)
 
     def to_boolean_symbol(self, registry: Optional[FunctionRegistry] = None) -> Symbol:
         """Convert DicomSymbol to a boolean.py Symbol.
@@ -150,7 +174,7 @@ class DicomSymbol:
         --------
         >>> symbol = DicomSymbol.parse("PatientName.equals('John')")
         >>> bool_symbol = symbol.to_boolean_symbol()
-        >>> str(bool_symbol)  # 'PatientName__equals__12345'
+        >>> str(bool_symbol)  # 'PatientName__equals__00d346ad64ebf465'
         """
         if registry is None:
             registry = default_registry
@@ -164,17 +188,7 @@ class DicomSymbol:
                 f"Available functions: {', '.join(available)}",
             )
 
-        # Create a unique symbol name for boolean.py
-        # Format: attribute__function__argument_hash
-        if self.argument:
-            # Create a simple hash of the argument for
-            # uniqueness (use abs to avoid negative)
-            arg_hash = str(abs(hash(self.argument)))
-            symbol_name = f"{self.attribute}__{self.function}__{arg_hash}"
-        else:
-            symbol_name = f"{self.attribute}__{self.function}"
-
-        return Symbol(symbol_name)
+        return _boolean_symbol(self._boolean_name)
 
     def evaluate(
         self, dataset: pydicom.Dataset, registry: Optional[FunctionRegistry] = None
@@ -218,8 +232,86 @@ class DicomSymbol:
             # Get the function implementation
             func_instance = registry.get_function(self.function)
 
+            # The built-in functions read pydicom Datasets by the precomputed
+            # tag instead of resolving the keyword on every access. Subclasses
+            # may override evaluate() and expect the keyword, so they get it
+            attribute = self.attribute
+            if (
+                self._tag is not None
+                and isinstance(dataset, pydicom.Dataset)
+                and type(func_instance) in BUILTIN_FUNCTIONS
+            ):
+                attribute = self._tag
+
             # Evaluate the function
-            return func_instance.evaluate(dataset, self.attribute, self.argument)
+            return func_instance.evaluate(dataset, attribute, self.argument)
+
+        except Exception as e:
+            raise EvaluationError(
+                expression=str(self),
+                attribute=self.attribute,
+                details=f"Failed to evaluate DICOM symbol: {str(e)}",
+            ) from e
+
+    def evaluate_many(
+        self,
+        datasets: Iterable[pydicom.Dataset],
+        registry: Optional[FunctionRegistry] = None,
+    ) -> List[bool]:
+        """Evaluate this DICOM symbol against multiple datasets.
+
+        Equivalent to calling evaluate() for each dataset, but the function
+        is looked up in the registry once for all datasets, and the built-in
+        functions are evaluated on the values of the attribute in all pydicom
+        Datasets at once, see DatasetTable.select_rows.
+
+        Parameters
+        ----------
+        datasets : Iterable[pydicom.Dataset]
+            DICOM datasets to evaluate against
+        registry : FunctionRegistry, optional
+            Function registry to get the function implementation.
+            If None, uses the default registry.
+
+        Returns
+        -------
+        List[bool]
+            Result of evaluating the function against each dataset, in the
+            order given
+
+        Raises
+        ------
+        EvaluationError
+            If evaluation fails for any of the datasets
+
+        Examples
+        --------
+        >>> symbol = DicomSymbol.parse("Modality.equals('MR')")
+        >>> results = symbol.evaluate_many([dataset1, dataset2])
+        """
+        if registry is None:
+            registry = default_registry
+
+        try:
+            function = registry.get_function(self.function)
+            table = DatasetTable(datasets)
+            if all(isinstance(dataset, pydicom.Dataset) for dataset in table.datasets):
+                # Evaluate built-in functions on the attribute column at once
+                selected = table.select_rows(
+                    function, self.attribute, self.argument, range(len(table))
+                )
+                if selected is not None:
+                    results = [False] * len(table)
+                    for row in selected:
+                        results[row] = True
+                    return results
+
+            evaluate = function.evaluate
+            attribute = self.attribute
+            argument = self.argument
+            return [
+                evaluate(dataset, attribute, argument) for dataset in table.datasets
+            ]
 
         except Exception as e:
             raise EvaluationError(
@@ -236,24 +328,53 @@ class DicomSymbol:
         str
             String representation in the format 'attribute.function(argument)'
         """
-        if self.argument is not None:
-            # Add quotes back for string arguments
-            if isinstance(self.argument, str) and not self.argument.isdigit():
-                return f"{self.attribute}.{self.function}('{self.argument}')"
-            else:
-                return f"{self.attribute}.{self.function}({self.argument})"
-        else:
+        if self.argument is None:
             return f"{self.attribute}.{self.function}()"
+        if self._is_numeric:
+            return f"{self.attribute}.{self.function}({self.argument})"
+        # Add quotes back for string arguments
+        return f"{self.attribute}.{self.function}('{self.argument}')"
 
-    def __repr__(self) -> str:
-        """Return detailed string representation of the symbol.
 
-        Returns
-        -------
-        str
-            Detailed representation showing all attributes
-        """
-        return (
-            f"DicomSymbol(attribute='{self.attribute}', "
-            f"function='{self.function}', argument={repr(self.argument)})"
+@lru_cache(maxsize=2048)
+def _parse_symbol(cls: Type[DicomSymbol], symbol_str: str) -> DicomSymbol:
+    """Parse a DICOM symbol string, see DicomSymbol.parse.
+
+    DicomSymbol objects are immutable, so repeated strings share the same
+    parsed instance.
+    """
+    # Remove whitespace
+    symbol_str = symbol_str.strip()
+
+    match = _SYMBOL_PATTERN.match(symbol_str)
+    if not match:
+        raise SymbolParseError(
+            symbol_str,
+            "Expected format: 'attribute.function(args)' where attribute "
+            "and function are valid identifiers",
         )
+
+    attribute, function, arg_str = match.groups()
+
+    # Parse the argument, branching on its first character
+    arg_str = arg_str.strip()
+    if not arg_str:
+        argument = None
+    elif arg_str[0] in "'\"" and arg_str[-1] == arg_str[0]:
+        # Quoted string (single or double quotes), remove the quotes
+        argument = arg_str[1:-1]
+    else:
+        # Unquoted argument
+        argument = arg_str
+
+    return cls(attribute, function, argument)
+
+
+@lru_cache(maxsize=2048)
+def _boolean_symbol(name: str) -> Symbol:
+    """Create the boolean.py Symbol for a DICOM symbol, see to_boolean_symbol.
+
+    Equal DICOM symbols have the same name, so they share the same
+    boolean.py Symbol.
+    """
+    return Symbol(name)
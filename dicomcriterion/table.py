@@ -0,0 +1,189 @@
+"""Column-wise storage of DICOM dataset collections for batch evaluation."""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pydicom
+from pydicom.tag import BaseTag
+
+from .functions import (
+    ContainsFunction,
+    DicomFunction,
+    EqualsFunction,
+    ExistsFunction,
+    keyword_tag,
+)
+
+# Column value of datasets that do not have the attribute
+MISSING = object()
+
+
+class DatasetTable:
+    """Collection of DICOM datasets stored as one column per attribute.
+
+    Internal to DicomSymbol.evaluate_many. Columns are read from the datasets
+    the first time they are needed, and then reused. The built-in functions
+    evaluate a whole column at once, so they do not need to access each
+    dataset object again, and values are only converted and case-folded once
+    per table.
+
+    Datasets must not be modified while the table is in use.
+
+    Parameters
+    ----------
+    datasets : Iterable[pydicom.Dataset]
+        DICOM datasets to store, in order
+
+    See Also
+    --------
+    DicomSymbol.evaluate_many : Evaluate a symbol on a table's columns
+    """
+
+    def __init__(self, datasets: Iterable[pydicom.Dataset]) -> None:
+        """Initialize a table for the given datasets."""
+        self._datasets = list(datasets)
+        self._columns: Dict[str, List[Any]] = {}
+        self._text_columns: Dict[Tuple[str, bool], List[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of datasets in the table."""
+        return len(self._datasets)
+
+    @property
+    def datasets(self) -> List[pydicom.Dataset]:
+        """The datasets in the table, in order."""
+        return self._datasets
+
+    def column(self, keyword: str) -> List[Any]:
+        """Return the values of an attribute for all datasets.
+
+        Parameters
+        ----------
+        keyword : str
+            DICOM attribute keyword, e.g. 'PatientName'
+
+        Returns
+        -------
+        List[Any]
+            Value of the attribute for each dataset, or MISSING for datasets
+            that do not have it
+        """
+        column = self._columns.get(keyword)
+        if column is None:
+            tag = keyword_tag(keyword)
+            column = self._columns[keyword] = [
+                _value(dataset, keyword, tag) for dataset in self._datasets
+            ]
+        return column
+
+    def text_column(self, keyword: str, strip: bool = False) -> List[Any]:
+        """Return the values of an attribute as lower-case strings.
+
+        Parameters
+        ----------
+        keyword : str
+            DICOM attribute keyword, e.g. 'PatientName'
+        strip : bool, optional
+            If True, leading and trailing whitespace is removed as well.
+            Defaults to False.
+
+        Returns
+        -------
+        List[Any]
+            Lower-case string value of the attribute for each dataset, None
+            for datasets where the value is None, or MISSING for datasets
+            that do not have it
+        """
+        column = self._text_columns.get((keyword, strip))
+        if column is None:
+            column = self._text_columns[(keyword, strip)] = [
+                _to_text(value, strip) for value in self.column(keyword)
+            ]
+        return column
+
+    def select_rows(
+        self,
+        function: DicomFunction,
+        keyword: str,
+        argument: Optional[str],
+        rows: Sequence[int],
+    ) -> Optional[List[int]]:
+        """Evaluate a built-in function on a column, for some rows.
+
+        equals(), contains() and exists() are evaluated on the column of the
+        attribute as a whole, with the same results as evaluating the
+        function for each dataset.
+
+        Parameters
+        ----------
+        function : DicomFunction
+            The function to evaluate
+        keyword : str
+            DICOM attribute keyword, e.g. 'PatientName'
+        argument : str, optional
+            The function argument
+        rows : Sequence[int]
+            Indices of the datasets to evaluate the function for, in order
+
+        Returns
+        -------
+        List[int] or None
+            The indices from rows for which the function is true, in order, or
+            None if the function is not one of the built-in functions (exactly,
+            not a subclass) and must be evaluated for each dataset
+        """
+        function_type = type(function)
+        if function_type is ExistsFunction:
+            column = self.column(keyword)
+            return [row for row in rows if column[row] is not MISSING]
+        if argument is None:
+            return None
+        if function_type is EqualsFunction:
+            column = self.text_column(keyword, strip=True)
+            expected = EqualsFunction.normalize(argument)
+            matches_none = EqualsFunction.matches_none(argument)
+            return [
+                row
+                for row in rows
+                if column[row] == expected or (column[row] is None and matches_none)
+            ]
+        if function_type is ContainsFunction:
+            column = self.text_column(keyword)
+            substring = ContainsFunction.normalize(argument)
+            return [
+                row
+                for row in rows
+                if column[row] is not MISSING
+                and column[row] is not None
+                and substring in column[row]
+            ]
+        return None
+
+
+def _value(dataset: Any, keyword: str, tag: Optional[BaseTag]) -> Any:
+    """Return the value of an attribute, or MISSING, see column.
+
+    The tag of a standard keyword is resolved once per column, so pydicom
+    Datasets are read by tag instead of translating the keyword on every
+    access.
+    """
+    if tag is not None and isinstance(dataset, pydicom.Dataset):
+        return dataset[tag].value if tag in dataset else MISSING
+    value = getattr(dataset, keyword, MISSING)
+    # Objects other than Datasets may hold data elements, as the functions
+    # accept
+    if isinstance(value, pydicom.DataElement):
+        return value.value
+    return value
+
+
+def _to_text(value: Any, strip: bool) -> Optional[Any]:
+    """Convert a column value to the text equals() or contains() compares.
+
+    See text_column; values are normalised by the built-in functions
+    themselves, so that column-wise evaluation matches them.
+    """
+    if value is MISSING or value is None:
+        return value
+    if strip:
+        return EqualsFunction.normalize(value)
+    return ContainsFunction.normalize(value)
@@ -0,0 +1,63 @@
+"""Shared fixtures for the DICOM Criterion test suite."""
+
+import pytest
+from pydicom import Dataset
+
+from dicomcriterion import (
+    ContainsFunction,
+    EqualsFunction,
+    ExistsFunction,
+    FunctionRegistry,
+)
+
+
+def _make_dataset(patient_name: str, study_description: str) -> Dataset:
+    """Create a dataset with the given patient name and study description."""
+    dataset = Dataset()
+    dataset.PatientName = patient_name
+    dataset.StudyDescription = study_description
+    return dataset
+
+
+# Module-scoped datasets are shared between tests, which must not modify them.
+
+
+@pytest.fixture(scope="module")
+def john_mri_dataset():
+    """Dataset for patient 'John' with an MRI study."""
+    return _make_dataset("John", "Brain MRI scan")
+
+
+@pytest.fixture(scope="module")
+def john_ct_dataset():
+    """Dataset for patient 'John' with a CT study."""
+    return _make_dataset("John", "CT scan")
+
+
+@pytest.fixture(scope="module")
+def jane_mri_dataset():
+    """Dataset for patient 'Jane' with an MRI study."""
+    return _make_dataset("Jane", "Brain MRI scan")
+
+
+@pytest.fixture(scope="module")
+def jane_ct_dataset():
+    """Dataset for patient 'Jane' with a CT study."""
+    return _make_dataset("Jane", "CT scan")
+
+
+@pytest.fixture(scope="module")
+def anonymous_dataset():
+    """Dataset for an anonymous patient with an MRI study."""
+    return _make_dataset("Anonymous", "Brain MRI scan")
+
+
+@pytest.fixture(scope="session")
+def builtin_registry():
+    """Frozen registry of the built-in functions, shared by all tests."""
+    registry = FunctionRegistry()
+    registry.register("equals", EqualsFunction)
+    registry.register("contains", ContainsFunction)
+    registry.register("exists", ExistsFunction)
+    registry.freeze()
+    return registry
@@ -0,0 +1,133 @@
+"""Unit tests for the CriterionSet class."""
+
+import pytest
+from pydicom import Dataset
+
+from dicomcriterion import (
+    Criterion,
+    CriterionSet,
+    EvaluationError,
+    ExpressionParseError,
+)
+from dicomcriterion.functions import ExistsFunction, FunctionRegistry
+
+
+class RecordingExistsFunction(ExistsFunction):
+    """exists() function recording the attributes it is evaluated for."""
+
+    calls = []
+
+    def evaluate(self, dataset, attribute, argument=None):
+        self.calls.append(attribute)
+        return super().evaluate(dataset, attribute, argument)
+
+
+@pytest.fixture
+def recording_registry():
+    """Registry whose exists() function records its evaluations."""
+    RecordingExistsFunction.calls = []
+    registry = FunctionRegistry()
+    registry.register("exists", RecordingExistsFunction)
+    return registry
+
+
+@pytest.fixture
+def dataset():
+    """Dataset with a patient name and a study description."""
+    dataset = Dataset()
+    dataset.PatientName = "John Doe"
+    dataset.StudyDescription = "Brain MRI"
+    return dataset
+
+
+class TestCriterionSet:
+    """Test cases for CriterionSet."""
+
+    def test_evaluate_all_returns_result_per_name(self, dataset):
+        """Test that evaluate_all returns the result of each named criterion."""
+        criteria = CriterionSet(
+            {
+                "has_name": "PatientName.exists()",
+                "is_mri": Criterion("StudyDescription.contains('MRI')"),
+                "is_ct": "StudyDescription.contains('CT')",
+            }
+        )
+
+        assert len(criteria) == 3
+        assert list(criteria) == ["has_name", "is_mri", "is_ct"]
+        assert isinstance(criteria["is_ct"], Criterion)
+        assert criteria.evaluate_all(dataset) == {
+            "has_name": True,
+            "is_mri": True,
+            "is_ct": False,
+        }
+
+    def test_shared_symbols_are_evaluated_once(self, dataset, recording_registry):
+        """Test that common symbols are evaluated once per dataset."""
+        criteria = CriterionSet(
+            {
+                "first": "PatientName.exists() and StudyDescription.exists()",
+                "second": "PatientName.exists() or PatientID.exists()",
+                "third": "not PatientName.exists()",
+            },
+            registry=recording_registry,
+        )
+
+        assert criteria.evaluate_all(dataset) == {
+            "first": True,
+            "second": True,
+            "third": False,
+        }
+        assert RecordingExistsFunction.calls == ["PatientName", "StudyDescription"]
+
+        criteria.evaluate_all(dataset)
+        assert RecordingExistsFunction.calls.count("PatientName") == 2
+
+    def test_results_match_evaluate(self, dataset):
+        """Test that evaluate_all returns the results of evaluate."""
+        criteria = CriterionSet(
+            {
+                "has_name": "PatientName.exists() and not PatientID.exists()",
+                "is_mri": "StudyDescription.contains('MRI') or "
+                "StudyDescription.contains('MR')",
+                "is_ct": "StudyDescription.contains('CT') or PatientID.exists()",
+                "is_john": "PatientName.equals('john doe')",
+            }
+        )
+        other_dataset = Dataset()
+        other_dataset.PatientID = "12345"
+
+        for evaluated in (dataset, other_dataset):
+            assert criteria.evaluate_all(evaluated) == {
+                name: criteria[name].evaluate(evaluated) for name in criteria
+            }
+
+    def test_results_are_not_kept_between_calls(self, dataset, recording_registry):
+        """Test that symbols are evaluated again for every call."""
+        criteria = CriterionSet(
+            {
+                "first": "PatientName.exists() and StudyDescription.exists()",
+                "second": "PatientID.exists() or PatientName.exists()",
+            },
+            registry=recording_registry,
+        )
+
+        assert criteria.evaluate_all(dataset) == {"first": True, "second": True}
+        assert len(RecordingExistsFunction.calls) == 3
+        assert RecordingExistsFunction.calls.count("PatientName") == 1
+
+        del dataset.PatientName
+        assert criteria.evaluate_all(dataset) == {"first": False, "second": False}
+        assert len(RecordingExistsFunction.calls) == 5
+
+    def test_invalid_expression(self):
+        """Test that invalid expressions raise ExpressionParseError."""
+        with pytest.raises(ExpressionParseError):
+            CriterionSet({"invalid": "PatientName.exists() and"})
+
+    def test_evaluate_with_invalid_dataset(self):
+        """Test that evaluation errors are raised as EvaluationError."""
+        criteria = CriterionSet({"is_john": "PatientName.equals('John')"})
+
+        with pytest.raises(EvaluationError):
+            criteria.evaluate_all(None)
@@ -1,15 +1,28 @@
 """Unit tests for the Criterion class."""
 
+import pickle
+
 import pytest
+from boolean import BooleanAlgebra
 from pydicom import Dataset
 
 from dicomcriterion import (
     Criterion,
+    DicomSymbol,
     ExpressionParseError,
     SymbolParseError,
     EvaluationError,
+    freeze,
+)
+from dicomcriterion.criterion import _LRUCache, _minimal_substrings
+from dicomcriterion.functions import (
+    ContainsFunction,
+    DicomFunction,
+    EqualsFunction,
+    ExistsFunction,
+    FunctionRegistry,
+    default_registry,
 )
-from dicomcriterion.functions import FunctionRegistry, EqualsFunction
 
 
 class TestCriterionConstructor:
@@ -136,6 +149,23 @@ class TestCriterionConstructor:
         symbol = next(iter(criterion._dicom_symbols))
         assert symbol.argument == "25"
 
+    def test_init_with_repeated_expression(self, monkeypatch):
+        """Test that repeated expressions are not parsed again."""
+        expression = "PatientName.exists() and (Modality.equals('CT') or true)"
+        first = Criterion(expression)
+
+        def parse(*args, **kwargs):
+            raise AssertionError("Expression was parsed again")
+
+        monkeypatch.setattr(BooleanAlgebra, "parse", parse)
+        second = Criterion(expression)
+
+        assert second._parsed_expression is first._parsed_expression
+        assert second.evaluate(Dataset()) is False
+        dataset = Dataset()
+        dataset.PatientName = "John"
+        assert second.evaluate(dataset) is True
+
 
 class TestCriterionConstructorErrors:
     """Test cases for Criterion constructor error handling."""
@@ -154,6 +184,25 @@ class TestCriterionConstructorErrors:
 
         assert "No valid DICOM symbols found" in str(exc_info.value)
 
+    def test_init_with_repeated_invalid_syntax(self, monkeypatch):
+        """Test that repeated invalid expressions are not parsed again."""
+        expression = "PatientName.exists() and or PatientID.exists()"
+        with pytest.raises(ExpressionParseError) as first:
+            Criterion(expression)
+
+        def parse(*args, **kwargs):
+            raise AssertionError("Expression was parsed again")
+
+        monkeypatch.setattr(BooleanAlgebra, "parse", parse)
+        with pytest.raises(ExpressionParseError) as second:
+            Criterion(expression)
+
+        assert str(second.value) == str(first.value)
+
+        # Symbols are still validated against the registry first
+        with pytest.raises(SymbolParseError):
+            Criterion(expression, registry=FunctionRegistry())
+
     def test_init_with_invalid_symbol_format(self):
         """Test initialization with invalid symbol format raises error."""
         with pytest.raises(ExpressionParseError) as exc_info:
@@ -204,6 +253,41 @@ class TestCriterionConstructorErrors:
         assert "No valid DICOM symbols found" in str(exc_info.value)
 
 
+class TestCriterionTryParse:
+    """Test cases for the Criterion try_parse method."""
+
+    def test_try_parse_valid_expression(self):
+        """Test that a valid expression returns a criterion and no error."""
+        criterion, error = Criterion.try_parse("PatientName.equals('John')")
+
+        assert error is None
+        assert isinstance(criterion, Criterion)
+        assert criterion.evaluate(Dataset()) is False
+
+    @pytest.mark.parametrize(
+        "expression, error_type",
+        [
+            ("", ExpressionParseError),
+            ("PatientName.exists() and", ExpressionParseError),
+            ("PatientName.unknown('John')", SymbolParseError),
+        ],
+    )
+    def test_try_parse_invalid_expression(self, expression, error_type):
+        """Test that invalid expressions return the error instead of raising."""
+        criterion, error = Criterion.try_parse(expression)
+
+        assert criterion is None
+        assert isinstance(error, error_type)
+
+    def test_try_parse_with_registry(self):
+        """Test that try_parse uses the given registry."""
+        registry = FunctionRegistry()
+        registry.register("exists", ExistsFunction)
+
+        assert Criterion.try_parse("PatientName.exists()", registry)[1] is None
+        assert Criterion.try_parse("PatientName.equals('John')", registry)[0] is None
+
+
 class TestCriterionStringRepresentation:
     """Test cases for Criterion string representation methods."""
 
@@ -454,6 +538,333 @@ class TestCriterionEvaluate:
         result = criterion.evaluate(dataset)
         assert result is True
 
+    def test_evaluate_looks_up_keywords_by_tag(self):
+        """Test that built-in functions access standard keywords by tag."""
+
+        class KeywordAccessDataset(Dataset):
+            def __getattr__(self, name):
+                if name in ("PatientName", "PatientID"):
+                    raise AssertionError(f"Keyword access to {name}")
+                return super().__getattr__(name)
+
+        criterion = Criterion("PatientName.equals('John Doe') and PatientID.exists()")
+        dataset = KeywordAccessDataset()
+        dataset.add_new(0x00100010, "PN", "John Doe")
+        dataset.add_new(0x00100020, "LO", "12345")
+
+        assert criterion.evaluate(dataset) is True
+
+    def test_evaluate_builtin_subclass_gets_keyword(self):
+        """Test that subclasses of the built-in functions get the keyword."""
+
+        class UpperEqualsFunction(EqualsFunction):
+            def evaluate(self, dataset, attribute, argument=None):
+                value = str(getattr(dataset, attribute, ""))
+                return value.upper() == argument
+
+        registry = FunctionRegistry()
+        registry.register("equals", UpperEqualsFunction)
+        criterion = Criterion("PatientName.equals('JOHN DOE')", registry)
+
+        dataset = Dataset()
+        dataset.PatientName = "John Doe"
+
+        assert criterion.evaluate(dataset) is True
+
+    def test_evaluate_with_non_keyword_attribute(self):
+        """Test evaluation of attributes that are not DICOM keywords."""
+        criterion = Criterion("Patient_Name.exists()")
+
+        dataset = Dataset()
+        dataset.PatientName = "John Doe"
+
+        assert criterion.evaluate(dataset) is False
+
+    def test_evaluate_checks_cheap_functions_first(self):
+        """Test that exists() short-circuits before contains() is evaluated."""
+        calls = []
+
+        class RecordingContainsFunction(ContainsFunction):
+            def evaluate(self, dataset, attribute, argument=None):
+                calls.append(argument)
+                return super().evaluate(dataset, attribute, argument)
+
+        registry = FunctionRegistry()
+        registry.register("contains", RecordingContainsFunction)
+        registry.register("exists", ExistsFunction)
+
+        and_criterion = Criterion(
+            "StudyDescription.contains('MRI') and PatientID.exists()",
+            registry=registry,
+        )
+        or_criterion = Criterion(
+            "StudyDescription.contains('MRI') or PatientID.exists()",
+            registry=registry,
+        )
+
+        dataset = Dataset()
+        dataset.StudyDescription = "Brain MRI"
+        assert and_criterion.evaluate(dataset) is False
+
+        dataset.PatientID = "12345"
+        assert or_criterion.evaluate(dataset) is True
+        assert calls == []
+
+        assert and_criterion.evaluate(dataset) is True
+        assert calls == ["MRI"]
+
+    def test_evaluate_short_circuits_and_or(self):
+        """Test that operands after the deciding one are never evaluated."""
+        calls = []
+
+        class RecordingFunction(DicomFunction):
+            def evaluate(self, dataset, attribute, argument=None):
+                calls.append(attribute)
+                return attribute in dataset
+
+        registry = FunctionRegistry()
+        registry.register("present", RecordingFunction)
+
+        dataset = Dataset()
+        dataset.PatientName = "John Doe"
+
+        or_criterion = Criterion(
+            "PatientName.present() or PatientID.present() or Modality.present()",
+            registry=registry,
+        )
+        assert or_criterion.evaluate(dataset) is True
+        assert calls == ["PatientName"]
+
+        calls.clear()
+        and_criterion = Criterion(
+            "PatientID.present() and PatientName.present() and Modality.present()",
+            registry=registry,
+        )
+        assert and_criterion.evaluate(dataset) is False
+        assert calls == ["PatientID"]
+
+    def test_evaluate_repeated_symbol_once(self):
+        """Test that a symbol occurring more than once is evaluated once."""
+        calls = []
+
+        class RecordingFunction(DicomFunction):
+            def evaluate(self, dataset, attribute, argument=None):
+                calls.append(attribute)
+                return attribute in dataset
+
+        registry = FunctionRegistry()
+        registry.register("present", RecordingFunction)
+        criterion = Criterion(
+            "(PatientName.present() and Modality.present()) or "
+            "(PatientName.present() and PatientID.present())",
+            registry=registry,
+        )
+
+        dataset = Dataset()
+        dataset.PatientName = "John Doe"
+        dataset.PatientID = "12345"
+
+        assert criterion.evaluate(dataset) is True
+        assert sorted(calls) == ["Modality", "PatientID", "PatientName"]
+
+        calls.clear()
+        assert criterion.evaluate_many([dataset, dataset]) == [True, True]
+        assert len(calls) == 6
+
+    def test_evaluate_reads_contains_attribute_once(self):
+        """Test that contains() on one attribute reads its value once."""
+        reads = []
+
+        class CountingDataset(Dataset):
+            def __getitem__(self, key):
+                reads.append(key)
+                return super().__getitem__(key)
+
+        criterion = Criterion(
+            "StudyDescription.contains('STAT') or "
+            "StudyDescription.contains('EMERGENCY') or "
+            "StudyDescription.contains('Urgent')"
+        )
+        dataset = CountingDataset()
+        dataset.add_new(0x00081030, "LO", "URGENT head CT")
+
+        assert criterion.evaluate(dataset) is True
+        assert reads == [0x00081030]
+
+    def test_evaluate_equals_with_empty_value(self):
+        """Test equals() against an element without a value."""
+        dataset = Dataset()
+        dataset.add_new(0x00100010, "PN", None)
+
+        assert Criterion("PatientName.equals('')").evaluate(dataset) is True
+        assert Criterion("PatientName.equals('None')").evaluate(dataset) is True
+        assert Criterion("PatientName.equals('John')").evaluate(dataset) is False
+
+    def test_evaluate_or_of_contains_on_same_attribute(self):
+        """Test OR of contains() on one attribute mixed with other checks."""
+        criterion = Criterion(
+            "StudyDescription.contains('MRI') or PatientID.exists() or "
+            "StudyDescription.contains('CT') or PatientName.contains('MRI')"
+        )
+
+        for description, patient_id, expected in [
+            ("Brain MRI", None, True),
+            ("Chest ct", None, True),
+            ("X-ray", None, False),
+            ("X-ray", "12345", True),
+            (None, None, False),
+        ]:
+            dataset = Dataset()
+            dataset.PatientName = "John"
+            if description is not None:
+                dataset.StudyDescription = description
+            if patient_id is not None:
+                dataset.PatientID = patient_id
+            assert criterion.evaluate(dataset) is expected
+
+    def test_evaluate_contains_on_frozen_dataset(self):
+        """Test contains() against datasets other than pydicom Datasets."""
+        criterion = Criterion(
+            "StudyDescription.contains('mri') or StudyDescription.contains('CT')"
+        )
+        dataset = Dataset()
+        dataset.PatientName = "John"
+
+        assert criterion.evaluate(freeze(dataset)) is False
+        dataset.StudyDescription = "Brain MRI"
+        assert criterion.evaluate(freeze(dataset)) is True
+        dataset.StudyDescription = "X-ray"
+        assert criterion.evaluate(freeze(dataset)) is False
+
+
+class TestCriterionEvaluateMany:
+    """Test cases for the Criterion evaluate_many method."""
+
+    def test_evaluate_many_returns_result_per_dataset(self):
+        """Test that evaluate_many returns one result per dataset, in order."""
+        criterion = Criterion(
+            "PatientName.equals('John') and not StudyDescription.contains('CT')"
+        )
+
+        datasets = []
+        for name, description in [
+            ("John", "Brain MRI"),
+            ("Jane", "Brain MRI"),
+            ("John", "Chest CT"),
+        ]:
+            dataset = Dataset()
+            dataset.PatientName = name
+            dataset.StudyDescription = description
+            datasets.append(dataset)
+
+        assert criterion.evaluate_many(datasets) == [True, False, False]
+        assert criterion.evaluate_many(datasets) == [
+            criterion.evaluate(dataset) for dataset in datasets
+        ]
+
+    def test_evaluate_many_accepts_iterables(self):
+        """Test that evaluate_many accepts any iterable, including generators."""
+        criterion = Criterion("PatientID.exists()")
+
+        def datasets():
+            for i in range(3):
+                dataset = Dataset()
+                if i % 2 == 0:
+                    dataset.PatientID = str(i)
+                yield dataset
+
+        assert criterion.evaluate_many(datasets()) == [True, False, True]
+        assert criterion.evaluate_many([]) == []
+
+    def test_evaluate_many_with_invalid_dataset(self):
+        """Test that evaluate_many raises EvaluationError for invalid datasets."""
+        criterion = Criterion("PatientName.equals('John')")
+        dataset = Dataset()
+        dataset.PatientName = "John"
+
+        with pytest.raises(EvaluationError):
+            criterion.evaluate_many([dataset, None])
+
+
+class TestCriterionOptimize:
+    """Test cases for the Criterion optimize method."""
+
+    @staticmethod
+    def _ordered_symbols(criterion):
+        """Return the DICOM symbols of the criterion's root, in evaluation order."""
+        return [
+            str(criterion._symbol_mapping[str(arg)])
+            for arg in criterion._ordered_args(criterion._parsed_expression)
+        ]
+
+    def test_optimize_orders_or_most_likely_true_first(self):
+        """Test that OR evaluates the operand most likely to be true first."""
+        criterion = Criterion("Modality.equals('CT') or Modality.equals('MR')")
+        assert self._ordered_symbols(criterion) == [
+            "Modality.equals('CT')",
+            "Modality.equals('MR')",
+        ]
+
+        assert criterion.optimize({"Modality.equals('MR')": 0.8}) is criterion
+        assert self._ordered_symbols(criterion) == [
+            "Modality.equals('MR')",
+            "Modality.equals('CT')",
+        ]
+
+    def test_optimize_orders_and_most_likely_false_first(self):
+        """Test that AND evaluates the operand most likely to be false first."""
+        criterion = Criterion(
+            "Modality.equals('MR') and StudyDate.equals('20240101')"
+        ).optimize({"Modality.equals('MR')": 0.6, "StudyDate.equals('20240101')": 0.1})
+
+        assert self._ordered_symbols(criterion) == [
+            "StudyDate.equals(20240101)",
+            "Modality.equals('MR')",
+        ]
+
+    def test_optimize_keeps_cheaper_operands_first(self):
+        """Test that probabilities only order operands of equal cost."""
+        criterion = Criterion(
+            "StudyDescription.contains('MRI') or PatientID.exists()"
+        ).optimize({"StudyDescription.contains('MRI')": 1.0, "PatientID.exists()": 0})
+
+        assert self._ordered_symbols(criterion) == [
+            "PatientID.exists()",
+            "StudyDescription.contains('MRI')",
+        ]
+
+    def test_optimize_does_not_change_results(self):
+        """Test that an optimized criterion evaluates to the same results."""
+        criterion = Criterion(
+            "(Modality.equals('CT') or Modality.equals('MR')) and "
+            "not StudyDescription.contains('test')"
+        )
+        datasets = []
+        for modality, description in [("MR", "Brain"), ("CT", "test"), ("US", "x")]:
+            dataset = Dataset()
+            dataset.Modality = modality
+            dataset.StudyDescription = description
+            datasets.append(dataset)
+        expected = criterion.evaluate_many(datasets)
+
+        criterion.optimize({"Modality.equals('MR')": 0.9})
+
+        assert criterion.evaluate_many(datasets) == expected == [True, False, False]
+
+    def test_optimize_with_invalid_probability(self):
+        """Test that probabilities outside [0, 1] raise ValueError."""
+        criterion = Criterion("Modality.equals('MR')")
+
+        with pytest.raises(ValueError):
+            criterion.optimize({"Modality.equals('MR')": 1.5})
+
+    def test_optimize_with_invalid_symbol(self):
+        """Test that invalid symbol keys raise SymbolParseError."""
+        criterion = Criterion("Modality.equals('MR')")
+
+        with pytest.raises(SymbolParseError):
+            criterion.optimize({"Modality": 0.5})
+
 
 class TestCriterionEvaluateErrors:
     """Test cases for Criterion evaluate method error handling."""
@@ -493,6 +904,22 @@ class TestCriterionEvaluateErrors:
         with pytest.raises(EvaluationError):
             criterion.evaluate(InvalidDataset())
 
+    @pytest.mark.parametrize("function", ["equals", "contains"])
+    def test_evaluate_error_names_keyword(self, function):
+        """Test that errors name the attribute by keyword, not by tag."""
+        criterion = Criterion(f"PatientName.{function}()")
+        dataset = Dataset()
+        dataset.PatientName = "John Doe"
+
+        with pytest.raises(EvaluationError) as exc_info:
+            criterion.evaluate(dataset)
+
+        assert (
+            f"Failed to access DICOM attribute 'PatientName': "
+            f"{function}() function requires an argument"
+        ) in str(exc_info.value)
+        assert "(0010,0010)" not in str(exc_info.value)
+
 
 class TestCriterionInternalMethods:
     """Test cases for Criterion internal helper methods."""
@@ -526,6 +953,166 @@ class TestCriterionInternalMethods:
         assert "equals" in functions
         assert "exists" in functions
 
+    def test_parsed_sub_expressions_are_shared(self):
+        """Test that criteria share identical parsed sub-expressions."""
+        first = Criterion(
+            "PatientID.exists() and "
+            "(StudyDescription.contains('MRI') or StudyDescription.contains('CT'))"
+        )
+        second = Criterion(
+            "(StudyDescription.contains('MRI') or StudyDescription.contains('CT'))"
+            " or PatientName.equals('John')"
+        )
+
+        assert first._parsed_expression.args[1] is second._parsed_expression.args[0]
+
+    def test_criteria_of_same_shape_share_bytecode(self):
+        """Test that criteria differing only in their symbols share bytecode."""
+        first = Criterion("PatientName.equals('John') and not Modality.equals('CT')")
+        second = Criterion("PatientName.equals('Jane') and not Modality.equals('MR')")
+
+        dataset = Dataset()
+        dataset.PatientName = "Jane"
+        dataset.Modality = "CT"
+        assert first.evaluate(dataset) is False
+        assert second.evaluate(dataset) is True
+
+        assert first._evaluator.__code__ is second._evaluator.__code__
+
+    def test_pickle_keeps_parsed_expression(self, monkeypatch):
+        """Test that unpickled criteria are not parsed again."""
+        criterion = Criterion(
+            "PatientName.equals('John') and not StudyDescription.contains('CT')"
+        ).optimize({"PatientName.equals('John')": 0.1})
+        criterion.evaluate(Dataset())
+        data = pickle.dumps(criterion)
+
+        def parse(*args, **kwargs):
+            raise AssertionError("Expression was parsed again")
+
+        monkeypatch.setattr(BooleanAlgebra, "parse", parse)
+        restored = pickle.loads(data)
+
+        assert repr(restored) == repr(criterion)
+        assert restored._registry is default_registry
+        assert restored._parsed_expression is criterion._parsed_expression
+
+        dataset = Dataset()
+        dataset.PatientName = "John"
+        assert restored.evaluate(dataset) is True
+        dataset.StudyDescription = "Chest CT"
+        assert restored.evaluate(dataset) is False
+
+    def test_pickle_from_other_version_is_parsed_again(self):
+        """Test that criteria pickled in another format are parsed again."""
+        registry = FunctionRegistry()
+        registry.register("exists", ExistsFunction)
+        criterion = Criterion("PatientName.exists()", registry=registry)
+        state = criterion.__getstate__()
+        state["version"] = -1
+
+        restored = Criterion.__new__(Criterion)
+        restored.__setstate__(state)
+
+        assert restored._registry is registry
+        assert restored._parsed_expression is criterion._parsed_expression
+        assert restored.evaluate(Dataset()) is False
+
+    def test_criterion_has_no_instance_dict(self):
+        """Test that criteria store their state in slots."""
+        criterion = Criterion("PatientName.exists()")
+        criterion.evaluate(Dataset())
+
+        assert not hasattr(criterion, "__dict__")
+
+    def test_compiled_on_first_evaluation(self):
+        """Test that criteria are compiled when first evaluated, and once."""
+        criterion = Criterion("PatientName.exists() or PatientID.exists()")
+        assert criterion._evaluator is None
+
+        criterion.evaluate(Dataset())
+        evaluator = criterion._evaluator
+        assert evaluator is not None
+
+        criterion.evaluate_many([Dataset(), Dataset()])
+        assert criterion._evaluator is evaluator
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "PatientName.equals('John Doe')",
+            "PatientName.equals('')",
+            "PatientID.exists()",
+            "  StudyDescription.contains('MRI')  ",
+        ],
+    )
+    def test_single_symbol_expression(self, expression):
+        """Test that single symbol expressions are parsed like any other."""
+        criterion = Criterion(expression)
+
+        assert criterion._dicom_symbols == {DicomSymbol.parse(expression)}
+        assert criterion._parsed_expression == next(
+            iter(criterion._dicom_symbols)
+        ).to_boolean_symbol(criterion._registry)
+
+    def test_ordered_args_flattens_nested_operators(self):
+        """Test that nested AND and OR chains are ordered as one chain."""
+        criterion = Criterion(
+            "StudyDescription.contains('MRI') and "
+            "(PatientName.equals('John') and (PatientID.exists() or "
+            "(StudyDate.exists() or PatientBirthDate.exists())))"
+        )
+
+        or_node, equals, contains = criterion._ordered_args(
+            criterion._parsed_expression
+        )
+        assert str(equals).startswith("PatientName__equals")
+        assert str(contains).startswith("StudyDescription__contains")
+        assert len(criterion._ordered_args(or_node)) == 3
+
+    @pytest.mark.parametrize(
+        "expression, folded",
+        [
+            ("PatientID.exists() or true", "1"),
+            ("PatientID.exists() and false", "0"),
+            ("PatientID.exists() and true", "PatientID__exists"),
+            ("PatientID.exists() or false", "PatientID__exists"),
+            ("not not PatientID.exists()", "PatientID__exists"),
+            ("not (PatientID.exists() and true)", "~PatientID__exists"),
+            ("not true or PatientID.exists()", "PatientID__exists"),
+            ("PatientID.exists() and PatientID.exists()", "PatientID__exists"),
+            (
+                "(StudyDate.exists() or false) and (true and PatientID.exists())",
+                "StudyDate__exists&PatientID__exists",
+            ),
+        ],
+    )
+    def test_constant_folding(self, expression, folded):
+        """Test that constants and redundant operands are folded away."""
+        criterion = Criterion(expression)
+
+        assert str(criterion._parsed_expression) == folded
+
+    def test_constant_folded_evaluation(self):
+        """Test evaluation of expressions that fold to a constant."""
+        dataset = Dataset()
+
+        assert Criterion("PatientID.exists() or true").evaluate(dataset) is True
+        assert Criterion("PatientID.exists() and false").evaluate(dataset) is False
+
+    @pytest.mark.parametrize(
+        "substrings, expected",
+        [
+            (["mri", "ct"], ("ct", "mri")),
+            (["brain mri", "mri", "mri"], ("mri",)),
+            (["stat", "emergency", "urgent stat"], ("stat", "emergency")),
+            (["", "mri"], ("",)),
+        ],
+    )
+    def test_minimal_substrings(self, substrings, expected):
+        """Test reduction of OR-ed contains() substrings to the necessary ones."""
+        assert _minimal_substrings(substrings) == expected
+
     def test_convert_to_boolean_expression(self):
         """Test _convert_to_boolean_expression method."""
         expression = "PatientName.equals('John') and StudyID.exists()"
@@ -554,3 +1141,29 @@ class TestCriterionInternalMethods:
         assert "StudyID__exists" in boolean_expr
         assert "PatientName.equals('John')" not in boolean_expr
         assert "StudyID.exists()" not in boolean_expr
+
+
+class TestLRUCache:
+    """Test cases for the bounded caches of parsing and compilation."""
+
+    def test_get_and_put(self):
+        """Test that stored values are returned, and missing keys give None."""
+        cache = _LRUCache(2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that a full cache keeps caching, evicting the oldest entry."""
+        cache = _LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
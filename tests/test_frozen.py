@@ -0,0 +1,120 @@
+"""Unit tests for FrozenDataset and freeze."""
+
+import pytest
+from pydicom import Dataset
+
+from dicomcriterion import Criterion, EvaluationError, FrozenDataset, freeze
+
+
+@pytest.fixture
+def dataset():
+    """Dataset with a few of the frozen keywords and one other attribute."""
+    dataset = Dataset()
+    dataset.PatientName = "John Doe"
+    dataset.PatientID = "12345"
+    dataset.StudyDescription = "Brain MRI scan"
+    dataset.AccessionNumber = "A001"
+    return dataset
+
+
+class TestFreeze:
+    """Test cases for the freeze function."""
+
+    def test_freeze_captures_values(self, dataset):
+        """Test that present keywords are captured with their values."""
+        frozen = freeze(dataset)
+
+        assert isinstance(frozen, FrozenDataset)
+        assert str(frozen.PatientName) == "John Doe"
+        assert frozen.PatientID == "12345"
+        assert frozen.StudyDescription == "Brain MRI scan"
+
+    def test_freeze_skips_missing_keywords(self, dataset):
+        """Test that keywords missing from the dataset are missing when frozen."""
+        frozen = freeze(dataset)
+
+        assert "PatientID" in frozen
+        assert "StudyDate" not in frozen
+        assert not hasattr(frozen, "StudyDate")
+
+    def test_freeze_rejects_other_keywords(self, dataset):
+        """Test that keywords not listed in KEYWORDS raise when read."""
+        frozen = freeze(dataset)
+
+        with pytest.raises(LookupError, match="AccessionNumber"):
+            frozen.AccessionNumber
+        with pytest.raises(LookupError, match="AccessionNumber"):
+            "AccessionNumber" in frozen
+
+    def test_freeze_other_names_are_missing(self, dataset):
+        """Test that names which are not DICOM keywords are plain missing."""
+        frozen = freeze(dataset)
+
+        assert not hasattr(frozen, "Custom_Attribute")
+        assert "Custom_Attribute" not in frozen
+
+    def test_frozen_dataset_is_read_only(self, dataset):
+        """Test that a frozen dataset cannot be modified."""
+        frozen = freeze(dataset)
+
+        with pytest.raises(AttributeError):
+            frozen.PatientID = "54321"
+        with pytest.raises(AttributeError):
+            del frozen.PatientID
+        with pytest.raises(AttributeError):
+            frozen.AccessionNumber = "A002"
+
+        assert frozen.PatientID == "12345"
+
+    def test_frozen_dataset_does_not_track_source(self, dataset):
+        """Test that later changes to the source dataset are not reflected."""
+        frozen = freeze(dataset)
+        dataset.PatientID = "54321"
+
+        assert frozen.PatientID == "12345"
+
+    def test_repr(self, dataset):
+        """Test the representation of a frozen dataset."""
+        frozen = freeze(dataset)
+
+        assert repr(frozen).startswith("FrozenDataset(PatientName=")
+        assert "PatientID='12345'" in repr(frozen)
+
+
+class TestFrozenDatasetEvaluation:
+    """Test cases for evaluating criteria against frozen datasets."""
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "PatientName.equals('John Doe')",
+            "PatientName.equals('Jane Doe')",
+            "StudyDescription.contains('mri')",
+            "StudyDescription.contains('CT')",
+            "PatientID.exists()",
+            "StudyDate.exists()",
+            "StudyDate.equals('20240101')",
+            "not PatientName.equals('Anonymous') and PatientID.exists()",
+            "StudyDescription.contains('CT') or StudyDescription.contains('MRI')",
+        ],
+    )
+    def test_same_result_as_dataset(self, dataset, expression):
+        """Test that criteria evaluate the same for a dataset and its snapshot."""
+        criterion = Criterion(expression)
+
+        assert criterion.evaluate(freeze(dataset)) is criterion.evaluate(dataset)
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "AccessionNumber.exists()",
+            "AccessionNumber.equals('A001')",
+            "AccessionNumber.contains('A')",
+        ],
+    )
+    def test_keyword_not_captured_raises(self, dataset, expression):
+        """Test that criteria on keywords that are not captured raise."""
+        criterion = Criterion(expression)
+
+        with pytest.raises(EvaluationError, match="not captured"):
+            criterion.evaluate(freeze(dataset))
@@ -1,5 +1,7 @@
 """Tests for the DICOM function registry system."""
 
+import pickle
+
 import pytest
 import pydicom
 
@@ -135,6 +137,38 @@ class TestFunctionRegistry:
         assert isinstance(contains_func, ContainsFunction)
         assert isinstance(exists_func, ExistsFunction)
 
+    def test_registry_has_no_instance_dict(self):
+        """Test that registries store their state in slots."""
+        assert not hasattr(FunctionRegistry(), "__dict__")
+
+    def test_freeze(self):
+        """Test that a frozen registry still provides its functions."""
+        registry = FunctionRegistry()
+        registry.register("mock", MockFunction)
+        assert not registry.frozen
+
+        registry.freeze()
+
+        assert registry.frozen
+        assert registry.is_registered("mock")
+        assert isinstance(registry.get_function("mock"), MockFunction)
+        with pytest.raises(FunctionNotFoundError):
+            registry.get_function("nonexistent")
+
+    def test_frozen_registry_pickle(self, builtin_registry):
+        """Test that registries stay frozen through a pickle round trip."""
+        restored = pickle.loads(pickle.dumps(builtin_registry))
+
+        assert restored.frozen
+        assert restored.get_registered_names() == ["equals", "contains", "exists"]
+
+    def test_register_in_frozen_registry_raises_error(self, builtin_registry):
+        """Test that no functions can be registered after freezing."""
+        with pytest.raises(RuntimeError, match="frozen"):
+            builtin_registry.register("mock", MockFunction)
+
+        assert not builtin_registry.is_registered("mock")
+
 
 class TestDefaultRegistry:
     """Test cases for the default registry instance."""
@@ -202,7 +236,7 @@ class TestDefaultRegistry:
 class TestFunctionRegistryIntegration:
     """Integration tests for function registry with actual DICOM data."""
 
-    def test_registry_with_real_dicom_dataset(self):
+    def test_registry_with_real_dicom_dataset(self, builtin_registry):
         """Test registry functions with a realistic DICOM dataset."""
         # Create a more realistic DICOM dataset
         dataset = pydicom.Dataset()
@@ -212,15 +246,10 @@ class TestFunctionRegistryIntegration:
         dataset.Modality = "MR"
         dataset.StudyDate = "20240101"
 
-        registry = FunctionRegistry()
-        registry.register("equals", EqualsFunction)
-        registry.register("contains", ContainsFunction)
-        registry.register("exists", ExistsFunction)
-
         # Test various scenarios
-        equals_func = registry.get_function("equals")
-        contains_func = registry.get_function("contains")
-        exists_func = registry.get_function("exists")
+        equals_func = builtin_registry.get_function("equals")
+        contains_func = builtin_registry.get_function("contains")
+        exists_func = builtin_registry.get_function("exists")
 
         # Equals tests
         assert equals_func.evaluate(dataset, "PatientID", "12345")
@@ -1,5 +1,7 @@
 """Tests for DICOM function interface and registry."""
 
+from types import SimpleNamespace
+
 import pytest
 import pydicom
 from pydicom.dataset import Dataset
@@ -63,6 +65,19 @@ class TestDicomFunction:
         assert hasattr(func, "evaluate")
         assert callable(func.evaluate)
 
+    @pytest.mark.parametrize(
+        "func_class", [EqualsFunction, ContainsFunction, ExistsFunction]
+    )
+    def test_builtin_functions_have_no_instance_dict(self, func_class):
+        """Test that the built-in functions do not carry a __dict__."""
+        assert not hasattr(func_class(), "__dict__")
+
+    def test_subclasses_can_keep_instance_attributes(self):
+        """Test that subclasses without __slots__ can still set attributes."""
+        func = MockDicomFunction()
+        func.label = "mock"
+        assert func.label == "mock"
+
 
 class TestFunctionRegistry:
     """Test cases for FunctionRegistry class."""
@@ -96,16 +111,25 @@ class TestFunctionRegistry:
         assert isinstance(func, MockDicomFunction)
         assert isinstance(func, DicomFunction)
 
-    def test_get_function_creates_new_instance_each_time(self):
-        """Test that get_function creates new instances."""
+    def test_get_function_returns_shared_instance(self):
+        """Test that get_function returns the same instance each time."""
         registry = FunctionRegistry()
         registry.register("mock", MockDicomFunction)
 
         func1 = registry.get_function("mock")
         func2 = registry.get_function("mock")
 
-        assert func1 is not func2
-        assert type(func1) == type(func2)
+        assert func1 is func2
+        assert type(func1) is MockDicomFunction
+
+    def test_register_function_instance(self):
+        """Test registering a function instance instead of a class."""
+        registry = FunctionRegistry()
+        func = MockDicomFunction()
+        registry.register("mock", func)
+
+        assert registry.get_function("mock") is func
+        assert registry.is_registered("mock")
 
     def test_get_unregistered_function_raises_error(self):
         """Test that getting unregistered function raises error."""
@@ -276,6 +300,56 @@ class TestEqualsFunction:
         result = self.func.evaluate(self.dataset, "SliceThickness", "5")
         assert result is False  # String comparison, not numeric
 
+    def test_equals_numeric_mode_compares_by_value(self):
+        """Test that numeric mode compares numeric VRs by value."""
+
+        class NumericEqualsFunction(EqualsFunction):
+            numeric = True
+
+        func = NumericEqualsFunction()
+        self.dataset.SliceThickness = 5.0
+        self.dataset.SeriesNumber = 1
+
+        assert func.evaluate(self.dataset, "SliceThickness", "5") is True
+        assert func.evaluate(self.dataset, "SliceThickness", "5.00") is True
+        assert func.evaluate(self.dataset, "SliceThickness", "5.1") is False
+        assert func.evaluate(self.dataset, "SeriesNumber", "1.0") is True
+
+    def test_equals_numeric_mode_falls_back_to_string(self):
+        """Test that numeric mode uses string comparison for non-numeric cases."""
+
+        class NumericEqualsFunction(EqualsFunction):
+            numeric = True
+
+        func = NumericEqualsFunction()
+        self.dataset.PatientAge = "025Y"
+        self.dataset.SliceThickness = 5.0
+        self.dataset.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+
+        assert func.evaluate(self.dataset, "PatientAge", "025y") is True
+        assert func.evaluate(self.dataset, "SliceThickness", "five") is False
+        assert (
+            func.evaluate(
+                self.dataset,
+                "ImageOrientationPatient",
+                "[1.0, 0.0, 0.0, 0.0, 1.0, 0.0]",
+            )
+            is True
+        )
+
+    def test_equals_numeric_mode_other_datasets(self):
+        """Test that numeric mode compares strings for non-pydicom datasets."""
+
+        class NumericEqualsFunction(EqualsFunction):
+            numeric = True
+
+        func = NumericEqualsFunction()
+        dataset = SimpleNamespace(SeriesNumber=1, SliceThickness=5.0)
+
+        assert func.evaluate(dataset, "SeriesNumber", "1") is True
+        assert func.evaluate(dataset, "SeriesNumber", "2") is False
+        assert func.evaluate(dataset, "SliceThickness", "5.0") is True
+
     def test_equals_with_list_values(self):
         """Test equals with list/sequence DICOM values."""
         self.dataset.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
@@ -624,12 +698,28 @@ class TestExistsFunction:
         assert self.func.evaluate(self.dataset, "patientname") is False
         assert self.func.evaluate(self.dataset, "PATIENTNAME") is False
 
+    def test_exists_checks_keywords_without_attribute_lookup(self):
+        """Test that DICOM keywords are checked without getattr on the dataset."""
+        lookups = []
+
+        class RecordingDataset(Dataset):
+            def __getattr__(self, name):
+                lookups.append(name)
+                return super().__getattr__(name)
+
+        dataset = RecordingDataset()
+        dataset.PatientName = "John Doe"
+
+        assert self.func.evaluate(dataset, "PatientName") is True
+        assert self.func.evaluate(dataset, "PatientID") is False
+        assert lookups == []
+
     def test_exists_error_handling(self):
         """Test that evaluation errors are properly handled."""
         # Create a dataset that will cause an error during access
         class ErrorDataset(Dataset):
             def __contains__(self, key):
-                if key == "PatientName":
+                if key in ("PatientName", 0x00100010):
                     raise ValueError("Simulated error")
                 return super().__contains__(key)
 
@@ -2,182 +2,223 @@
 
 This module contains integration tests that verify the complete functionality
 of the Criterion class with complex boolean expressions, multiple operators,
-nested expressions, and comprehensive error handling.
+nested expressions, and real-world usage. Error handling across the evaluation
+chain is tested in test_integration_errors.py.
 """
 
+from types import SimpleNamespace
+from typing import Any, Dict, Tuple
+
 import pytest
-from pydicom import Dataset
+from pydicom import DataElement, Dataset
+from pydicom.datadict import dictionary_VR, tag_for_keyword
 
 from dicomcriterion import (
     Criterion,
+    CriterionSet,
     ExpressionParseError,
     SymbolParseError,
     EvaluationError,
 )
 
 
+# Attribute values shared by many test datasets
+_JOHN = "John"
+_JOHN_DOE = "John Doe"
+_JANE = "Jane"
+_ANONYMOUS = "Anonymous"
+_EMERGENCY_PATIENT = "EMERGENCY Patient"
+_PATIENT_ID = "12345"
+_STUDY_DATE = "20240101"
+_BRAIN_MRI_SCAN = "Brain MRI scan"
+_BRAIN_MRI_CONTRAST = "Brain MRI with contrast"
+_CT_SCAN = "CT scan"
+
+# DataElements shared between test datasets, keyed by (keyword, value)
+_ELEMENTS: Dict[Tuple[str, Any], DataElement] = {}
+
+
+def _ds(**attributes) -> Dataset:
+    """Create a dataset from keyword=value attributes in one call.
+
+    Each distinct (keyword, value) DataElement is built once and then shared
+    between the datasets that use it, so tests must not modify elements of
+    the returned datasets.
+    """
+    dataset = Dataset()
+    for keyword, value in attributes.items():
+        element = _ELEMENTS.get((keyword, value))
+        if element is None:
+            element = DataElement(
+                tag_for_keyword(keyword), dictionary_VR(keyword), value
+            )
+            _ELEMENTS[(keyword, value)] = element
+        dataset.add(element)
+    return dataset
+
+
+@pytest.fixture
+def dataset(request):
+    """Dataset built, when the test runs, from the attributes it is parametrized with."""
+    return _ds(**request.param)
+
+
 class TestComplexBooleanExpressions:
     """Test complex boolean expressions with multiple operators."""
 
-    def test_complex_and_or_combination(self):
+    @pytest.mark.parametrize(
+        "dataset, expected",
+        [
+            pytest.param(
+                {"PatientName": _JOHN, "StudyDescription": _BRAIN_MRI_CONTRAST},
+                True,
+                id="name-matches-and-mri",
+            ),
+            pytest.param(
+                {"PatientName": _JOHN, "StudyDescription": "Chest CT scan"},
+                True,
+                id="name-matches-and-ct",
+            ),
+            pytest.param(
+                {"PatientName": _JOHN, "StudyDescription": "X-ray examination"},
+                False,
+                id="name-matches-neither-mri-nor-ct",
+            ),
+            pytest.param(
+                {"PatientName": _JANE, "StudyDescription": _BRAIN_MRI_CONTRAST},
+                False,
+                id="mri-but-name-differs",
+            ),
+        ],
+        indirect=["dataset"],
+    )
+    def test_complex_and_or_combination(self, dataset, expected):
         """Test complex expression with both AND and OR operators.
 
         Requirements: 4.1, 4.2
         """
-        expression = (
+        criterion = Criterion(
             "PatientName.equals('John') and "
             "(StudyDescription.contains('MRI') or "
             "StudyDescription.contains('CT'))"
         )
-        criterion = Criterion(expression)
-
-        # Test case 1: Matches PatientName and has MRI in StudyDescription
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-        dataset1.StudyDescription = "Brain MRI with contrast"
-
-        assert criterion.evaluate(dataset1) is True
-
-        # Test case 2: Matches PatientName and has CT in StudyDescription
-        dataset2 = Dataset()
-        dataset2.PatientName = "John"
-        dataset2.StudyDescription = "Chest CT scan"
-
-        assert criterion.evaluate(dataset2) is True
-
-        # Test case 3: Matches PatientName but has neither MRI nor CT
-        dataset3 = Dataset()
-        dataset3.PatientName = "John"
-        dataset3.StudyDescription = "X-ray examination"
-
-        assert criterion.evaluate(dataset3) is False
-
-        # Test case 4: Doesn't match PatientName but has MRI
-        dataset4 = Dataset()
-        dataset4.PatientName = "Jane"
-        dataset4.StudyDescription = "Brain MRI with contrast"
-
-        assert criterion.evaluate(dataset4) is False
-
-    def test_multiple_and_operators(self):
+        assert criterion.evaluate(dataset) is expected
+
+    @pytest.mark.parametrize(
+        "dataset, expected",
+        [
+            pytest.param(
+                {
+                    "PatientName": _JOHN,
+                    "PatientID": _PATIENT_ID,
+                    "StudyDate": _STUDY_DATE,
+                    "StudyDescription": _BRAIN_MRI_SCAN,
+                },
+                True,
+                id="all-conditions",
+            ),
+            pytest.param(
+                {
+                    "PatientName": _JOHN,
+                    "PatientID": _PATIENT_ID,
+                    "StudyDescription": _BRAIN_MRI_SCAN,
+                },
+                False,
+                id="missing-study-date",
+            ),
+            pytest.param(
+                {"PatientName": _JOHN},
+                False,
+                id="missing-multiple",
+            ),
+        ],
+        indirect=["dataset"],
+    )
+    def test_multiple_and_operators(self, dataset, expected):
         """Test expression with multiple AND operators.
 
         Requirements: 4.1
         """
-        expression = (
+        criterion = Criterion(
             "PatientName.equals('John') and PatientID.exists() "
             "and StudyDate.exists() and StudyDescription.contains('MRI')"
         )
-        criterion = Criterion(expression)
-
-        # Test case 1: All conditions satisfied
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-        dataset1.PatientID = "12345"
-        dataset1.StudyDate = "20240101"
-        dataset1.StudyDescription = "Brain MRI scan"
-
-        assert criterion.evaluate(dataset1) is True
-
-        # Test case 2: Missing one condition (StudyDate)
-        dataset2 = Dataset()
-        dataset2.PatientName = "John"
-        dataset2.PatientID = "12345"
-        dataset2.StudyDescription = "Brain MRI scan"
-        # StudyDate is missing
-
-        assert criterion.evaluate(dataset2) is False
-
-        # Test case 3: Missing multiple conditions
-        dataset3 = Dataset()
-        dataset3.PatientName = "John"
-        # PatientID, StudyDate, and StudyDescription are missing
-
-        assert criterion.evaluate(dataset3) is False
-
-    def test_multiple_or_operators(self):
+        assert criterion.evaluate(dataset) is expected
+
+    @pytest.mark.parametrize(
+        "dataset, expected",
+        [
+            pytest.param(
+                {"PatientName": _JOHN, "PatientID": _PATIENT_ID}, True, id="first"
+            ),
+            pytest.param(
+                {"PatientName": "Bob", "PatientID": "67890"}, True, id="middle"
+            ),
+            pytest.param(
+                {"PatientName": "Unknown", "PatientID": "EMERGENCY"},
+                True,
+                id="last-only",
+            ),
+            pytest.param(
+                {"PatientName": "Alice", "PatientID": "99999"}, False, id="none"
+            ),
+        ],
+        indirect=["dataset"],
+    )
+    def test_multiple_or_operators(self, dataset, expected):
         """Test expression with multiple OR operators.
 
         Requirements: 4.2
         """
-        expression = (
+        criterion = Criterion(
             "PatientName.equals('John') or PatientName.equals('Jane') "
             "or PatientName.equals('Bob') or PatientID.equals('EMERGENCY')"
         )
-        criterion = Criterion(expression)
-
-        # Test case 1: Matches first condition
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-        dataset1.PatientID = "12345"
-
-        assert criterion.evaluate(dataset1) is True
-
-        # Test case 2: Matches middle condition
-        dataset2 = Dataset()
-        dataset2.PatientName = "Bob"
-        dataset2.PatientID = "67890"
-
-        assert criterion.evaluate(dataset2) is True
-
-        # Test case 3: Matches last condition only
-        dataset3 = Dataset()
-        dataset3.PatientName = "Unknown"
-        dataset3.PatientID = "EMERGENCY"
-
-        assert criterion.evaluate(dataset3) is True
-
-        # Test case 4: Matches none of the conditions
-        dataset4 = Dataset()
-        dataset4.PatientName = "Alice"
-        dataset4.PatientID = "99999"
-
-        assert criterion.evaluate(dataset4) is False
-
-    def test_mixed_and_or_operators(self):
+        assert criterion.evaluate(dataset) is expected
+
+    @pytest.mark.parametrize(
+        "dataset, expected",
+        [
+            # First OR condition should be True regardless of AND
+            pytest.param(
+                {"PatientName": _JOHN, "StudyDescription": _CT_SCAN},
+                True,
+                id="first-or-condition",
+            ),
+            pytest.param(
+                {"PatientName": _JANE, "StudyDescription": _BRAIN_MRI_SCAN},
+                True,
+                id="and-condition",
+            ),
+            pytest.param(
+                {"PatientName": _JANE, "StudyDescription": _CT_SCAN},
+                False,
+                id="jane-without-mri",
+            ),
+            pytest.param(
+                {"PatientName": "Bob", "StudyDescription": "X-ray"},
+                False,
+                id="neither",
+            ),
+        ],
+        indirect=["dataset"],
+    )
+    def test_mixed_and_or_operators(self, dataset, expected):
         """Test expression with mixed AND and OR operators.
 
         Requirements: 4.1, 4.2
         """
-        expression = (
+        criterion = Criterion(
             "PatientName.equals('John') or "
             "PatientName.equals('Jane') and StudyDescription.contains('MRI')"
         )
-        criterion = Criterion(expression)
-
-        # Test case 1: Matches first OR condition (should be True regardless of AND)
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-        dataset1.StudyDescription = "CT scan"  # Doesn't contain MRI
-
-        assert criterion.evaluate(dataset1) is True
-
-        # Test case 2: Matches second part of AND condition
-        dataset2 = Dataset()
-        dataset2.PatientName = "Jane"
-        dataset2.StudyDescription = "Brain MRI scan"
-
-        assert criterion.evaluate(dataset2) is True
-
-        # Test case 3: Matches Jane but not MRI condition
-        dataset3 = Dataset()
-        dataset3.PatientName = "Jane"
-        dataset3.StudyDescription = "CT scan"
-
-        assert criterion.evaluate(dataset3) is False
-
-        # Test case 4: Matches neither condition
-        dataset4 = Dataset()
-        dataset4.PatientName = "Bob"
-        dataset4.StudyDescription = "X-ray"
-
-        assert criterion.evaluate(dataset4) is False
+        assert criterion.evaluate(dataset) is expected
 
 
 class TestNestedExpressionsAndPrecedence:
     """Test nested expressions with parentheses and operator precedence."""
 
-    def test_simple_parentheses_grouping(self):
+    def test_simple_parentheses_grouping(self, john_mri_dataset, john_ct_dataset):
         """Test simple parentheses for grouping operations.
 
         Requirements: 4.4
@@ -189,30 +230,22 @@ class TestNestedExpressionsAndPrecedence:
         criterion = Criterion(expression)
 
         # Test case 1: First name matches and has MRI
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-        dataset1.StudyDescription = "Brain MRI scan"
+        dataset1 = john_mri_dataset
 
         assert criterion.evaluate(dataset1) is True
 
         # Test case 2: Second name matches and has MRI
-        dataset2 = Dataset()
-        dataset2.PatientName = "Jane"
-        dataset2.StudyDescription = "Spine MRI with contrast"
+        dataset2 = _ds(PatientName=_JANE, StudyDescription="Spine MRI with contrast")
 
         assert criterion.evaluate(dataset2) is True
 
         # Test case 3: Name matches but no MRI
-        dataset3 = Dataset()
-        dataset3.PatientName = "John"
-        dataset3.StudyDescription = "CT scan"
+        dataset3 = john_ct_dataset
 
         assert criterion.evaluate(dataset3) is False
 
         # Test case 4: Has MRI but name doesn't match
-        dataset4 = Dataset()
-        dataset4.PatientName = "Bob"
-        dataset4.StudyDescription = "Brain MRI scan"
+        dataset4 = _ds(PatientName="Bob", StudyDescription=_BRAIN_MRI_SCAN)
 
         assert criterion.evaluate(dataset4) is False
 
@@ -230,42 +263,48 @@ class TestNestedExpressionsAndPrecedence:
         criterion = Criterion(expression)
 
         # Test case 1: Satisfies first complex condition
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-        dataset1.StudyDescription = "Brain MRI scan"
-        dataset1.PatientID = "12345"
-        dataset1.StudyDate = "20240102"  # Different date
+        dataset1 = _ds(
+            PatientName=_JOHN,
+            StudyDescription=_BRAIN_MRI_SCAN,
+            PatientID=_PATIENT_ID,
+            StudyDate="20240102",  # Different date
+        )
 
         assert criterion.evaluate(dataset1) is True
 
         # Test case 2: Satisfies second complex condition
-        dataset2 = Dataset()
-        dataset2.PatientName = "Bob"  # Doesn't match first condition
-        dataset2.StudyDescription = "CT scan"  # Doesn't match first condition
-        dataset2.PatientID = "67890"
-        dataset2.StudyDate = "20240101"  # Matches second condition
+        dataset2 = _ds(
+            PatientName="Bob",  # Doesn't match first condition
+            StudyDescription=_CT_SCAN,  # Doesn't match first condition
+            PatientID="67890",
+            StudyDate=_STUDY_DATE,  # Matches second condition
+        )
 
         assert criterion.evaluate(dataset2) is True
 
         # Test case 3: Satisfies both complex conditions
-        dataset3 = Dataset()
-        dataset3.PatientName = "Jane"
-        dataset3.StudyDescription = "Spine MRI"
-        dataset3.PatientID = "99999"
-        dataset3.StudyDate = "20240101"
+        dataset3 = _ds(
+            PatientName=_JANE,
+            StudyDescription="Spine MRI",
+            PatientID="99999",
+            StudyDate=_STUDY_DATE,
+        )
 
         assert criterion.evaluate(dataset3) is True
 
         # Test case 4: Satisfies neither complex condition
-        dataset4 = Dataset()
-        dataset4.PatientName = "Bob"
-        dataset4.StudyDescription = "CT scan"
-        dataset4.StudyDate = "20240102"
-        # PatientID is missing
+        dataset4 = _ds(
+            PatientName="Bob",
+            StudyDescription=_CT_SCAN,
+            StudyDate="20240102",
+            # PatientID is missing
+        )
 
         assert criterion.evaluate(dataset4) is False
 
-    def test_operator_precedence_without_parentheses(self):
+    def test_operator_precedence_without_parentheses(
+        self, john_ct_dataset, jane_ct_dataset
+    ):
         """Test that operator precedence works correctly without explicit parentheses.
 
         Requirements: 4.4
@@ -283,27 +322,21 @@ class TestNestedExpressionsAndPrecedence:
 
         # Test case 1: First condition is true (should be True
         # regardless of second part)
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-        dataset1.StudyDescription = "CT scan"  # No MRI
+        dataset1 = john_ct_dataset  # No MRI
 
         assert criterion.evaluate(dataset1) is True
 
         # Test case 2: Second part of AND is satisfied
-        dataset2 = Dataset()
-        dataset2.PatientName = "Jane"
-        dataset2.StudyDescription = "Brain MRI"
+        dataset2 = _ds(PatientName=_JANE, StudyDescription="Brain MRI")
 
         assert criterion.evaluate(dataset2) is True
 
         # Test case 3: Jane but no MRI (second part of AND fails)
-        dataset3 = Dataset()
-        dataset3.PatientName = "Jane"
-        dataset3.StudyDescription = "CT scan"
+        dataset3 = jane_ct_dataset
 
         assert criterion.evaluate(dataset3) is False
 
-    def test_complex_nested_with_not_operator(self):
+    def test_complex_nested_with_not_operator(self, anonymous_dataset):
         """Test complex nested expressions with NOT operator.
 
         Requirements: 4.3, 4.4
@@ -317,30 +350,24 @@ class TestNestedExpressionsAndPrecedence:
         criterion = Criterion(expression)
 
         # Test case 1: Valid patient name and has MRI
-        dataset1 = Dataset()
-        dataset1.PatientName = "John Doe"
-        dataset1.StudyDescription = "Brain MRI scan"
+        dataset1 = _ds(PatientName=_JOHN_DOE, StudyDescription=_BRAIN_MRI_SCAN)
 
         assert criterion.evaluate(dataset1) is True
 
         # Test case 2: Valid patient name and has CT
-        dataset2 = Dataset()
-        dataset2.PatientName = "Jane Smith"
-        dataset2.StudyDescription = "Chest CT with contrast"
+        dataset2 = _ds(
+            PatientName="Jane Smith", StudyDescription="Chest CT with contrast"
+        )
 
         assert criterion.evaluate(dataset2) is True
 
         # Test case 3: Anonymous patient (should fail NOT condition)
-        dataset3 = Dataset()
-        dataset3.PatientName = "Anonymous"
-        dataset3.StudyDescription = "Brain MRI scan"
+        dataset3 = anonymous_dataset
 
         assert criterion.evaluate(dataset3) is False
 
         # Test case 4: Valid name but no MRI/CT
-        dataset4 = Dataset()
-        dataset4.PatientName = "John Doe"
-        dataset4.StudyDescription = "X-ray examination"
+        dataset4 = _ds(PatientName=_JOHN_DOE, StudyDescription="X-ray examination")
 
         assert criterion.evaluate(dataset4) is False
 
@@ -348,439 +375,338 @@ class TestNestedExpressionsAndPrecedence:
 class TestAllDicomFunctionCombinations:
     """Test combinations of all three DICOM functions (equals, contains, exists)."""
 
-    def test_all_three_functions_with_and(self):
+    @pytest.mark.parametrize(
+        "dataset, expected",
+        [
+            pytest.param(
+                {
+                    "PatientName": _JOHN_DOE,
+                    "StudyDescription": _BRAIN_MRI_CONTRAST,
+                    "PatientID": _PATIENT_ID,
+                },
+                True,
+                id="all-conditions",
+            ),
+            pytest.param(
+                {
+                    "PatientName": _JOHN_DOE,
+                    "StudyDescription": _BRAIN_MRI_CONTRAST,
+                },
+                False,
+                id="missing-patient-id",
+            ),
+            pytest.param(
+                {
+                    "PatientName": "Jane Smith",
+                    "StudyDescription": _BRAIN_MRI_CONTRAST,
+                    "PatientID": _PATIENT_ID,
+                },
+                False,
+                id="wrong-patient-name",
+            ),
+            pytest.param(
+                {
+                    "PatientName": _JOHN_DOE,
+                    "StudyDescription": "CT scan of chest",
+                    "PatientID": _PATIENT_ID,
+                },
+                False,
+                id="no-mri-in-description",
+            ),
+        ],
+        indirect=["dataset"],
+    )
+    def test_all_three_functions_with_and(self, dataset, expected):
         """Test expression using all three functions with AND operator.
 
         Requirements: 4.1
         """
-        expression = (
+        criterion = Criterion(
             "PatientName.equals('John Doe') and "
             "StudyDescription.contains('MRI') and PatientID.exists()"
         )
-        criterion = Criterion(expression)
-
-        # Test case 1: All conditions satisfied
-        dataset1 = Dataset()
-        dataset1.PatientName = "John Doe"
-        dataset1.StudyDescription = "Brain MRI with contrast"
-        dataset1.PatientID = "12345"
-
-        assert criterion.evaluate(dataset1) is True
-
-        # Test case 2: Missing PatientID (exists fails)
-        dataset2 = Dataset()
-        dataset2.PatientName = "John Doe"
-        dataset2.StudyDescription = "Brain MRI with contrast"
-        # PatientID is missing
-
-        assert criterion.evaluate(dataset2) is False
-
-        # Test case 3: Wrong patient name (equals fails)
-        dataset3 = Dataset()
-        dataset3.PatientName = "Jane Smith"
-        dataset3.StudyDescription = "Brain MRI with contrast"
-        dataset3.PatientID = "12345"
-
-        assert criterion.evaluate(dataset3) is False
-
-        # Test case 4: No MRI in description (contains fails)
-        dataset4 = Dataset()
-        dataset4.PatientName = "John Doe"
-        dataset4.StudyDescription = "CT scan of chest"
-        dataset4.PatientID = "12345"
-
-        assert criterion.evaluate(dataset4) is False
-
-    def test_all_three_functions_with_or(self):
+        assert criterion.evaluate(dataset) is expected
+
+    @pytest.mark.parametrize(
+        "dataset, expected",
+        [
+            pytest.param(
+                {"PatientName": "Emergency", "StudyDescription": "Regular scan"},
+                True,
+                id="only-first",
+            ),
+            pytest.param(
+                {"PatientName": _JOHN_DOE, "StudyDescription": "STAT Brain MRI"},
+                True,
+                id="only-second",
+            ),
+            pytest.param(
+                {
+                    "PatientName": _JOHN_DOE,
+                    "StudyDescription": "Regular scan",
+                    "PatientID": _PATIENT_ID,
+                },
+                True,
+                id="only-third",
+            ),
+            pytest.param(
+                {
+                    "PatientName": "Emergency",
+                    "StudyDescription": "STAT Brain MRI",
+                    "PatientID": _PATIENT_ID,
+                },
+                True,
+                id="all-conditions",
+            ),
+            pytest.param(
+                {"PatientName": _JOHN_DOE, "StudyDescription": "Regular scan"},
+                False,
+                id="no-conditions",
+            ),
+        ],
+        indirect=["dataset"],
+    )
+    def test_all_three_functions_with_or(self, dataset, expected):
         """Test expression using all three functions with OR operator.
 
         Requirements: 4.2
         """
-        expression = (
+        criterion = Criterion(
             "PatientName.equals('Emergency') or "
             "StudyDescription.contains('STAT') or PatientID.exists()"
         )
-        criterion = Criterion(expression)
-
-        # Test case 1: Only first condition satisfied
-        dataset1 = Dataset()
-        dataset1.PatientName = "Emergency"
-        dataset1.StudyDescription = "Regular scan"
-        # PatientID is missing
-
-        assert criterion.evaluate(dataset1) is True
-
-        # Test case 2: Only second condition satisfied
-        dataset2 = Dataset()
-        dataset2.PatientName = "John Doe"
-        dataset2.StudyDescription = "STAT Brain MRI"
-        # PatientID is missing
-
-        assert criterion.evaluate(dataset2) is True
-
-        # Test case 3: Only third condition satisfied
-        dataset3 = Dataset()
-        dataset3.PatientName = "John Doe"
-        dataset3.StudyDescription = "Regular scan"
-        dataset3.PatientID = "12345"
-
-        assert criterion.evaluate(dataset3) is True
-
-        # Test case 4: All conditions satisfied
-        dataset4 = Dataset()
-        dataset4.PatientName = "Emergency"
-        dataset4.StudyDescription = "STAT Brain MRI"
-        dataset4.PatientID = "12345"
-
-        assert criterion.evaluate(dataset4) is True
-
-        # Test case 5: No conditions satisfied
-        dataset5 = Dataset()
-        dataset5.PatientName = "John Doe"
-        dataset5.StudyDescription = "Regular scan"
-        # PatientID is missing
-
-        assert criterion.evaluate(dataset5) is False
-
-    def test_mixed_functions_with_complex_logic(self):
+        assert criterion.evaluate(dataset) is expected
+
+    @pytest.mark.parametrize(
+        "dataset, expected",
+        [
+            pytest.param(
+                {
+                    "PatientName": _JOHN,
+                    "StudyDescription": _BRAIN_MRI_SCAN,
+                    "PatientID": _PATIENT_ID,
+                    "StudyDate": "20240102",
+                },
+                True,
+                id="first-condition",
+            ),
+            # PatientID is missing, so not exists() is True
+            pytest.param(
+                {
+                    "PatientName": _JANE,
+                    "StudyDescription": _CT_SCAN,
+                    "StudyDate": _STUDY_DATE,
+                },
+                True,
+                id="second-condition",
+            ),
+            pytest.param(
+                {
+                    "PatientName": _JOHN,
+                    "StudyDescription": "Spine MRI",
+                    "StudyDate": _STUDY_DATE,
+                },
+                True,
+                id="both-conditions",
+            ),
+            pytest.param(
+                {
+                    "PatientName": _JANE,  # Not John
+                    "StudyDescription": _CT_SCAN,  # No MRI
+                    "PatientID": _PATIENT_ID,  # Exists (so not exists() = False)
+                    "StudyDate": "20240102",  # Wrong date
+                },
+                False,
+                id="neither-condition",
+            ),
+        ],
+        indirect=["dataset"],
+    )
+    def test_mixed_functions_with_complex_logic(self, dataset, expected):
         """Test complex expression mixing all three functions with various operators.
 
         Requirements: 4.1, 4.2, 4.3, 4.4
         """
-        expression = (
+        criterion = Criterion(
             "(PatientName.equals('John') and "
             "StudyDescription.contains('MRI')) or "
             "(not PatientID.exists() and StudyDate.equals('20240101'))"
         )
-        criterion = Criterion(expression)
-
-        # Test case 1: First complex condition satisfied
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-        dataset1.StudyDescription = "Brain MRI scan"
-        dataset1.PatientID = "12345"
-        dataset1.StudyDate = "20240102"
-
-        assert criterion.evaluate(dataset1) is True
-
-        # Test case 2: Second complex condition satisfied (no
-        # PatientID and correct date)
-        dataset2 = Dataset()
-        dataset2.PatientName = "Jane"
-        dataset2.StudyDescription = "CT scan"
-        # PatientID is missing (not exists() = True)
-        dataset2.StudyDate = "20240101"
-
-        assert criterion.evaluate(dataset2) is True
-
-        # Test case 3: Both conditions satisfied
-        dataset3 = Dataset()
-        dataset3.PatientName = "John"
-        dataset3.StudyDescription = "Spine MRI"
-        # PatientID is missing
-        dataset3.StudyDate = "20240101"
-
-        assert criterion.evaluate(dataset3) is True
-
-        # Test case 4: Neither condition satisfied
-        dataset4 = Dataset()
-        dataset4.PatientName = "Jane"  # Not John
-        dataset4.StudyDescription = "CT scan"  # No MRI
-        dataset4.PatientID = "12345"  # Exists (so not exists() = False)
-        dataset4.StudyDate = "20240102"  # Wrong date
-
-        assert criterion.evaluate(dataset4) is False
-
-    def test_function_combinations_with_same_attribute(self):
+        assert criterion.evaluate(dataset) is expected
+
+    @pytest.mark.parametrize(
+        "dataset, expected",
+        [
+            pytest.param({"PatientName": _JOHN}, True, id="equals"),
+            pytest.param({"PatientName": "Jane Doe"}, True, id="contains"),
+            pytest.param({"PatientName": "Bob Smith"}, False, id="neither"),
+            pytest.param(
+                {"StudyDescription": "Some study"}, False, id="missing-attribute"
+            ),
+        ],
+        indirect=["dataset"],
+    )
+    def test_function_combinations_with_same_attribute(self, dataset, expected):
         """Test multiple functions applied to the same DICOM attribute.
 
         Requirements: 4.1, 4.2
         """
-        expression = (
+        criterion = Criterion(
             "PatientName.exists() and (PatientName.equals('John')"
             " or PatientName.contains('Doe'))"
         )
-        criterion = Criterion(expression)
-
-        # Test case 1: PatientName exists and equals 'John'
-        dataset1 = Dataset()
-        dataset1.PatientName = "John"
-
-        assert criterion.evaluate(dataset1) is True
-
-        # Test case 2: PatientName exists and contains 'Doe'
-        dataset2 = Dataset()
-        dataset2.PatientName = "Jane Doe"
-
-        assert criterion.evaluate(dataset2) is True
-
-        # Test case 3: PatientName exists but matches neither condition
-        dataset3 = Dataset()
-        dataset3.PatientName = "Bob Smith"
-
-        assert criterion.evaluate(dataset3) is False
-
-        # Test case 4: PatientName doesn't exist
-        dataset4 = Dataset()
-        dataset4.StudyDescription = "Some study"
-        # PatientName is missing
-
-        assert criterion.evaluate(dataset4) is False
-
-
-class TestComprehensiveErrorHandling:
-    """Test error handling across the entire evaluation chain."""
-
-    def test_expression_parse_errors(self):
-        """Test various expression parsing errors.
-
-        Requirements: 3.4
-        """
-        # Test invalid boolean syntax
-        with pytest.raises(ExpressionParseError) as exc_info:
-            Criterion("PatientName.equals('John') and and StudyID.exists()")
-        assert "Failed to parse boolean expression" in str(exc_info.value)
-
-        # Test mismatched parentheses
-        with pytest.raises(ExpressionParseError) as exc_info:
-            Criterion("(PatientName.equals('John') and StudyID.exists()")
-        assert "Failed to parse boolean expression" in str(exc_info.value)
-
-        # Test empty expression
-        with pytest.raises(ExpressionParseError) as exc_info:
-            Criterion("")
-        assert "No valid DICOM symbols found" in str(exc_info.value)
-
-        # Test expression with no valid DICOM symbols
-        with pytest.raises(ExpressionParseError) as exc_info:
-            Criterion("true and false")
-        assert "No valid DICOM symbols found" in str(exc_info.value)
-
-    def test_symbol_parse_errors(self):
-        """Test DICOM symbol parsing errors.
-
-        Requirements: 3.4
-        """
-        # Test unregistered function
-        with pytest.raises(SymbolParseError) as exc_info:
-            Criterion("PatientName.unknown_function('test')")
-        assert "Function 'unknown_function' is not registered" in str(exc_info.value)
-
-        # Test invalid symbol format (missing parentheses)
-        with pytest.raises(ExpressionParseError) as exc_info:
-            Criterion("PatientName.equals")
-        assert "No valid DICOM symbols found" in str(exc_info.value)
-
-        # Test invalid attribute name - this actually gets parsed as a valid symbol
-        # but would fail during evaluation, so let's test a truly invalid format
-        with pytest.raises(ExpressionParseError) as exc_info:
-            Criterion("invalid_format_without_dot")
-        assert "No valid DICOM symbols found" in str(exc_info.value)
-
-    def test_evaluation_errors_with_invalid_datasets(self):
-        """Test evaluation errors with invalid or problematic datasets.
-
-        Requirements: 3.4
-        """
-        criterion = Criterion("PatientName.equals('John')")
-
-        # Test with None dataset
-        with pytest.raises(EvaluationError):
-            criterion.evaluate(None)
-
-        # Test with dataset that raises errors on attribute access
-        class ProblematicDataset:
-            def __getattr__(self, name):
-                raise ValueError(f"Cannot access attribute {name}")
-
-        with pytest.raises(EvaluationError):
-            criterion.evaluate(ProblematicDataset())
-
-    def test_error_propagation_in_complex_expressions(self):
-        """Test that errors propagate correctly in complex expressions.
-
-        Requirements: 3.4
-        """
-        # Create a complex expression
-        expression = (
-            "(PatientName.equals('John') and "
-            "StudyDescription.contains('MRI')) or PatientID.exists()"
-        )
-        criterion = Criterion(expression)
-
-        # Test error propagation with invalid dataset
-        with pytest.raises(EvaluationError) as exc_info:
-            criterion.evaluate(None)
-
-        # Verify error message contains context about the expression
-        assert "Failed to evaluate expression against dataset" in str(exc_info.value)
-
-    def test_meaningful_error_messages(self):
-        """Test that error messages are meaningful and helpful.
-
-        Requirements: 3.4
-        """
-        # Test expression parse error message
-        try:
-            Criterion("PatientName.equals('John') and and StudyID.exists()")
-        except ExpressionParseError as e:
-            assert "Failed to parse boolean expression" in str(e)
-            assert "PatientName.equals('John') and and StudyID.exists()" in str(e)
-
-        # Test symbol parse error message
-        try:
-            Criterion("PatientName.unknown_function('test')")
-        except SymbolParseError as e:
-            assert "Function 'unknown_function' is not registered" in str(e)
-            assert "PatientName.unknown_function" in str(e)
-
-        # Test evaluation error message
-        criterion = Criterion("PatientName.equals('John')")
-        try:
-            criterion.evaluate(None)
-        except EvaluationError as e:
-            assert "Failed to evaluate expression against dataset" in str(e)
-            assert "PatientName.equals('John')" in str(e)
+        assert criterion.evaluate(dataset) is expected
 
 
 class TestRealWorldScenarios:
     """Test realistic DICOM validation scenarios."""
 
-    def test_patient_privacy_validation(self):
+    # Ensure patient is not anonymous and has required identifiers
+    PRIVACY_EXPRESSION = (
+        "not (PatientName.equals('Anonymous') or "
+        "PatientName.equals('') or PatientName.contains('UNKNOWN')) "
+        "and PatientID.exists() and PatientBirthDate.exists()"
+    )
+
+    # Ensure study has proper description and is not a test/phantom study
+    STUDY_QUALITY_EXPRESSION = (
+        "StudyDescription.exists() and "
+        "not (StudyDescription.contains('TEST') or "
+        "StudyDescription.contains('PHANTOM') or "
+        "StudyDescription.contains('QA')) and "
+        "(StudyDescription.contains('MRI') or "
+        "StudyDescription.contains('CT') or "
+        "StudyDescription.contains('X-RAY'))"
+    )
+
+    # Emergency studies: either marked as STAT/EMERGENCY or patient
+    # name indicates emergency
+    EMERGENCY_EXPRESSION = (
+        "(StudyDescription.contains('STAT') or "
+        "StudyDescription.contains('EMERGENCY') or "
+        "PatientName.contains('EMERGENCY')) and not "
+        "StudyDescription.contains('TEST')"
+    )
+
+    def test_patient_privacy_validation(self, privacy_criterion):
         """Test validation for patient privacy requirements.
 
         Requirements: 4.1, 4.2, 4.3, 4.4
         """
-        # Ensure patient is not anonymous and has required identifiers
-        expression = (
-            "not (PatientName.equals('Anonymous') or "
-            "PatientName.equals('') or PatientName.contains('UNKNOWN')) "
-            "and PatientID.exists() and PatientBirthDate.exists()"
-        )
-        criterion = Criterion(expression)
+        criterion = privacy_criterion
 
         # Test case 1: Valid patient with all required info
-        dataset1 = Dataset()
-        dataset1.PatientName = "John Doe"
-        dataset1.PatientID = "12345"
-        dataset1.PatientBirthDate = "19800101"
+        dataset1 = _ds(
+            PatientName=_JOHN_DOE,
+            PatientID=_PATIENT_ID,
+            PatientBirthDate="19800101",
+        )
 
         assert criterion.evaluate(dataset1) is True
 
         # Test case 2: Anonymous patient (should fail)
-        dataset2 = Dataset()
-        dataset2.PatientName = "Anonymous"
-        dataset2.PatientID = "12345"
-        dataset2.PatientBirthDate = "19800101"
+        dataset2 = _ds(
+            PatientName=_ANONYMOUS,
+            PatientID=_PATIENT_ID,
+            PatientBirthDate="19800101",
+        )
 
         assert criterion.evaluate(dataset2) is False
 
         # Test case 3: Missing PatientID (should fail)
-        dataset3 = Dataset()
-        dataset3.PatientName = "John Doe"
-        dataset3.PatientBirthDate = "19800101"
-        # PatientID is missing
+        dataset3 = _ds(
+            PatientName=_JOHN_DOE,
+            PatientBirthDate="19800101",
+            # PatientID is missing
+        )
 
         assert criterion.evaluate(dataset3) is False
 
-    def test_study_quality_validation(self):
+    def test_study_quality_validation(self, study_quality_criterion):
         """Test validation for study quality requirements.
 
         Requirements: 4.1, 4.2, 4.4
         """
-        # Ensure study has proper description and is not a test/phantom study
-        expression = (
-            "StudyDescription.exists() and "
-            "not (StudyDescription.contains('TEST') or "
-            "StudyDescription.contains('PHANTOM') or "
-            "StudyDescription.contains('QA')) and "
-            "(StudyDescription.contains('MRI') or "
-            "StudyDescription.contains('CT') or "
-            "StudyDescription.contains('X-RAY'))"
-        )
-        criterion = Criterion(expression)
+        criterion = study_quality_criterion
 
         # Test case 1: Valid MRI study
-        dataset1 = Dataset()
-        dataset1.StudyDescription = "Brain MRI with contrast"
+        dataset1 = _ds(StudyDescription=_BRAIN_MRI_CONTRAST)
 
         assert criterion.evaluate(dataset1) is True
 
         # Test case 2: Valid CT study
-        dataset2 = Dataset()
-        dataset2.StudyDescription = "Chest CT without contrast"
+        dataset2 = _ds(StudyDescription="Chest CT without contrast")
 
         assert criterion.evaluate(dataset2) is True
 
         # Test case 3: Test study (should fail)
-        dataset3 = Dataset()
-        dataset3.StudyDescription = "TEST Brain MRI"
+        dataset3 = _ds(StudyDescription="TEST Brain MRI")
 
         assert criterion.evaluate(dataset3) is False
 
         # Test case 4: Phantom study (should fail)
-        dataset4 = Dataset()
-        dataset4.StudyDescription = "PHANTOM QA study"
+        dataset4 = _ds(StudyDescription="PHANTOM QA study")
 
         assert criterion.evaluate(dataset4) is False
 
         # Test case 5: Unsupported modality (should fail)
-        dataset5 = Dataset()
-        dataset5.StudyDescription = "Ultrasound examination"
+        dataset5 = _ds(StudyDescription="Ultrasound examination")
 
         assert criterion.evaluate(dataset5) is False
 
-    def test_emergency_study_validation(self):
+    def test_emergency_study_validation(self, emergency_criterion):
         """Test validation for emergency study processing.
 
         Requirements: 4.1, 4.2, 4.3, 4.4
         """
-        # Emergency studies: either marked as STAT/EMERGENCY or patient
-        # name indicates emergency
-        expression = (
-            "(StudyDescription.contains('STAT') or "
-            "StudyDescription.contains('EMERGENCY') or "
-            "PatientName.contains('EMERGENCY')) and not "
-            "StudyDescription.contains('TEST')"
-        )
-        criterion = Criterion(expression)
+        criterion = emergency_criterion
 
         # Test case 1: STAT study
-        dataset1 = Dataset()
-        dataset1.StudyDescription = "STAT Brain CT"
-        dataset1.PatientName = "John Doe"
+        dataset1 = _ds(StudyDescription="STAT Brain CT", PatientName=_JOHN_DOE)
 
         assert criterion.evaluate(dataset1) is True
 
         # Test case 2: Emergency patient
-        dataset2 = Dataset()
-        dataset2.StudyDescription = "Brain MRI"
-        dataset2.PatientName = "EMERGENCY Patient"
+        dataset2 = _ds(StudyDescription="Brain MRI", PatientName=_EMERGENCY_PATIENT)
 
         assert criterion.evaluate(dataset2) is True
 
         # Test case 3: Emergency study description
-        dataset3 = Dataset()
-        dataset3.StudyDescription = "EMERGENCY Chest X-ray"
-        dataset3.PatientName = "Jane Smith"
+        dataset3 = _ds(
+            StudyDescription="EMERGENCY Chest X-ray", PatientName="Jane Smith"
+        )
 
         assert criterion.evaluate(dataset3) is True
 
         # Test case 4: Test emergency study (should fail due to TEST exclusion)
-        dataset4 = Dataset()
-        dataset4.StudyDescription = "STAT TEST Brain CT"
-        dataset4.PatientName = "John Doe"
+        dataset4 = _ds(StudyDescription="STAT TEST Brain CT", PatientName=_JOHN_DOE)
 
         assert criterion.evaluate(dataset4) is False
 
         # Test case 5: Regular study (should fail)
-        dataset5 = Dataset()
-        dataset5.StudyDescription = "Routine Brain MRI"
-        dataset5.PatientName = "John Doe"
+        dataset5 = _ds(StudyDescription="Routine Brain MRI", PatientName=_JOHN_DOE)
 
         assert criterion.evaluate(dataset5) is False
 
 
+@pytest.fixture(scope="class")
+def privacy_criterion():
+    """Privacy criterion, parsed once for TestRealWorldScenarios."""
+    return Criterion(TestRealWorldScenarios.PRIVACY_EXPRESSION)
+
+
+@pytest.fixture(scope="class")
+def study_quality_criterion():
+    """Study quality criterion, parsed once for TestRealWorldScenarios."""
+    return Criterion(TestRealWorldScenarios.STUDY_QUALITY_EXPRESSION)
+
+
+@pytest.fixture(scope="class")
+def emergency_criterion():
+    """Emergency criterion, parsed once for TestRealWorldScenarios."""
+    return Criterion(TestRealWorldScenarios.EMERGENCY_EXPRESSION)
+
+
 class TestUsageExamples:
     """Integration tests that serve as comprehensive usage examples.
 
@@ -794,47 +720,36 @@ class TestUsageExamples:
         Requirements: 1.1, 2.1, 2.2, 2.3, 3.1, 3.2
         """
         # Create a sample dataset
-        dataset = Dataset()
-        dataset.PatientName = "John Doe"
-        dataset.PatientID = "12345"
-        dataset.StudyDescription = "Brain MRI with contrast"
-        dataset.StudyDate = "20240101"
-
-        # Example 1: Simple equality check
-        criterion = Criterion("PatientName.equals('John Doe')")
-        assert criterion.evaluate(dataset) is True
-
-        # Example 2: Case-insensitive equality
-        criterion = Criterion("PatientName.equals('john doe')")
-        assert criterion.evaluate(dataset) is True
-
-        # Example 3: Substring matching
-        criterion = Criterion("StudyDescription.contains('MRI')")
-        assert criterion.evaluate(dataset) is True
-
-        # Example 4: Attribute existence check
-        criterion = Criterion("PatientID.exists()")
-        assert criterion.evaluate(dataset) is True
-
-        # Example 5: Non-existing attribute
-        criterion = Criterion("SeriesDescription.exists()")
-        assert criterion.evaluate(dataset) is False
-
-        # Example 6: Boolean combination with AND
-        criterion = Criterion(
-            "PatientName.equals('John Doe') and StudyDescription.contains('MRI')"
+        dataset = _ds(
+            PatientName=_JOHN_DOE,
+            PatientID=_PATIENT_ID,
+            StudyDescription=_BRAIN_MRI_CONTRAST,
+            StudyDate=_STUDY_DATE,
         )
-        assert criterion.evaluate(dataset) is True
 
-        # Example 7: Boolean combination with OR
-        criterion = Criterion(
-            "StudyDescription.contains('CT') or StudyDescription.contains('MRI')"
-        )
-        assert criterion.evaluate(dataset) is True
+        expressions = [
+            # Example 1: Simple equality check
+            "PatientName.equals('John Doe')",
+            # Example 2: Case-insensitive equality
+            "PatientName.equals('john doe')",
+            # Example 3: Substring matching
+            "StudyDescription.contains('MRI')",
+            # Example 4: Attribute existence check
+            "PatientID.exists()",
+            # Example 5: Non-existing attribute
+            "SeriesDescription.exists()",
+            # Example 6: Boolean combination with AND
+            "PatientName.equals('John Doe') and StudyDescription.contains('MRI')",
+            # Example 7: Boolean combination with OR
+            "StudyDescription.contains('CT') or StudyDescription.contains('MRI')",
+            # Example 8: NOT operator
+            "not PatientName.equals('Anonymous')",
+        ]
 
-        # Example 8: NOT operator
-        criterion = Criterion("not PatientName.equals('Anonymous')")
-        assert criterion.evaluate(dataset) is True
+        # Evaluate all examples against the dataset at once
+        examples = CriterionSet({expression: expression for expression in expressions})
+        results = list(examples.evaluate_all(dataset).values())
+        assert results == [True, True, True, True, False, True, True, True]
 
     def test_medical_imaging_workflow_examples(self):
         """Test real-world medical imaging workflow scenarios.
@@ -844,27 +759,30 @@ class TestUsageExamples:
         # Create different types of medical datasets
 
         # Regular clinical study
-        clinical_dataset = Dataset()
-        clinical_dataset.PatientName = "John Smith"
-        clinical_dataset.PatientID = "HOSP12345"
-        clinical_dataset.PatientBirthDate = "19800101"
-        clinical_dataset.StudyDescription = "Brain MRI without contrast"
-        clinical_dataset.Modality = "MR"
-        clinical_dataset.InstitutionName = "General Hospital"
+        clinical_dataset = _ds(
+            PatientName="John Smith",
+            PatientID="HOSP12345",
+            PatientBirthDate="19800101",
+            StudyDescription="Brain MRI without contrast",
+            Modality="MR",
+            InstitutionName="General Hospital",
+        )
 
         # Emergency study
-        emergency_dataset = Dataset()
-        emergency_dataset.PatientName = "EMERGENCY Patient"
-        emergency_dataset.PatientID = "EMRG999"
-        emergency_dataset.StudyDescription = "STAT Head CT - Trauma"
-        emergency_dataset.Modality = "CT"
+        emergency_dataset = _ds(
+            PatientName=_EMERGENCY_PATIENT,
+            PatientID="EMRG999",
+            StudyDescription="STAT Head CT - Trauma",
+            Modality="CT",
+        )
 
         # Test/QA study
-        qa_dataset = Dataset()
-        qa_dataset.PatientName = "PHANTOM Test"
-        qa_dataset.PatientID = "QA001"
-        qa_dataset.StudyDescription = "Daily QA TEST - Phantom"
-        qa_dataset.Modality = "MR"
+        qa_dataset = _ds(
+            PatientName="PHANTOM Test",
+            PatientID="QA001",
+            StudyDescription="Daily QA TEST - Phantom",
+            Modality="MR",
+        )
 
         # Example 1: Patient privacy validation
         privacy_rule = """
@@ -921,27 +839,30 @@ class TestUsageExamples:
         Requirements: 1.1, 2.1, 2.2, 2.3, 3.1, 3.2
         """
         # Complete dataset with all required fields
-        complete_dataset = Dataset()
-        complete_dataset.PatientName = "Jane Doe"
-        complete_dataset.PatientID = "HOSP67890"
-        complete_dataset.PatientBirthDate = "19750615"
-        complete_dataset.StudyDescription = "Chest CT with contrast"
-        complete_dataset.StudyDate = "20240101"
-        complete_dataset.StudyTime = "143000"
-        complete_dataset.Modality = "CT"
-        complete_dataset.InstitutionName = "Medical Center"
+        complete_dataset = _ds(
+            PatientName="Jane Doe",
+            PatientID="HOSP67890",
+            PatientBirthDate="19750615",
+            StudyDescription="Chest CT with contrast",
+            StudyDate=_STUDY_DATE,
+            StudyTime="143000",
+            Modality="CT",
+            InstitutionName="Medical Center",
+        )
 
         # Incomplete dataset missing critical fields
-        incomplete_dataset = Dataset()
-        incomplete_dataset.StudyDescription = "Some study"
-        incomplete_dataset.Modality = "MR"
-        # Missing PatientName, PatientID, etc.
+        incomplete_dataset = _ds(
+            StudyDescription="Some study",
+            Modality="MR",
+            # Missing PatientName, PatientID, etc.
+        )
 
         # Anonymous dataset
-        anonymous_dataset = Dataset()
-        anonymous_dataset.PatientName = "Anonymous"
-        anonymous_dataset.StudyDescription = "Research study"
-        anonymous_dataset.Modality = "MR"
+        anonymous_dataset = _ds(
+            PatientName=_ANONYMOUS,
+            StudyDescription="Research study",
+            Modality="MR",
+        )
 
         # Example 1: Minimum required fields validation
         minimum_fields_rule = """
@@ -995,39 +916,42 @@ class TestUsageExamples:
         datasets = []
 
         # Adult MRI study
-        adult_mri = Dataset()
-        adult_mri.PatientName = "Adult Patient"
-        adult_mri.PatientAge = "045Y"
-        adult_mri.StudyDescription = "Brain MRI without contrast"
-        adult_mri.Modality = "MR"
-        adult_mri.BodyPartExamined = "BRAIN"
+        adult_mri = _ds(
+            PatientName="Adult Patient",
+            PatientAge="045Y",
+            StudyDescription="Brain MRI without contrast",
+            Modality="MR",
+            BodyPartExamined="BRAIN",
+        )
         datasets.append(("Adult MRI", adult_mri))
 
         # Pediatric CT study
-        pediatric_ct = Dataset()
-        pediatric_ct.PatientName = "Child Patient"
-        pediatric_ct.PatientAge = "012Y"
-        pediatric_ct.StudyDescription = "Chest CT with contrast"
-        pediatric_ct.Modality = "CT"
-        pediatric_ct.BodyPartExamined = "CHEST"
+        pediatric_ct = _ds(
+            PatientName="Child Patient",
+            PatientAge="012Y",
+            StudyDescription="Chest CT with contrast",
+            Modality="CT",
+            BodyPartExamined="CHEST",
+        )
         datasets.append(("Pediatric CT", pediatric_ct))
 
         # Cardiac MRI study
-        cardiac_mri = Dataset()
-        cardiac_mri.PatientName = "Cardiac Patient"
-        cardiac_mri.PatientAge = "055Y"
-        cardiac_mri.StudyDescription = "Cardiac MRI with gadolinium"
-        cardiac_mri.Modality = "MR"
-        cardiac_mri.BodyPartExamined = "HEART"
+        cardiac_mri = _ds(
+            PatientName="Cardiac Patient",
+            PatientAge="055Y",
+            StudyDescription="Cardiac MRI with gadolinium",
+            Modality="MR",
+            BodyPartExamined="HEART",
+        )
         datasets.append(("Cardiac MRI", cardiac_mri))
+        names = [name for name, _ in datasets]
+        studies = [dataset for _, dataset in datasets]
 
         # Example 1: Filter for MRI studies only
         mri_filter = "Modality.equals('MR')"
         criterion = Criterion(mri_filter)
 
-        mri_results = [
-            (name, criterion.evaluate(dataset)) for name, dataset in datasets
-        ]
+        mri_results = list(zip(names, criterion.evaluate_many(studies)))
         expected_mri = [
             ("Adult MRI", True),
             ("Pediatric CT", False),
@@ -1042,9 +966,7 @@ class TestUsageExamples:
         """
         criterion = Criterion(brain_filter)
 
-        brain_results = [
-            (name, criterion.evaluate(dataset)) for name, dataset in datasets
-        ]
+        brain_results = list(zip(names, criterion.evaluate_many(studies)))
         expected_brain = [
             ("Adult MRI", True),
             ("Pediatric CT", False),
@@ -1059,9 +981,7 @@ class TestUsageExamples:
         """
         criterion = Criterion(contrast_filter)
 
-        contrast_results = [
-            (name, criterion.evaluate(dataset)) for name, dataset in datasets
-        ]
+        contrast_results = list(zip(names, criterion.evaluate_many(studies)))
         expected_contrast = [
             ("Adult MRI", False),
             ("Pediatric CT", True),
@@ -1078,9 +998,7 @@ class TestUsageExamples:
         """
         criterion = Criterion(complex_filter)
 
-        complex_results = [
-            (name, criterion.evaluate(dataset)) for name, dataset in datasets
-        ]
+        complex_results = list(zip(names, criterion.evaluate_many(studies)))
         expected_complex = [
             ("Adult MRI", True),
             ("Pediatric CT", True),
@@ -1093,9 +1011,7 @@ class TestUsageExamples:
 
         Requirements: 3.4
         """
-        dataset = Dataset()
-        dataset.PatientName = "Test Patient"
-        dataset.StudyDescription = "Test Study"
+        dataset = _ds(PatientName="Test Patient", StudyDescription="Test Study")
 
         # Example 1: Handling expression parse errors
         invalid_expressions = [
@@ -1109,6 +1025,12 @@ class TestUsageExamples:
             with pytest.raises(ExpressionParseError):
                 Criterion(expression)
 
+        # Validating many expressions without raising
+        for expression in invalid_expressions:
+            criterion, error = Criterion.try_parse(expression)
+            assert criterion is None
+            assert isinstance(error, ExpressionParseError)
+
         # Example 2: Handling symbol parse errors
         invalid_symbols = [
             "PatientName.unknown_function('test')",  # Unknown function
@@ -1118,6 +1040,9 @@ class TestUsageExamples:
         for expression in invalid_symbols:
             with pytest.raises((SymbolParseError, ExpressionParseError)):
                 Criterion(expression)
+            criterion, error = Criterion.try_parse(expression)
+            assert criterion is None
+            assert isinstance(error, (SymbolParseError, ExpressionParseError))
 
         # Example 3: Handling evaluation errors
         criterion = Criterion("PatientName.equals('Test')")
@@ -1144,11 +1069,12 @@ class TestUsageExamples:
         # Create multiple datasets for performance testing
         datasets = []
         for i in range(10):
-            dataset = Dataset()
-            dataset.PatientName = f"Patient {i}"
-            dataset.PatientID = f"ID{i: 03d}"
-            dataset.StudyDescription = f"Study {i} - {'MRI' if i % 2 == 0 else 'CT'}"
-            dataset.Modality = "MR" if i % 2 == 0 else "CT"
+            dataset = _ds(
+                PatientName=f"Patient {i}",
+                PatientID=f"ID{i: 03d}",
+                StudyDescription=f"Study {i} - {'MRI' if i % 2 == 0 else 'CT'}",
+                Modality="MR" if i % 2 == 0 else "CT",
+            )
             datasets.append(dataset)
 
         # Example 1: Reusing compiled criterion for multiple evaluations
@@ -1156,10 +1082,7 @@ class TestUsageExamples:
             "PatientName.exists() and StudyDescription.contains('MRI')"
         )
 
-        results = []
-        for dataset in datasets:
-            result = criterion.evaluate(dataset)
-            results.append(result)
+        results = criterion.evaluate_many(datasets)
 
         # Should have True for even indices (MRI studies), False for odd (CT studies)
         expected = [True if i % 2 == 0 else False for i in range(10)]
@@ -1174,7 +1097,7 @@ class TestUsageExamples:
         """
         )
 
-        complex_results = [complex_criterion.evaluate(x) for x in datasets]
+        complex_results = complex_criterion.evaluate_many(datasets)
         # All should be True since all datasets have the required fields
         # and contain MRI or CT
         assert all(complex_results)
@@ -1187,18 +1110,13 @@ class TestUsageExamples:
             "is_ct": "StudyDescription.contains('CT') or Modality.equals('CT')",
         }
 
-        # Pre-compile all criteria
-        compiled_criteria = {
-            name: Criterion(rule) for name, rule in validation_rules.items()
-        }
+        # Pre-compile all criteria into a set sharing their common symbols
+        criterion_set = CriterionSet(
+            {name: Criterion(rule) for name, rule in validation_rules.items()}
+        )
 
-        # Batch evaluate
-        batch_results = []
-        for _i, dataset in enumerate(datasets):
-            dataset_results = {}
-            for rule_name, criterion in compiled_criteria.items():
-                dataset_results[rule_name] = criterion.evaluate(dataset)
-            batch_results.append(dataset_results)
+        # Batch evaluate, evaluating each distinct symbol once per dataset
+        batch_results = [criterion_set.evaluate_all(dataset) for dataset in datasets]
 
         # Verify results
         for i, results in enumerate(batch_results):
@@ -1206,3 +1124,44 @@ class TestUsageExamples:
             assert results["has_study_info"] is True
             assert results["is_mri"] == (i % 2 == 0)  # Even indices are MRI
             assert results["is_ct"] == (i % 2 == 1)  # Odd indices are CT
+
+
+class _MockDataset(SimpleNamespace):
+    """Stand-in for pydicom.Dataset with plain attribute access.
+
+    Supports the access the built-in functions make on objects other than
+    pydicom Datasets: getattr/hasattr with an attribute keyword and 'in'.
+    """
+
+    def __contains__(self, keyword: object) -> bool:
+        return isinstance(keyword, str) and hasattr(self, keyword)
+
+
+class TestNonPydicomDatasets:
+    """Test that objects read by keyword evaluate like pydicom Datasets."""
+
+    ATTRIBUTES = {
+        "PatientName": _JOHN_DOE,
+        "PatientID": _PATIENT_ID,
+        "StudyDescription": _BRAIN_MRI_CONTRAST,
+        "StudyDate": _STUDY_DATE,
+    }
+
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("PatientName.equals('john doe')", True),
+            ("StudyDescription.contains('mri') and PatientID.exists()", True),
+            ("StudyDescription.contains('CT') or SeriesDescription.exists()", False),
+            (
+                "not PatientName.equals('Anonymous') and StudyDate.equals('20240101')",
+                True,
+            ),
+            ("Modality.equals('MR') or not PatientBirthDate.exists()", True),
+        ],
+    )
+    def test_mock_dataset_matches_pydicom(self, expression, expected):
+        """Test that a mock dataset evaluates like the real pydicom Dataset."""
+        criterion = Criterion(expression)
+        assert criterion.evaluate(_ds(**self.ATTRIBUTES)) is expected
+        assert criterion.evaluate(_MockDataset(**self.ATTRIBUTES)) is expected
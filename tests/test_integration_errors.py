@@ -0,0 +1,131 @@
+"""Integration tests for error handling of the DICOM Criterion class.
+
+These tests exercise the error paths across the entire evaluation chain. They
+are kept apart from the tests in test_integration.py and marked 'errors', so
+they can be deselected with ``pytest -m "not errors"``.
+"""
+
+import pytest
+
+from dicomcriterion import (
+    Criterion,
+    ExpressionParseError,
+    SymbolParseError,
+    EvaluationError,
+)
+
+
+@pytest.mark.errors
+class TestComprehensiveErrorHandling:
+    """Test error handling across the entire evaluation chain."""
+
+    def test_expression_parse_errors(self):
+        """Test various expression parsing errors.
+
+        Requirements: 3.4
+        """
+        # Test invalid boolean syntax
+        with pytest.raises(ExpressionParseError) as exc_info:
+            Criterion("PatientName.equals('John') and and StudyID.exists()")
+        assert "Failed to parse boolean expression" in str(exc_info.value)
+
+        # Test mismatched parentheses
+        with pytest.raises(ExpressionParseError) as exc_info:
+            Criterion("(PatientName.equals('John') and StudyID.exists()")
+        assert "Failed to parse boolean expression" in str(exc_info.value)
+
+        # Test empty expression
+        with pytest.raises(ExpressionParseError) as exc_info:
+            Criterion("")
+        assert "No valid DICOM symbols found" in str(exc_info.value)
+
+        # Test expression with no valid DICOM symbols
+        with pytest.raises(ExpressionParseError) as exc_info:
+            Criterion("true and false")
+        assert "No valid DICOM symbols found" in str(exc_info.value)
+
+    def test_symbol_parse_errors(self):
+        """Test DICOM symbol parsing errors.
+
+        Requirements: 3.4
+        """
+        # Test unregistered function
+        with pytest.raises(SymbolParseError) as exc_info:
+            Criterion("PatientName.unknown_function('test')")
+        assert "Function 'unknown_function' is not registered" in str(exc_info.value)
+
+        # Test invalid symbol format (missing parentheses)
+        with pytest.raises(ExpressionParseError) as exc_info:
+            Criterion("PatientName.equals")
+        assert "No valid DICOM symbols found" in str(exc_info.value)
+
+        # Test invalid attribute name - this actually gets parsed as a valid symbol
+        # but would fail during evaluation, so let's test a truly invalid format
+        with pytest.raises(ExpressionParseError) as exc_info:
+            Criterion("invalid_format_without_dot")
+        assert "No valid DICOM symbols found" in str(exc_info.value)
+
+    def test_evaluation_errors_with_invalid_datasets(self):
+        """Test evaluation errors with invalid or problematic datasets.
+
+        Requirements: 3.4
+        """
+        criterion = Criterion("PatientName.equals('John')")
+
+        # Test with None dataset
+        with pytest.raises(EvaluationError):
+            criterion.evaluate(None)
+
+        # Test with dataset that raises errors on attribute access
+        class ProblematicDataset:
+            def __getattr__(self, name):
+                raise ValueError(f"Cannot access attribute {name}")
+
+        with pytest.raises(EvaluationError):
+            criterion.evaluate(ProblematicDataset())
+
+    def test_error_propagation_in_complex_expressions(self):
+        """Test that errors propagate correctly in complex expressions.
+
+        Requirements: 3.4
+        """
+        # Create a complex expression
+        expression = (
+            "(PatientName.equals('John') and "
+            "StudyDescription.contains('MRI')) or PatientID.exists()"
+        )
+        criterion = Criterion(expression)
+
+        # Test error propagation with invalid dataset
+        with pytest.raises(EvaluationError) as exc_info:
+            criterion.evaluate(None)
+
+        # Verify error message contains context about the expression
+        assert "Failed to evaluate expression against dataset" in str(exc_info.value)
+
+    def test_meaningful_error_messages(self):
+        """Test that error messages are meaningful and helpful.
+
+        Requirements: 3.4
+        """
+        # Test expression parse error message
+        try:
+            Criterion("PatientName.equals('John') and and StudyID.exists()")
+        except ExpressionParseError as e:
+            assert "Failed to parse boolean expression" in str(e)
+            assert "PatientName.equals('John') and and StudyID.exists()" in str(e)
+
+        # Test symbol parse error message
+        try:
+            Criterion("PatientName.unknown_function('test')")
+        except SymbolParseError as e:
+            assert "Function 'unknown_function' is not registered" in str(e)
+            assert "PatientName.unknown_function" in str(e)
+
+        # Test evaluation error message
+        criterion = Criterion("PatientName.equals('John')")
+        try:
+            criterion.evaluate(None)
+        except EvaluationError as e:
+            assert "Failed to evaluate expression against dataset" in str(e)
+            assert "PatientName.equals('John')" in str(e)
@@ -1,11 +1,51 @@
 """Tests for DICOM symbol parsing and conversion."""
 
+import pickle
+import sys
+
 import pytest
 import pydicom
-from boolean import Symbol
+from boolean import BooleanAlgebra, Symbol
 
 from dicomcriterion import DicomSymbol, SymbolParseError, EvaluationError
-from dicomcriterion.functions import FunctionRegistry, EqualsFunction
+from dicomcriterion.functions import (
+    ContainsFunction,
+    DicomFunction,
+    EqualsFunction,
+    ExistsFunction,
+    FunctionRegistry,
+)
+
+
+# Module-scoped datasets are shared between tests, which must not modify them.
+
+
+@pytest.fixture(scope="module")
+def sample_ds():
+    """Dataset for patient 'John Doe' with an MRI study."""
+    ds = pydicom.Dataset()
+    ds.PatientName = "John Doe"
+    ds.PatientID = "12345"
+    ds.StudyDescription = "MRI Brain"
+    ds.PatientAge = "025Y"
+    return ds
+
+
+@pytest.fixture(scope="module")
+def contrast_mri_ds():
+    """Dataset for patient 'John Doe' with a contrast MRI study."""
+    ds = pydicom.Dataset()
+    ds.PatientName = "John Doe"
+    ds.PatientID = "12345"
+    ds.StudyDescription = "MRI Brain with contrast"
+    ds.PatientAge = "045Y"
+    return ds
+
+
+@pytest.fixture(scope="module")
+def ba():
+    """Boolean algebra shared by the boolean.py integration tests."""
+    return BooleanAlgebra()
 
 
 class TestDicomSymbolParsing:
@@ -115,6 +155,35 @@ class TestDicomSymbolParsing:
         assert symbol.function == "contains"
         assert symbol.argument == "MRI - Brain with contrast"
 
+    def test_parse_reuses_parsed_symbols(self):
+        """Test that parsing the same string again returns the same symbol."""
+        symbol = DicomSymbol.parse("PatientName.equals('John Doe')")
+
+        assert DicomSymbol.parse("PatientName.equals('John Doe')") is symbol
+
+    def test_parse_subclass(self):
+        """Test that parsing through a subclass returns a subclass instance."""
+
+        class CustomSymbol(DicomSymbol):
+            pass
+
+        symbol = CustomSymbol.parse("PatientName.equals('John Doe')")
+
+        assert type(symbol) is CustomSymbol
+        assert type(DicomSymbol.parse("PatientName.equals('John Doe')")) is (
+            DicomSymbol
+        )
+
+    def test_names_are_interned(self):
+        """Test that attribute and function names are interned."""
+        attribute = "".join(["Patient", "Name"])
+        function = "".join(["equ", "als"])
+
+        symbol = DicomSymbol(attribute, function, "John Doe")
+
+        assert symbol.attribute is sys.intern("PatientName")
+        assert symbol.function is sys.intern("equals")
+
 
 class TestDicomSymbolBooleanConversion:
     """Test DicomSymbol to boolean.py Symbol conversion."""
@@ -152,6 +221,43 @@ class TestDicomSymbolBooleanConversion:
         assert str(bool_symbol1) != str(bool_symbol3)
         assert str(bool_symbol2) != str(bool_symbol3)
 
+    def test_to_boolean_symbol_reuses_symbols(self):
+        """Test that equal DICOM symbols share one boolean Symbol."""
+        symbol = DicomSymbol("PatientName", "equals", "John")
+
+        assert symbol.to_boolean_symbol() is symbol.to_boolean_symbol()
+        assert (
+            DicomSymbol("PatientName", "equals", "John").to_boolean_symbol()
+            is symbol.to_boolean_symbol()
+        )
+
+    def test_boolean_name_is_computed_on_creation(self):
+        """Test that the boolean Symbol name is stored on the symbol."""
+        symbol = DicomSymbol("PatientName", "equals", "John")
+
+        assert symbol._boolean_name == str(symbol.to_boolean_symbol())
+        assert symbol == DicomSymbol("PatientName", "equals", "John")
+        assert "_boolean_name" not in repr(symbol)
+
+    def test_boolean_name_with_non_string_argument(self):
+        """Test that symbols can be created with a non-string argument."""
+        symbol = DicomSymbol("PatientAge", "equals", 5)
+
+        assert str(symbol) == "PatientAge.equals(5)"
+        assert str(symbol.to_boolean_symbol()).startswith("PatientAge__equals__")
+
+    def test_to_boolean_symbol_validates_each_call(self):
+        """Test that the function is checked against the registry every time."""
+        symbol = DicomSymbol("PatientName", "equals", "John")
+        symbol.to_boolean_symbol()
+
+        registry = FunctionRegistry()
+        with pytest.raises(SymbolParseError):
+            symbol.to_boolean_symbol(registry)
+
+        registry.register("equals", EqualsFunction)
+        assert symbol.to_boolean_symbol(registry) is symbol.to_boolean_symbol()
+
     def test_to_boolean_symbol_unregistered_function(self):
         """Test conversion fails with unregistered function."""
         symbol = DicomSymbol("PatientName", "unknown_function", "test")
@@ -182,96 +288,213 @@ class TestDicomSymbolBooleanConversion:
 class TestDicomSymbolEvaluation:
     """Test DicomSymbol evaluation against DICOM datasets."""
 
-    def create_test_dataset(self):
-        """Create a test DICOM dataset."""
-        ds = pydicom.Dataset()
-        ds.PatientName = "John Doe"
-        ds.PatientID = "12345"
-        ds.StudyDescription = "MRI Brain"
-        ds.PatientAge = "025Y"
-        return ds
-
-    def test_evaluate_equals_function_match(self):
+    def test_evaluate_equals_function_match(self, sample_ds):
         """Test evaluation of equals function with matching value."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("PatientName", "equals", "John Doe")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(sample_ds)
         assert result is True
 
-    def test_evaluate_equals_function_no_match(self):
+    def test_evaluate_equals_function_no_match(self, sample_ds):
         """Test evaluation of equals function with non-matching value."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("PatientName", "equals", "Jane Doe")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(sample_ds)
         assert result is False
 
-    def test_evaluate_contains_function_match(self):
+    def test_evaluate_contains_function_match(self, sample_ds):
         """Test evaluation of contains function with matching substring."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("StudyDescription", "contains", "MRI")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(sample_ds)
         assert result is True
 
-    def test_evaluate_contains_function_no_match(self):
+    def test_evaluate_contains_function_no_match(self, sample_ds):
         """Test evaluation of contains function with non-matching substring."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("StudyDescription", "contains", "CT")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(sample_ds)
         assert result is False
 
-    def test_evaluate_exists_function_present(self):
+    def test_evaluate_exists_function_present(self, sample_ds):
         """Test evaluation of exists function with present attribute."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("PatientID", "exists")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(sample_ds)
         assert result is True
 
-    def test_evaluate_exists_function_missing(self):
+    def test_evaluate_exists_function_missing(self, sample_ds):
         """Test evaluation of exists function with missing attribute."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("NonExistentAttribute", "exists")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(sample_ds)
         assert result is False
 
-    def test_evaluate_missing_attribute_equals(self):
+    def test_evaluate_exists_function_empty_value(self):
+        """Test evaluation of exists function with an attribute without value."""
+        dataset = pydicom.Dataset()
+        dataset.add_new(0x00100020, "LO", None)
+        symbol = DicomSymbol("PatientID", "exists")
+
+        assert symbol.evaluate(dataset) is True
+
+    def test_evaluate_exists_function_custom_registry(self, sample_ds):
+        """Test that a custom exists function is not bypassed."""
+
+        class NeverExistsFunction(ExistsFunction):
+            def evaluate(self, dataset, attribute, argument=None):
+                return False
+
+        custom_registry = FunctionRegistry()
+        custom_registry.register("exists", NeverExistsFunction)
+        symbol = DicomSymbol("PatientID", "exists")
+
+        assert symbol.evaluate(sample_ds, custom_registry) is False
+
+    @pytest.mark.parametrize(
+        "symbol",
+        [
+            DicomSymbol("PatientName", "equals", " JOHN doe "),
+            DicomSymbol("PatientName", "equals", "null"),
+            DicomSymbol("PatientName", "contains", "doe"),
+            DicomSymbol("ImageType", "contains", "primary"),
+            DicomSymbol("ImageType", "equals", "['ORIGINAL', 'PRIMARY']"),
+            DicomSymbol("SliceThickness", "equals", "1.5"),
+        ],
+    )
+    def test_evaluate_by_tag_matches_function(self, symbol, sample_ds):
+        """Test that reading elements by tag gives the function's results."""
+        function = {"equals": EqualsFunction, "contains": ContainsFunction}[
+            symbol.function
+        ]
+        datasets = [pydicom.Dataset(sample_ds), pydicom.Dataset()]
+        datasets[0].ImageType = ["ORIGINAL", "PRIMARY"]
+        datasets[0].SliceThickness = "1.5"
+        datasets[1].add_new(0x00100010, "PN", None)
+
+        for dataset in datasets:
+            assert symbol.evaluate(dataset) is function().evaluate(
+                dataset, symbol.attribute, symbol.argument
+            )
+
+    def test_evaluate_builtin_subclass_gets_keyword(self):
+        """Test that subclasses of the built-in functions get the keyword."""
+
+        class UpperEqualsFunction(EqualsFunction):
+            def evaluate(self, dataset, attribute, argument=None):
+                value = str(getattr(dataset, attribute, ""))
+                return value.upper() == argument
+
+        custom_registry = FunctionRegistry()
+        custom_registry.register("equals", UpperEqualsFunction)
+        dataset = pydicom.Dataset()
+        dataset.PatientName = "John Doe"
+
+        symbol = DicomSymbol("PatientName", "equals", "JOHN DOE")
+        assert symbol.evaluate(dataset, custom_registry) is True
+
+    def test_evaluate_custom_function_gets_keyword(self, sample_ds):
+        """Test that functions other than the built-in ones get the keyword."""
+        attributes = []
+
+        class RecordingFunction(DicomFunction):
+            def evaluate(self, dataset, attribute, argument=None):
+                attributes.append(attribute)
+                return True
+
+        custom_registry = FunctionRegistry()
+        custom_registry.register("present", RecordingFunction)
+
+        assert DicomSymbol("PatientName", "present").evaluate(
+            sample_ds, custom_registry
+        )
+        assert attributes == ["PatientName"]
+
+    def test_evaluate_non_keyword_attribute(self, sample_ds):
+        """Test evaluation of attributes that are not DICOM keywords."""
+        symbol = DicomSymbol("Custom_Attribute", "equals", "value")
+
+        assert symbol._tag is None
+        assert symbol.evaluate(sample_ds) is False
+
+    def test_evaluate_missing_attribute_equals(self, sample_ds):
         """Test evaluation of equals function with missing attribute."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("NonExistentAttribute", "equals", "test")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(sample_ds)
         assert result is False
 
-    def test_evaluate_missing_attribute_contains(self):
+    def test_evaluate_missing_attribute_contains(self, sample_ds):
         """Test evaluation of contains function with missing attribute."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("NonExistentAttribute", "contains", "test")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(sample_ds)
         assert result is False
 
-    def test_evaluate_custom_registry(self):
+    def test_evaluate_custom_registry(self, sample_ds):
         """Test evaluation with custom function registry."""
-        dataset = self.create_test_dataset()
         custom_registry = FunctionRegistry()
         custom_registry.register("equals", EqualsFunction)
 
         symbol = DicomSymbol("PatientName", "equals", "John Doe")
-        result = symbol.evaluate(dataset, custom_registry)
+        result = symbol.evaluate(sample_ds, custom_registry)
         assert result is True
 
-    def test_evaluate_unregistered_function(self):
+    def test_evaluate_unregistered_function(self, sample_ds):
         """Test evaluation fails with unregistered function."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol("PatientName", "unknown_function", "test")
 
         with pytest.raises(EvaluationError) as exc_info:
-            symbol.evaluate(dataset)
+            symbol.evaluate(sample_ds)
+
+        assert "unknown_function" in str(exc_info.value)
+
+    def test_evaluate_many(self, sample_ds):
+        """Test evaluation against multiple datasets."""
+        other_dataset = pydicom.Dataset()
+        other_dataset.PatientName = "Jane Doe"
+        datasets = [sample_ds, other_dataset, pydicom.Dataset()]
+        symbol = DicomSymbol("PatientName", "contains", "john")
+
+        assert symbol.evaluate_many(datasets) == [True, False, False]
+        assert symbol.evaluate_many(datasets) == [
+            symbol.evaluate(dataset) for dataset in datasets
+        ]
+        assert symbol.evaluate_many(iter([])) == []
+
+    @pytest.mark.parametrize(
+        "symbol",
+        [
+            DicomSymbol("PatientName", "equals", " JOHN doe "),
+            DicomSymbol("PatientName", "equals", "none"),
+            DicomSymbol("StudyDescription", "contains", "brain"),
+            DicomSymbol("PatientID", "exists"),
+        ],
+    )
+    def test_evaluate_many_matches_evaluate(self, symbol, sample_ds):
+        """Test that column-wise evaluation agrees with evaluate."""
+        empty_dataset = pydicom.Dataset()
+        empty_dataset.add_new(0x00100010, "PN", None)
+        datasets = [sample_ds, empty_dataset, pydicom.Dataset()]
+
+        assert symbol.evaluate_many(datasets) == [
+            symbol.evaluate(dataset) for dataset in datasets
+        ]
+
+    def test_evaluate_many_custom_registry(self, sample_ds):
+        """Test evaluation against multiple datasets with a custom registry."""
+        custom_registry = FunctionRegistry()
+        custom_registry.register("matches", EqualsFunction)
+        symbol = DicomSymbol("PatientName", "matches", "John Doe")
+
+        assert symbol.evaluate_many([sample_ds], custom_registry) == [True]
+
+    def test_evaluate_many_unregistered_function(self, sample_ds):
+        """Test evaluation against multiple datasets fails as for evaluate."""
+        symbol = DicomSymbol("PatientName", "unknown_function", "test")
+
+        with pytest.raises(EvaluationError) as exc_info:
+            symbol.evaluate_many([sample_ds])
 
         assert "unknown_function" in str(exc_info.value)
 
@@ -321,41 +544,43 @@ class TestDicomSymbolStringRepresentation:
         )
         assert result == expected
 
+    def test_symbol_has_no_instance_dict(self):
+        """Test that symbols store their fields in slots and stay immutable."""
+        symbol = DicomSymbol("PatientID", "exists")
+
+        assert not hasattr(symbol, "__dict__")
+        with pytest.raises(AttributeError):
+            symbol.argument = "12345"
+
+    def test_pickle(self):
+        """Test that symbols survive a pickle round trip."""
+        symbol = DicomSymbol("PatientName", "equals", "John")
+
+        assert pickle.loads(pickle.dumps(symbol)) == symbol
+
 
 class TestDicomSymbolIntegration:
     """Integration tests combining parsing and evaluation."""
 
-    def create_test_dataset(self):
-        """Create a test DICOM dataset."""
-        ds = pydicom.Dataset()
-        ds.PatientName = "John Doe"
-        ds.PatientID = "12345"
-        ds.StudyDescription = "MRI Brain with contrast"
-        ds.PatientAge = "045Y"
-        return ds
-
-    def test_parse_and_evaluate_equals(self):
+    def test_parse_and_evaluate_equals(self, contrast_mri_ds):
         """Test parsing and evaluating equals function."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol.parse("PatientName.equals('John Doe')")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(contrast_mri_ds)
         assert result is True
 
-    def test_parse_and_evaluate_contains(self):
+    def test_parse_and_evaluate_contains(self, contrast_mri_ds):
         """Test parsing and evaluating contains function."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol.parse("StudyDescription.contains('MRI')")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(contrast_mri_ds)
         assert result is True
 
-    def test_parse_and_evaluate_exists(self):
+    def test_parse_and_evaluate_exists(self, contrast_mri_ds):
         """Test parsing and evaluating exists function."""
-        dataset = self.create_test_dataset()
         symbol = DicomSymbol.parse("PatientID.exists()")
 
-        result = symbol.evaluate(dataset)
+        result = symbol.evaluate(contrast_mri_ds)
         assert result is True
 
     def test_parse_and_convert_to_boolean(self):
@@ -371,10 +596,8 @@ class TestDicomSymbolIntegration:
 class TestDicomSymbolBooleanIntegration:
     """Test DicomSymbol integration with boolean.py library."""
 
-    def test_boolean_symbol_with_boolean_algebra(self):
+    def test_boolean_symbol_with_boolean_algebra(self, ba):
         """Test that DicomSymbol works with boolean.py BooleanAlgebra."""
-        from boolean import BooleanAlgebra
-
         # Create symbols
         symbol1 = DicomSymbol("PatientName", "equals", "John")
         symbol2 = DicomSymbol("PatientID", "exists")
@@ -383,9 +606,6 @@ class TestDicomSymbolBooleanIntegration:
         bool_symbol1 = symbol1.to_boolean_symbol()
         bool_symbol2 = symbol2.to_boolean_symbol()
 
-        # Create boolean algebra instance
-        ba = BooleanAlgebra()
-
         # Test that symbols can be used in boolean expressions
         expr_str = f"{bool_symbol1} & {bool_symbol2}"
         parsed_expr = ba.parse(expr_str)
@@ -394,10 +614,8 @@ class TestDicomSymbolBooleanIntegration:
         assert str(bool_symbol1) in str(parsed_expr)
         assert str(bool_symbol2) in str(parsed_expr)
 
-    def test_symbol_evaluation_with_boolean_substitution(self):
+    def test_symbol_evaluation_with_boolean_substitution(self, ba):
         """Test symbol evaluation using boolean.py substitution."""
-        from boolean import BooleanAlgebra
-
         # Create test dataset
         ds = pydicom.Dataset()
         ds.PatientName = "John Doe"
@@ -413,24 +631,21 @@ class TestDicomSymbolBooleanIntegration:
         bool_symbol2 = symbol2.to_boolean_symbol()
         bool_symbol3 = symbol3.to_boolean_symbol()
 
-        # Create boolean algebra instance
-        ba = BooleanAlgebra()
-
         # Test that symbols can be used in boolean expressions
         and_expr = ba.parse(f"{bool_symbol1} & {bool_symbol2}")
         or_expr = ba.parse(f"{bool_symbol1} | {bool_symbol3}")
 
         # Test that we can create substitution maps with evaluation results
         symbol_map = {
-            str(bool_symbol1): symbol1.evaluate(ds),  # True
-            str(bool_symbol2): symbol2.evaluate(ds),  # True
-            str(bool_symbol3): symbol3.evaluate(ds),  # False
+            bool_symbol1: symbol1.evaluate(ds),  # True
+            bool_symbol2: symbol2.evaluate(ds),  # True
+            bool_symbol3: symbol3.evaluate(ds),  # False
         }
 
         # Verify the evaluations are as expected
-        assert symbol_map[str(bool_symbol1)] is True
-        assert symbol_map[str(bool_symbol2)] is True
-        assert symbol_map[str(bool_symbol3)] is False
+        assert symbol_map[bool_symbol1] is True
+        assert symbol_map[bool_symbol2] is True
+        assert symbol_map[bool_symbol3] is False
 
         # Test that expressions can be created and parsed
         assert and_expr is not None
@@ -478,10 +693,16 @@ class TestDicomSymbolBooleanIntegration:
         # Should not contain hash for no-argument symbols
         assert symbol_name_no_arg == "PatientID__exists"
 
-    def test_complex_boolean_expression_evaluation(self):
-        """Test evaluation of complex boolean expressions."""
-        from boolean import BooleanAlgebra
+    def test_symbol_name_is_the_same_in_every_process(self):
+        """Test that the argument hash does not depend on hash randomization."""
+        symbol = DicomSymbol("PatientName", "equals", "John")
+
+        assert str(symbol.to_boolean_symbol()) == (
+            "PatientName__equals__00d346ad64ebf465"
+        )
 
+    def test_complex_boolean_expression_evaluation(self, ba):
+        """Test evaluation of complex boolean expressions."""
         # Create test dataset
         ds = pydicom.Dataset()
         ds.PatientName = "John Doe"
@@ -502,30 +723,29 @@ class TestDicomSymbolBooleanIntegration:
         bool_study_mri = study_mri.to_boolean_symbol()
         bool_study_ct = study_ct.to_boolean_symbol()
 
-        # Create boolean algebra instance
-        ba = BooleanAlgebra()
-
         # Test complex expression: (name_john & id_exists) | (study_mri & ~study_ct)
         complex_expr = ba.parse(
             f"({bool_name_john} & {bool_id_exists}) | "
             f"({bool_study_mri} & ~{bool_study_ct})"
         )
 
-        # Create substitution map
+        # Create substitution map, keyed by the boolean.py Symbols themselves
         symbol_map = {
-            str(bool_name_john): name_john.evaluate(ds),
-            str(bool_name_jane): name_jane.evaluate(ds),
-            str(bool_id_exists): id_exists.evaluate(ds),
-            str(bool_study_mri): study_mri.evaluate(ds),
-            str(bool_study_ct): study_ct.evaluate(ds),
+            bool_symbol: ba.TRUE if dicom_symbol.evaluate(ds) else ba.FALSE
+            for bool_symbol, dicom_symbol in [
+                (bool_name_john, name_john),
+                (bool_name_jane, name_jane),
+                (bool_id_exists, id_exists),
+                (bool_study_mri, study_mri),
+                (bool_study_ct, study_ct),
+            ]
         }
 
         # Evaluate the complex expression
-        result = complex_expr.subs(symbol_map)
+        result = complex_expr.subs(symbol_map, simplify=True)
 
         # Should be True because both parts of the OR are true:
         # (True & True) | (True & ~False) = True | True = True
-        # Check if the result evaluates to True by checking if it's not FALSE
-        # and contains the expected structure
-        assert result != ba.FALSE
-        assert "OR" in str(type(result).__name__) or result == ba.TRUE
+        # Compared by equality: every BooleanAlgebra created, e.g. by a
+        # Criterion, rebinds the TRUE used by boolean.py's simplification
+        assert result == ba.TRUE
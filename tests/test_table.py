@@ -0,0 +1,103 @@
+"""Unit tests for DatasetTable."""
+
+from types import SimpleNamespace
+
+import pytest
+from pydicom import DataElement, Dataset
+
+from dicomcriterion.functions import ContainsFunction, EqualsFunction, ExistsFunction
+from dicomcriterion.table import MISSING, DatasetTable
+
+
+def _make_dataset(**attributes):
+    dataset = Dataset()
+    for keyword, value in attributes.items():
+        setattr(dataset, keyword, value)
+    return dataset
+
+
+@pytest.fixture(scope="module")
+def datasets():
+    """Datasets with a mix of present, missing and empty attributes."""
+    return [
+        _make_dataset(
+            PatientName="John Doe", Modality="MR", StudyDescription="Brain MRI"
+        ),
+        _make_dataset(
+            PatientName="Jane Doe", Modality="CT", StudyDescription=" Chest CT "
+        ),
+        _make_dataset(PatientName="", Modality="MR"),
+        _make_dataset(StudyDescription="brain ct"),
+        _make_dataset(),
+    ]
+
+
+class TestDatasetTable:
+    """Test cases for DatasetTable."""
+
+    def test_len_and_datasets(self, datasets):
+        """Test that the table holds the datasets in order."""
+        table = DatasetTable(iter(datasets))
+
+        assert len(table) == 5
+        assert table.datasets == datasets
+
+    def test_column(self, datasets):
+        """Test that columns hold values, or MISSING for absent attributes."""
+        table = DatasetTable(datasets)
+
+        assert table.column("Modality") == ["MR", "CT", "MR", MISSING, MISSING]
+        assert table.column("Modality") is table.column("Modality")
+
+    def test_column_of_other_objects(self):
+        """Test that objects other than Datasets are read by keyword."""
+        table = DatasetTable([SimpleNamespace(Modality="MR", CustomKeyword=1)])
+
+        assert table.column("Modality") == ["MR"]
+        assert table.column("CustomKeyword") == [1]
+        assert table.column("PatientName") == [MISSING]
+
+    def test_column_of_data_elements(self):
+        """Test that data elements held by other objects are unwrapped."""
+        element = DataElement(0x00080060, "CS", "MR")
+        table = DatasetTable([SimpleNamespace(Modality=element)])
+
+        assert table.column("Modality") == ["MR"]
+
+    def test_select_rows(self, datasets):
+        """Test evaluating built-in functions on a column."""
+        table = DatasetTable(datasets)
+
+        assert table.select_rows(ExistsFunction(), "Modality", None, [0, 1, 3]) == [
+            0,
+            1,
+        ]
+        assert table.select_rows(EqualsFunction(), "Modality", "mr", range(5)) == [
+            0,
+            2,
+        ]
+        assert table.select_rows(
+            ContainsFunction(), "StudyDescription", "CT", range(5)
+        ) == [1, 3]
+
+    def test_select_rows_other_functions(self, datasets):
+        """Test that other functions are left to per-dataset evaluation."""
+
+        class CustomEqualsFunction(EqualsFunction):
+            pass
+
+        table = DatasetTable(datasets)
+
+        assert table.select_rows(CustomEqualsFunction(), "Modality", "MR", [0]) is None
+        assert table.select_rows(EqualsFunction(), "Modality", None, [0]) is None
+
+    def test_text_column(self, datasets):
+        """Test that text columns hold lower-cased, optionally stripped values."""
+        table = DatasetTable(datasets)
+
+        descriptions = table.text_column("StudyDescription")
+        stripped = table.text_column("StudyDescription", strip=True)
+
+        assert descriptions[:2] == ["brain mri", " chest ct "]
+        assert stripped[:2] == ["brain mri", "chest ct"]
+        assert descriptions[2] is MISSING